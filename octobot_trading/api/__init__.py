@@ -95,6 +95,7 @@ from octobot_trading.api.exchange import (
     is_sponsoring,
     is_valid_account,
     get_historical_ohlcv,
+    get_concurrent_historical_ohlcv,
     get_bot_id,
     get_supported_exchange_types,
     get_trading_pairs,
@@ -109,6 +110,7 @@ from octobot_trading.api.exchange import (
     get_currently_handled_pair_with_time_frame,
     get_required_historical_candles_count,
     is_overloaded,
+    get_rest_requests_budget_metrics,
     store_history_in_run_storage,
     cancel_ccxt_throttle_task,
     stop_exchange,
@@ -252,6 +254,7 @@ __all__ = [
     "is_sponsoring",
     "is_valid_account",
     "get_historical_ohlcv",
+    "get_concurrent_historical_ohlcv",
     "get_bot_id",
     "get_supported_exchange_types",
     "get_trading_pairs",
@@ -266,6 +269,7 @@ __all__ = [
     "get_currently_handled_pair_with_time_frame",
     "get_required_historical_candles_count",
     "is_overloaded",
+    "get_rest_requests_budget_metrics",
     "store_history_in_run_storage",
     "cancel_ccxt_throttle_task",
     "stop_exchange",
@@ -247,6 +247,10 @@ def is_overloaded(exchange_manager) -> bool:
     return exchange_manager.get_is_overloaded()
 
 
+def get_rest_requests_budget_metrics(exchange_manager) -> dict:
+    return exchange_manager.rest_requests_scheduler.get_metrics()
+
+
 async def is_compatible_account(exchange_name: str, exchange_config: dict, tentacles_setup_config, is_sandboxed: bool) \
         -> (bool, bool, str):
     return await exchanges.is_compatible_account(exchange_name, exchange_config, tentacles_setup_config, is_sandboxed)
@@ -268,6 +272,11 @@ def get_historical_ohlcv(exchange_manager, symbol, time_frame, start_time, end_t
     return exchanges.get_historical_ohlcv(exchange_manager, symbol, time_frame, start_time, end_time)
 
 
+def get_concurrent_historical_ohlcv(exchange_manager, symbol, time_frame, start_time, end_time, **kwargs):
+    return exchanges.get_concurrent_historical_ohlcv(exchange_manager, symbol, time_frame, start_time, end_time,
+                                                     **kwargs)
+
+
 def get_bot_id(exchange_manager):
     return exchange_manager.bot_id
 
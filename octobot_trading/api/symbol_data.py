@@ -13,6 +13,8 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import numpy as np
+
 import octobot_commons.enums
 
 import octobot_trading.enums
@@ -32,10 +34,18 @@ def get_symbol_historical_candles(symbol_data, time_frame, limit=-1) -> object:
     return get_symbol_candles_manager(symbol_data, time_frame).get_symbol_prices(limit)
 
 
-async def create_preloaded_candles_manager(preloaded_candles):
-    candles_manager = exchange_data.PreloadedCandlesManager()
+async def create_preloaded_candles_manager(preloaded_candles, compact=False, mmap_path=None):
+    """
+    :param preloaded_candles: candles list or (candles count, >= CANDLE_VALUES_COUNT) candles array
+    :param compact: when True, store candles values as float32
+    :param mmap_path: when set, store candles values in this memory mapped file
+    """
+    candles_manager = exchange_data.PreloadedCandlesManager(compact=compact, mmap_path=mmap_path)
     await candles_manager.initialize()
-    candles_manager.replace_all_candles(preloaded_candles)
+    if isinstance(preloaded_candles, np.ndarray):
+        candles_manager.replace_all_candles_array(preloaded_candles)
+    else:
+        candles_manager.replace_all_candles(preloaded_candles)
     return candles_manager
 
 
@@ -65,28 +75,28 @@ def get_symbol_candles_count(symbol_data, time_frame) -> int:
     return get_symbol_candles_manager(symbol_data, time_frame).get_symbol_candles_count()
 
 
-def get_symbol_close_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return exchange_data.get_symbol_close_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_close_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, copy=True):
+    return exchange_data.get_symbol_close_candles(symbol_data, time_frame, limit, include_in_construction, copy=copy)
 
 
-def get_symbol_open_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return exchange_data.get_symbol_open_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_open_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, copy=True):
+    return exchange_data.get_symbol_open_candles(symbol_data, time_frame, limit, include_in_construction, copy=copy)
 
 
-def get_symbol_high_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return exchange_data.get_symbol_high_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_high_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, copy=True):
+    return exchange_data.get_symbol_high_candles(symbol_data, time_frame, limit, include_in_construction, copy=copy)
 
 
-def get_symbol_low_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return exchange_data.get_symbol_low_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_low_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, copy=True):
+    return exchange_data.get_symbol_low_candles(symbol_data, time_frame, limit, include_in_construction, copy=copy)
 
 
-def get_symbol_volume_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return exchange_data.get_symbol_volume_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_volume_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, copy=True):
+    return exchange_data.get_symbol_volume_candles(symbol_data, time_frame, limit, include_in_construction, copy=copy)
 
 
-def get_symbol_time_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return exchange_data.get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_time_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, copy=True):
+    return exchange_data.get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construction, copy=copy)
 
 
 def create_new_candles_manager(candles=None, max_candles_count=None) -> exchange_data.CandlesManager:
@@ -58,6 +58,67 @@ ENABLE_EXCHANGE_HTTP_PROXY_FROM_ENV = os_util.parse_boolean_environment_var(
 ENABLE_CCXT_VERBOSE = os_util.parse_boolean_environment_var("ENABLE_CCXT_VERBOSE", "False")
 ENABLE_CCXT_RATE_LIMIT = os_util.parse_boolean_environment_var("ENABLE_CCXT_RATE_LIMIT", "True")
 THROTTLED_WS_UPDATES = float(os.getenv("THROTTLED_WS_UPDATES", "0.1"))  # avoid spamming CPU
+# min seconds between two websocket pushes of the same symbol on these channels, 0 to push every update
+ORDER_BOOK_CONFLATION_INTERVAL = float(os.getenv("ORDER_BOOK_CONFLATION_INTERVAL", "0"))
+TICKER_CONFLATION_INTERVAL = float(os.getenv("TICKER_CONFLATION_INTERVAL", "0"))
+# when enabled, only the shortest time frame candles are fetched on REST exchanges after initialization, larger time
+# frames candles are built from it
+ENABLE_LOCAL_OHLCV_AGGREGATION = os_util.parse_boolean_environment_var("ENABLE_LOCAL_OHLCV_AGGREGATION", "False")
+# when enabled, candles history is stored locally and only the missing candles are fetched on the next start
+ENABLE_CANDLES_CACHE = os_util.parse_boolean_environment_var("ENABLE_CANDLES_CACHE", "False")
+CANDLES_CACHE_PATH = os.getenv(
+    "CANDLES_CACHE_PATH", os.path.join(commons_constants.USER_FOLDER, commons_constants.CACHE_FOLDER, "candles")
+)
+CANDLES_CACHE_MAX_CANDLES_COUNT = int(os.getenv("CANDLES_CACHE_MAX_CANDLES_COUNT", "10000"))
+CANDLES_CACHE_MAX_SIZE = int(os.getenv("CANDLES_CACHE_MAX_SIZE", str(512 * 1024 * 1024)))   # bytes
+# when True, OHLCVUpdater fetches long candles histories with get_concurrent_historical_ohlcv
+ENABLE_CONCURRENT_HISTORICAL_OHLCV_FETCH = \
+    os_util.parse_boolean_environment_var("ENABLE_CONCURRENT_HISTORICAL_OHLCV_FETCH", "False")
+# historical candles pages fetched at the same time in get_concurrent_historical_ohlcv
+HISTORICAL_OHLCV_MAX_CONCURRENT_REQUESTS = int(os.getenv("HISTORICAL_OHLCV_MAX_CONCURRENT_REQUESTS", "5"))
+HISTORICAL_OHLCV_PAGE_SIZE = int(os.getenv("HISTORICAL_OHLCV_PAGE_SIZE", "500"))
+# min seconds between two historical candles requests (exchanges rate limits are also applied by ccxt)
+HISTORICAL_OHLCV_MIN_REQUEST_INTERVAL = float(os.getenv("HISTORICAL_OHLCV_MIN_REQUEST_INTERVAL", "0"))
+# candles read at once from backtesting data, shared between every traded pair and time frame
+BACKTESTING_OHLCV_PREFETCH_MAX_CANDLES_COUNT = int(os.getenv("BACKTESTING_OHLCV_PREFETCH_MAX_CANDLES_COUNT", "1000000"))
+BACKTESTING_OHLCV_PREFETCH_MIN_CANDLES_COUNT = int(os.getenv("BACKTESTING_OHLCV_PREFETCH_MIN_CANDLES_COUNT", "100"))
+# when enabled, order books are stored as price: size levels instead of price: orders lists
+ENABLE_L2_ORDER_BOOK = os_util.parse_boolean_environment_var("ENABLE_L2_ORDER_BOOK", "False")
+# when enabled, simulated orders are filled by price events callbacks instead of one waiting task per order
+ENABLE_PRICE_EVENTS_CALLBACKS = os_util.parse_boolean_environment_var("ENABLE_PRICE_EVENTS_CALLBACKS", "False")
+# recent trades kept (and used to ignore already received trades) per symbol
+MAX_RECENT_TRADES_COUNT = int(os.getenv("MAX_RECENT_TRADES_COUNT", "100"))
+# estimator used to compute mark prices from recent trades, from MarkPriceEstimators
+RECENT_TRADES_MARK_PRICE_ESTIMATOR = os.getenv("RECENT_TRADES_MARK_PRICE_ESTIMATOR",
+                                               enums.MarkPriceEstimators.MEAN.value)
+# seconds after which a trade weights half as much in time decayed mark price estimators, 0 to disable decay
+RECENT_TRADES_MARK_PRICE_HALF_LIFE = float(os.getenv("RECENT_TRADES_MARK_PRICE_HALF_LIFE", "60"))
+# when enabled, tickers of every pair are fetched at once using fetch_tickers instead of pair by pair
+ENABLE_BULK_TICKERS_FETCH = os_util.parse_boolean_environment_var("ENABLE_BULK_TICKERS_FETCH", "False")
+# max symbols per fetch_tickers request, 0 to fetch every pair in one request
+BULK_TICKERS_FETCH_CHUNK_SIZE = int(os.getenv("BULK_TICKERS_FETCH_CHUNK_SIZE", "0"))
+# comma separated bar_type:threshold bars to aggregate from recent trades, ex: "tick:1000,volume:50,time:60"
+TRADES_BARS = os.getenv("TRADES_BARS", "")
+# when True, klines are computed from recent trades instead of being fetched from exchange
+ENABLE_KLINES_FROM_TRADES = os_util.parse_boolean_environment_var("ENABLE_KLINES_FROM_TRADES", "False")
+# when True, REST polling updaters refresh times are allocated from the exchange requests budget
+ENABLE_REST_REQUESTS_SCHEDULER = os_util.parse_boolean_environment_var("ENABLE_REST_REQUESTS_SCHEDULER", "False")
+# part of the exchange rate limit allocated to polling updaters, the rest is kept for orders and other requests
+REST_REQUESTS_BUDGET_RATIO = float(os.getenv("REST_REQUESTS_BUDGET_RATIO", "0.5"))
+# max refresh time multiplier applied to feeds that do not fit in the requests budget
+REST_REQUESTS_MAX_DEGRADATION = float(os.getenv("REST_REQUESTS_MAX_DEGRADATION", "10"))
+# when True, ticker, mark price and funding updaters only poll consumed pairs and adapt each pair refresh time
+ENABLE_ADAPTIVE_PAIRS_POLLING = os_util.parse_boolean_environment_var("ENABLE_ADAPTIVE_PAIRS_POLLING", "False")
+# min and max ratios applied to the updaters refresh time for volatile or active and idle pairs
+ADAPTIVE_POLLING_MIN_REFRESH_RATIO = float(os.getenv("ADAPTIVE_POLLING_MIN_REFRESH_RATIO", "0.25"))
+ADAPTIVE_POLLING_MAX_REFRESH_RATIO = float(os.getenv("ADAPTIVE_POLLING_MAX_REFRESH_RATIO", "4"))
+# price change ratio per refresh time of pairs refreshed at the updaters refresh time
+ADAPTIVE_POLLING_VOLATILITY_THRESHOLD = float(os.getenv("ADAPTIVE_POLLING_VOLATILITY_THRESHOLD", "0.002"))
+# max concurrent per pair requests of the mark price and funding updaters, 1 to fetch pairs one by one
+PAIRS_FETCH_CONCURRENCY = int(os.getenv("PAIRS_FETCH_CONCURRENCY", "1"))
+# when True, mark price and funding updaters fetch every pair in a single request when supported by the exchange
+ENABLE_BULK_FUNDING_AND_MARK_PRICES_FETCH = \
+    os_util.parse_boolean_environment_var("ENABLE_BULK_FUNDING_AND_MARK_PRICES_FETCH", "False")
 
 # Decimal default values (decimals are immutable, can be stored as constant)
 ZERO = decimal.Decimal(0)
@@ -102,6 +163,7 @@ KLINE_CHANNEL = "Kline"
 OHLCV_CHANNEL = "OHLCV"
 MARK_PRICE_CHANNEL = "MarkPrice"
 FUNDING_CHANNEL = "Funding"
+BARS_CHANNEL = "Bars"
 
 # Exchange personal data
 TRADES_CHANNEL = "Trades"
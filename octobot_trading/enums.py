@@ -387,6 +387,20 @@ class MarkPriceSources(enum.Enum):
     TICKER_CLOSE_PRICE = "ticker_close_price"
 
 
+class MarkPriceEstimators(enum.Enum):
+    LAST = "last"   # last trade price
+    MEAN = "mean"   # mean price of the last recent trades update
+    VWAP = "vwap"   # time decayed volume weighted mean price
+    EMA = "ema"     # time decayed mean price
+
+
+class BarTypes(enum.Enum):
+    TIME = "time"           # bars of threshold seconds
+    TICK = "tick"           # bars of threshold trades
+    VOLUME = "volume"       # bars of threshold traded amount
+    NOTIONAL = "notional"   # bars of threshold traded price * amount
+
+
 class WebsocketFeeds(enum.Enum):
     L1_BOOK = 'l1_book'
     L2_BOOK = 'l2_book'
@@ -422,6 +436,12 @@ class RestExchangePairsRefreshMaxThresholds(enum.Enum):
     SLOW = 20
 
 
+class RestRequestsPriorities(enum.Enum):
+    HIGH = 3    # account data: orders, positions, portfolio
+    MEDIUM = 2  # prices: tickers, mark prices
+    LOW = 1     # market data: order books, recent trades, klines
+
+
 class MarginType(enum.Enum):
     CROSS = "cross"
     ISOLATED = "isolated"
@@ -24,6 +24,7 @@ cdef class ExchangeChannel(channels.Channel):
 
     cdef int filter_send_counter
     cdef bint should_send_filter
+    cdef public double conflation_interval
 
     cpdef object get_filtered_consumers(self, str cryptocurrency=*, str symbol=*)
 
@@ -34,7 +35,12 @@ cdef class ExchangeChannelConsumer(consumers.Consumer):
     pass
 
 cdef class ExchangeChannelProducer(producers.Producer):
+    cdef dict _conflated_pushes
+    cdef dict _conflation_tasks
+    cdef dict _last_conflated_push_times
+
     cpdef void trigger_single_update(self)
+    cdef bint _are_consumers_idle(self)
 
 cdef class ExchangeChannelInternalConsumer(consumers.InternalConsumer):
     pass
@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import asyncio
+import time
 
 import octobot_commons.tree as commons_tree
 
@@ -54,9 +55,75 @@ class ExchangeChannelProducer(producers.Producer):
         super().__init__(channel)
         self.logger = logging.get_logger(f"{self.__class__.__name__}[{channel.exchange_manager.exchange_name}]")
 
+        # conflation key: latest (args, kwargs) to push
+        self._conflated_pushes = {}
+        # conflation key: delayed push task
+        self._conflation_tasks = {}
+        # conflation key: last push time
+        self._last_conflated_push_times = {}
+
     async def fetch_and_push(self):
         self.logger.error("self.fetch_and_push() is not implemented")
 
+    async def conflated_push(self, *args, **kwargs):
+        """
+        Calls self.push(*args, **kwargs) when the channel has no conflation_interval. Otherwise, data are pushed
+        right away when consumers are idle or when nothing has been pushed for this conflation key during the last
+        conflation_interval seconds. Else only the latest data of this conflation key is pushed at the end of
+        the interval.
+        """
+        if not self.channel.conflation_interval:
+            return await self.push(*args, **kwargs)
+        key = self.get_conflation_key(*args, **kwargs)
+        self._conflated_pushes[key] = (args, kwargs)
+        if key in self._conflation_tasks:
+            # the scheduled push will use the latest data
+            return
+        delay = self._last_conflated_push_times.get(key, 0) + self.channel.conflation_interval - time.time()
+        if delay <= 0 or self._are_consumers_idle():
+            await self._push_conflated_data(key)
+        else:
+            self._conflation_tasks[key] = asyncio.create_task(self._delayed_conflated_push(key, delay))
+
+    def get_conflation_key(self, *args, **kwargs):
+        """
+        :return: the identifier of the data to conflate, override when the first push argument is not the symbol
+        """
+        return args[0] if args else kwargs.get(ExchangeChannel.SYMBOL_KEY)
+
+    async def _delayed_conflated_push(self, key, delay):
+        try:
+            await asyncio.sleep(delay)
+            # remove task before pushing to schedule a new push if data are received in the meantime
+            self._conflation_tasks.pop(key, None)
+            await self._push_conflated_data(key)
+        finally:
+            # a newer task might have been scheduled for this key while pushing
+            if self._conflation_tasks.get(key) is asyncio.current_task():
+                self._conflation_tasks.pop(key)
+
+    async def _push_conflated_data(self, key):
+        conflated_push = self._conflated_pushes.pop(key, None)
+        if conflated_push is None:
+            # already pushed
+            return
+        args, kwargs = conflated_push
+        self._last_conflated_push_times[key] = time.time()
+        await self.push(*args, **kwargs)
+
+    def _are_consumers_idle(self):
+        for consumer in self.channel.get_consumers():
+            if not consumer.queue.empty():
+                return False
+        return True
+
+    async def stop(self):
+        for task in list(self._conflation_tasks.values()):
+            task.cancel()
+        self._conflation_tasks.clear()
+        self._conflated_pushes.clear()
+        await super().stop()
+
     def trigger_single_update(self):
         asyncio.create_task(self.fetch_and_push())
 
@@ -77,6 +144,9 @@ class ExchangeChannel(channels.Channel):
     CRYPTOCURRENCY_KEY = "cryptocurrency"
     SYMBOL_KEY = "symbol"
     DEFAULT_PRIORITY_LEVEL = channel_enums.ChannelConsumerPriorityLevels.HIGH.value
+    # when set, conflated pushes are sent at most every CONFLATION_INTERVAL seconds per symbol (unless consumers are
+    # idle), only the latest data are sent
+    CONFLATION_INTERVAL = 0
 
     def __init__(self, exchange_manager):
         super().__init__()
@@ -86,6 +156,7 @@ class ExchangeChannel(channels.Channel):
 
         self.filter_send_counter = 0
         self.should_send_filter = False
+        self.conflation_interval = self.CONFLATION_INTERVAL
 
     async def new_consumer(self,
                            callback: object = None,
@@ -31,6 +31,14 @@ from octobot_trading.exchange_data.kline cimport (
     KlineManager,
     KlineUpdater,
 )
+from octobot_trading.exchange_data cimport bars
+from octobot_trading.exchange_data.bars cimport (
+    BarsCandlesManager,
+    BarsAggregator,
+    BarsUpdater,
+    BarsProducer,
+    BarsChannel,
+)
 
 from octobot_trading.exchange_data cimport ohlcv
 from octobot_trading.exchange_data.ohlcv cimport (
@@ -101,6 +109,11 @@ from octobot_trading.exchange_data cimport exchange_symbol_data
 from octobot_trading.exchange_data.exchange_symbol_data cimport (
     ExchangeSymbolData,
 )
+from octobot_trading.exchange_data cimport pairs_polling_scheduler
+from octobot_trading.exchange_data.pairs_polling_scheduler cimport (
+    PairsPollingScheduler,
+    is_pair_consumed,
+)
 from octobot_trading.exchange_data cimport exchange_symbols_data
 from octobot_trading.exchange_data.exchange_symbols_data cimport (
     ExchangeSymbolsData,
@@ -117,6 +130,11 @@ __all__ = [
     "KlineChannel",
     "KlineManager",
     "KlineUpdater",
+    "BarsCandlesManager",
+    "BarsAggregator",
+    "BarsUpdater",
+    "BarsProducer",
+    "BarsChannel",
     "CandlesManager",
     "PreloadedCandlesManager",
     "get_symbol_close_candles",
@@ -160,4 +178,6 @@ __all__ = [
     "FutureContract",
     "ExchangeSymbolsData",
     "ExchangeSymbolData",
+    "PairsPollingScheduler",
+    "is_pair_consumed",
 ]
@@ -30,10 +30,20 @@ from octobot_trading.exchange_data.kline import (
     KlineManager,
     KlineUpdater,
 )
+from octobot_trading.exchange_data import bars
+from octobot_trading.exchange_data.bars import (
+    BarsCandlesManager,
+    BarsAggregator,
+    BarsUpdater,
+    BarsProducer,
+    BarsChannel,
+)
 from octobot_trading.exchange_data import ohlcv
 from octobot_trading.exchange_data.ohlcv import (
     CandlesManager,
+    CandlesView,
     PreloadedCandlesManager,
+    CandlesCache,
     get_symbol_close_candles,
     get_symbol_open_candles,
     get_symbol_high_candles,
@@ -96,6 +106,11 @@ from octobot_trading.exchange_data import exchange_symbol_data
 from octobot_trading.exchange_data.exchange_symbol_data import (
     ExchangeSymbolData,
 )
+from octobot_trading.exchange_data import pairs_polling_scheduler
+from octobot_trading.exchange_data.pairs_polling_scheduler import (
+    PairsPollingScheduler,
+    is_pair_consumed,
+)
 from octobot_trading.exchange_data import exchange_symbols_data
 from octobot_trading.exchange_data.exchange_symbols_data import (
     ExchangeSymbolsData,
@@ -105,7 +120,7 @@ import octobot_trading.constants as trading_constants
 import octobot_backtesting.enums as backtesting_enums
 
 UNAUTHENTICATED_UPDATER_PRODUCERS = [OHLCVUpdater, OrderBookUpdater, RecentTradeUpdater, TickerUpdater,
-                                     KlineUpdater, MarkPriceUpdater, FundingUpdater]
+                                     KlineUpdater, MarkPriceUpdater, FundingUpdater, BarsUpdater]
 UNAUTHENTICATED_UPDATER_SIMULATOR_PRODUCERS = {
         trading_constants.OHLCV_CHANNEL: OHLCVUpdaterSimulator,
         trading_constants.ORDER_BOOK_CHANNEL: OrderBookUpdaterSimulator,
@@ -149,8 +164,15 @@ __all__ = [
     "KlineChannel",
     "KlineManager",
     "KlineUpdater",
+    "BarsCandlesManager",
+    "BarsAggregator",
+    "BarsUpdater",
+    "BarsProducer",
+    "BarsChannel",
     "CandlesManager",
+    "CandlesView",
     "PreloadedCandlesManager",
+    "CandlesCache",
     "get_symbol_close_candles",
     "get_symbol_open_candles",
     "get_symbol_high_candles",
@@ -195,6 +217,8 @@ __all__ = [
     "update_contracts_from_positions",
     "ExchangeSymbolsData",
     "ExchangeSymbolData",
+    "PairsPollingScheduler",
+    "is_pair_consumed",
     "UNAUTHENTICATED_UPDATER_PRODUCERS",
     "UNAUTHENTICATED_UPDATER_SIMULATOR_PRODUCERS",
     "SIMULATOR_PRODUCERS_TO_POSSIBLE_DATA_TYPE",
@@ -0,0 +1,36 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+from octobot_trading.exchange_data.bars import channel
+from octobot_trading.exchange_data.bars import bars_aggregator
+
+from octobot_trading.exchange_data.bars.bars_aggregator import (
+    BarsCandlesManager,
+    BarsAggregator,
+)
+from octobot_trading.exchange_data.bars.channel import (
+    BarsUpdater,
+    BarsProducer,
+    BarsChannel,
+)
+
+__all__ = [
+    "BarsCandlesManager",
+    "BarsAggregator",
+    "BarsUpdater",
+    "BarsProducer",
+    "BarsChannel",
+]
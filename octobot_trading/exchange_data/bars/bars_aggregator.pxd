@@ -0,0 +1,41 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+cimport octobot_trading.exchange_data.ohlcv.candles_manager as candles_manager
+
+
+cdef class BarsCandlesManager(candles_manager.CandlesManager):
+    pass
+
+
+cdef class BarsAggregator:
+    cdef public object bar_type
+    cdef public double threshold
+    cdef public BarsCandlesManager bars_manager
+
+    cdef public list current_bar
+    cdef public int current_bar_trades_count
+    cdef public double current_bar_notional
+    cdef double _current_bar_end_time
+
+    cpdef list add_trades(self, list trades)
+    cpdef object add_trade(self, double price, double amount, double timestamp)
+    cpdef list get_current_bar(self)
+    cpdef list get_bars(self, object limit=*)
+
+    cdef void _open_bar(self, double price, double timestamp)
+    cdef double _get_current_bar_progress(self)
+    cdef list _complete_current_bar(self)
+    cdef void _reset_current_bar(self)
@@ -0,0 +1,133 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.enums as enums
+import octobot_trading.exchange_data.ohlcv.candles_manager as candles_manager
+
+
+class BarsCandlesManager(candles_manager.CandlesManager):
+    """
+    CandlesManager storing completed bars: tick, volume and notional bars can open on the same trade timestamp,
+    bars are therefore not identified by their open time
+    """
+
+    def _should_add_new_candle(self, new_open_time):
+        return True
+
+
+class BarsAggregator:
+    """
+    Streaming trades to bars aggregator: each trade is added in O(1) to the current bar which is completed once its
+    bar_type threshold is reached. Completed bars are stored in a BarsCandlesManager.
+    Bars are [time, open, high, low, close, volume] lists in PriceIndexes order.
+    """
+
+    def __init__(self, bar_type, threshold, max_bars_count=None):
+        self.bar_type = enums.BarTypes(bar_type)
+        self.threshold = float(threshold)
+        if self.threshold <= 0:
+            raise ValueError(f"Invalid {self.bar_type.value} bars threshold: {threshold}")
+        self.bars_manager = BarsCandlesManager(max_candles_count=max_bars_count)
+
+        # in progress bar, empty until the next trade
+        self.current_bar = []
+        self.current_bar_trades_count = 0
+        self.current_bar_notional = 0
+        self._current_bar_end_time = 0
+
+    async def initialize(self):
+        await self.bars_manager.initialize()
+        self._reset_current_bar()
+
+    def add_trades(self, trades):
+        """
+        Add recent trades to the current bar
+        :param trades: the recent trades, sorted by time
+        :return: the list of bars completed by these trades
+        """
+        completed_bars = []
+        for trade in trades:
+            completed_bar = self.add_trade(
+                float(trade[enums.ExchangeConstantsOrderColumns.PRICE.value]),
+                float(trade.get(enums.ExchangeConstantsOrderColumns.AMOUNT.value) or 0),
+                float(trade.get(enums.ExchangeConstantsOrderColumns.TIMESTAMP.value) or 0)
+            )
+            if completed_bar is not None:
+                completed_bars.append(completed_bar)
+        return completed_bars
+
+    def add_trade(self, price, amount, timestamp):
+        """
+        Add a trade to the current bar. Trades are never split between bars: the trade reaching a threshold is
+        the last trade of its bar. Time bars are aligned on threshold seconds, no bar is created for periods
+        without trades.
+        :return: the completed bar if any
+        """
+        completed_bar = None
+        if self.bar_type is enums.BarTypes.TIME and self.current_bar and timestamp >= self._current_bar_end_time:
+            completed_bar = self._complete_current_bar()
+        if not self.current_bar:
+            self._open_bar(price, timestamp)
+        bar = self.current_bar
+        if price > bar[commons_enums.PriceIndexes.IND_PRICE_HIGH.value]:
+            bar[commons_enums.PriceIndexes.IND_PRICE_HIGH.value] = price
+        elif price < bar[commons_enums.PriceIndexes.IND_PRICE_LOW.value]:
+            bar[commons_enums.PriceIndexes.IND_PRICE_LOW.value] = price
+        bar[commons_enums.PriceIndexes.IND_PRICE_CLOSE.value] = price
+        bar[commons_enums.PriceIndexes.IND_PRICE_VOL.value] += amount
+        self.current_bar_trades_count += 1
+        self.current_bar_notional += price * amount
+        if self.bar_type is not enums.BarTypes.TIME and self._get_current_bar_progress() >= self.threshold:
+            completed_bar = self._complete_current_bar()
+        return completed_bar
+
+    def get_current_bar(self):
+        """
+        :return: a copy of the in progress bar, an empty list when no trade has been added since the last bar
+        """
+        return list(self.current_bar)
+
+    def get_bars(self, limit=-1):
+        """
+        :return: the completed bars [oldest bar -> newest bar]
+        """
+        return self.bars_manager.get_candles(limit)
+
+    def _open_bar(self, price, timestamp):
+        if self.bar_type is enums.BarTypes.TIME:
+            timestamp -= timestamp % self.threshold
+            self._current_bar_end_time = timestamp + self.threshold
+        self.current_bar = [timestamp, price, price, price, price, 0.0]
+
+    def _get_current_bar_progress(self):
+        if self.bar_type is enums.BarTypes.TICK:
+            return self.current_bar_trades_count
+        if self.bar_type is enums.BarTypes.VOLUME:
+            return self.current_bar[commons_enums.PriceIndexes.IND_PRICE_VOL.value]
+        return self.current_bar_notional
+
+    def _complete_current_bar(self):
+        completed_bar = self.current_bar
+        self.bars_manager.add_new_candle(completed_bar)
+        self._reset_current_bar()
+        return completed_bar
+
+    def _reset_current_bar(self):
+        self.current_bar = []
+        self.current_bar_trades_count = 0
+        self.current_bar_notional = 0
+        self._current_bar_end_time = 0
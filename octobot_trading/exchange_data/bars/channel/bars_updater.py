@@ -0,0 +1,112 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.exchange_channel as exchanges_channel
+import octobot_trading.constants as constants
+import octobot_trading.exchange_data.bars.channel.bars as bars_channel
+import octobot_trading.enums as enums
+
+
+class BarsUpdater(bars_channel.BarsProducer):
+    """
+    Aggregates RECENT_TRADES_CHANNEL trades into the TRADES_BARS bars and pushes completed bars.
+    When ENABLE_KLINES_FROM_TRADES is set, also pushes traded time frames klines computed from trades.
+    """
+    CHANNEL_NAME = constants.BARS_CHANNEL
+
+    def __init__(self, channel):
+        super().__init__(channel)
+        self.recent_trades_consumer = None
+        # (bar type, threshold) of the bars to push on this channel
+        self.pushed_bars = _parse_bars(constants.TRADES_BARS)
+        # (bar type, threshold): time frame of the klines to push on KLINE_CHANNEL
+        self.klines_bars = {}
+
+    async def start(self):
+        if constants.ENABLE_KLINES_FROM_TRADES:
+            self.klines_bars = {
+                (enums.BarTypes.TIME,
+                 commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS): time_frame
+                for time_frame in self.channel.exchange_manager.exchange_config.traded_time_frames
+            }
+        if self.channel.is_paused:
+            await self.pause()
+        elif self.pushed_bars or self.klines_bars:
+            await self.subscribe()
+        else:
+            self.logger.debug(f"{self.__class__.__name__} wont be used, stopping...")
+
+    async def subscribe(self):
+        self.recent_trades_consumer = await exchanges_channel.get_chan(constants.RECENT_TRADES_CHANNEL,
+                                                                       self.channel.exchange_manager.id) \
+            .new_consumer(self.handle_recent_trades_update)
+
+    async def unsubscribe(self):
+        if self.recent_trades_consumer:
+            await exchanges_channel.get_chan(constants.RECENT_TRADES_CHANNEL, self.channel.exchange_manager.id) \
+                .remove_consumer(self.recent_trades_consumer)
+            self.recent_trades_consumer = None
+
+    async def resume(self) -> None:
+        await super().resume()
+        if not self.is_running:
+            await self.run()
+
+    async def pause(self) -> None:
+        await super().pause()
+        await self.unsubscribe()
+
+    async def handle_recent_trades_update(self, exchange: str, exchange_id: str,
+                                          cryptocurrency: str, symbol: str, recent_trades: list):
+        """
+        Recent trades channel consumer callback
+        """
+        try:
+            symbol_data = self.channel.exchange_manager.get_symbol_data(symbol)
+            # each (bar type, threshold) bars are aggregated once even when both pushed and used as klines
+            for bar_key in set(self.pushed_bars).union(self.klines_bars):
+                bar_type, threshold = bar_key
+                completed_bars = await symbol_data.handle_bars_update(bar_type, threshold, recent_trades)
+                if completed_bars and bar_key in self.pushed_bars:
+                    await self.push(symbol, bar_type, threshold, completed_bars)
+                if bar_key in self.klines_bars:
+                    # push the final state of the klines completed by these trades before the new current kline
+                    for completed_bar in completed_bars:
+                        await self._push_kline(symbol, self.klines_bars[bar_key], completed_bar)
+                    await self._push_kline(symbol, self.klines_bars[bar_key],
+                                           symbol_data.symbol_bars[bar_key].get_current_bar())
+        except Exception as e:
+            self.logger.exception(e, True, f"Fail to handle recent trades update : {e}")
+
+    async def _push_kline(self, symbol, time_frame, kline):
+        if kline:
+            await exchanges_channel.get_chan(constants.KLINE_CHANNEL, self.channel.exchange_manager.id) \
+                .get_internal_producer().push(time_frame, symbol, kline)
+
+
+def _parse_bars(bars_config):
+    """
+    :param bars_config: comma separated bar_type:threshold values, ex: "tick:1000,volume:50,time:60"
+    :return: the list of (BarTypes, threshold) bars
+    """
+    bars = []
+    for bar_config in bars_config.split(","):
+        if bar_config.strip():
+            bar_type, threshold = bar_config.split(":")
+            bars.append((enums.BarTypes(bar_type.strip()), float(threshold)))
+    return bars
@@ -29,6 +29,7 @@ cdef class ExchangeSymbolData:
 
     cdef public dict symbol_candles
     cdef public dict symbol_klines
+    cdef public dict symbol_bars
 
     cdef public price_events_manager.PriceEventsManager price_events_manager
     cdef public order_book_manager.OrderBookManager order_book_manager
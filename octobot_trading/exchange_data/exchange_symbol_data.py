@@ -23,6 +23,7 @@ import octobot_trading.exchange_data.ohlcv.candles_manager as candles_manager
 import octobot_trading.exchange_data.ticker.ticker_manager as ticker_manager
 import octobot_trading.exchange_data.order_book.order_book_manager as order_book_manager
 import octobot_trading.exchange_data.kline.kline_manager as kline_manager
+import octobot_trading.exchange_data.bars.bars_aggregator as bars_aggregator
 import octobot_trading.exchange_data.prices.prices_manager as prices_manager
 import octobot_trading.exchange_data.prices.price_events_manager as price_events_manager
 import octobot_trading.exchange_data.recent_trades.recent_trades_manager as recent_trades_manager
@@ -47,6 +48,8 @@ class ExchangeSymbolData:
 
         self.symbol_candles = {}
         self.symbol_klines = {}
+        # (bar type, threshold): BarsAggregator
+        self.symbol_bars = {}
 
         self.logger = logging.get_logger(f"{self.__class__.__name__} - {self.symbol}")
 
@@ -153,6 +156,22 @@ class ExchangeSymbolData:
 
         symbol_klines.kline_update(kline)
 
+    async def handle_bars_update(self, bar_type, threshold, recent_trades):
+        """
+        Add recent trades to the bar_type and threshold bars
+        :return: the bars completed by these trades
+        """
+        try:
+            symbol_bars = self.symbol_bars[(bar_type, threshold)]
+        except KeyError:
+            symbol_bars = bars_aggregator.BarsAggregator(
+                bar_type, threshold,
+                max_bars_count=self.exchange_manager.exchange_config.required_historical_candles_count
+            )
+            await symbol_bars.initialize()
+            self.symbol_bars[(bar_type, threshold)] = symbol_bars
+        return symbol_bars.add_trades(recent_trades)
+
     async def handle_funding_update(self, funding_rate, predicted_funding_rate, next_funding_time, timestamp):
         if self.funding_manager:
             trigger_init_event = not self.funding_manager.initialized()
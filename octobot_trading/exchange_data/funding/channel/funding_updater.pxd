@@ -20,6 +20,8 @@ cimport octobot_commons.async_job as async_job
 
 cdef class FundingUpdater(funding_channel.FundingProducer):
     cdef async_job.AsyncJob fetch_funding_job
+    cdef public bint is_bulk_fetching
+    cdef public int fetch_concurrency
 
     cdef bint _should_run(self)
     cdef int _get_time_until_next_funding(self, int next_funding_time)
@@ -22,6 +22,7 @@ import octobot_commons.async_job as async_job
 import octobot_commons.constants as common_constants
 
 import octobot_trading.exchange_data.funding.channel.funding as funding_channel
+import octobot_trading.exchange_data.pairs_polling_scheduler as pairs_polling_scheduler
 import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.errors as errors
@@ -51,6 +52,9 @@ class FundingUpdater(funding_channel.FundingProducer):
         self.fetch_funding_job = async_job.AsyncJob(self._funding_fetch_and_push,
                                                     execution_interval_delay=self.FUNDING_REFRESH_TIME,
                                                     min_execution_delay=self.FUNDING_REFRESH_TIME_MIN)
+        # when True, every pair funding is fetched in a single request, disabled when unsupported by the exchange
+        self.is_bulk_fetching = constants.ENABLE_BULK_FUNDING_AND_MARK_PRICES_FETCH
+        self.fetch_concurrency = constants.PAIRS_FETCH_CONCURRENCY
 
     async def initialize(self) -> None:
         """
@@ -75,22 +79,70 @@ class FundingUpdater(funding_channel.FundingProducer):
         await self.fetch_funding_job.run()
 
     async def _funding_fetch_and_push(self) -> list:
+        pairs = [
+            pair
+            for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs
+            # when adaptive polling is enabled, fetched funding of non-consumed pairs would not be used
+            if not constants.ENABLE_ADAPTIVE_PAIRS_POLLING
+            or pairs_polling_scheduler.is_pair_consumed([self.channel], pair)
+        ]
+        fetched_fundings = await self._fetch_funding_rates(pairs)
+        # publish the whole cycle at once
         next_funding_times = []
-        for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
-            next_funding_time_candidate = await self.fetch_symbol_funding_rate(pair)
+        for pair, funding in zip(pairs, fetched_fundings):
+            next_funding_time_candidate = await self._push_fetched_funding(pair, funding)
             if next_funding_time_candidate is not None:
                 next_funding_times.append(next_funding_time_candidate)
         return next_funding_times
 
+    async def _fetch_funding_rates(self, pairs: list) -> list:
+        """
+        Fetch funding rates from exchange, in a single request when possible
+        :param pairs: the funding symbols to fetch
+        :return: the funding of each pair in pairs order, None when unavailable
+        """
+        if self.is_bulk_fetching and pairs:
+            try:
+                fundings: dict = await self.channel.exchange_manager.exchange.get_funding_rates(pairs)
+                return [fundings.get(pair) for pair in pairs]
+            except (errors.NotSupported, NotImplementedError):
+                self.logger.warning(f"get_funding_rates is not supported by "
+                                    f"{self.channel.exchange_manager.exchange.name}, fetching funding rates by pair")
+                self.is_bulk_fetching = False
+            except Exception as e:
+                self.logger.exception(e, True, f"Fail to update funding rates on "
+                                               f"{self.channel.exchange_manager.exchange.name} : {e}")
+                return [None for _ in pairs]
+        return await self.channel.exchange_manager.rest_requests_scheduler.gather_requests(
+            self._fetch_funding_rate, pairs, concurrency=self.fetch_concurrency
+        )
+
     async def fetch_symbol_funding_rate(self, symbol: str) -> typing.Optional[int]:
         """
         Fetch funding rate from exchange
         :param symbol: the funding symbol to fetch
         :return: the next funding time
         """
+        return await self._push_fetched_funding(symbol, await self._fetch_funding_rate(symbol))
+
+    async def _fetch_funding_rate(self, symbol: str) -> typing.Optional[dict]:
         try:
-            funding: dict = await self.channel.exchange_manager.exchange.get_funding_rate(symbol)
+            return await self.channel.exchange_manager.exchange.get_funding_rate(symbol)
+        except (errors.NotSupported, NotImplementedError) as ne:
+            self.logger.exception(ne, True, f"get_funding_rate is not supported by "
+                                            f"{self.channel.exchange_manager.exchange.name} : {ne}")
+        except Exception as e:
+            self.logger.exception(e, True, f"Fail to update funding rate on {self.channel.exchange_manager.exchange.name} : {e}")
+        return None
 
+    async def _push_fetched_funding(self, symbol: str, funding: typing.Optional[dict]) -> typing.Optional[int]:
+        """
+        Push a fetched funding to channel
+        :param symbol: the funding symbol
+        :param funding: the fetched funding
+        :return: the next funding time
+        """
+        try:
             if funding:
                 next_funding_time = funding[enums.ExchangeConstantsFundingColumns.NEXT_FUNDING_TIME.value]
                 predicted_funding_rate = \
@@ -102,9 +154,6 @@ class FundingUpdater(funding_channel.FundingProducer):
                     next_funding_time=next_funding_time,
                     last_funding_time=funding[enums.ExchangeConstantsFundingColumns.LAST_FUNDING_TIME.value])
                 return next_funding_time
-        except (errors.NotSupported, NotImplementedError) as ne:
-            self.logger.exception(ne, True, f"get_funding_rate is not supported by "
-                                            f"{self.channel.exchange_manager.exchange.name} : {ne}")
         except Exception as e:
             self.logger.exception(e, True, f"Fail to update funding rate on {self.channel.exchange_manager.exchange.name} : {e}")
         return None
@@ -45,6 +45,8 @@ class KlineUpdater(kline_channel.KlineProducer):
             self.refresh_time = 22
         if self.channel.is_paused:
             await self.pause()
+        elif constants.ENABLE_KLINES_FROM_TRADES:
+            self.logger.debug(f"{self.__class__.__name__} wont be used: klines are computed from recent trades")
         else:
             self.tasks = [
                 asyncio.create_task(self.time_frame_watcher(time_frame))
@@ -54,11 +56,18 @@ class KlineUpdater(kline_channel.KlineProducer):
         """
         Manage timeframe OHLCV data refreshing for all pairs
         """
+        rest_requests_scheduler = self.channel.exchange_manager.rest_requests_scheduler
+        feed_name = f"{self.CHANNEL_NAME}{time_frame.value}"
+        rest_requests_scheduler.register_feed(
+            feed_name, self.refresh_time, enums.RestRequestsPriorities.LOW,
+            requests_count=len(self.channel.exchange_manager.exchange_config.traded_symbol_pairs)
+        )
         while not self.should_stop and not self.channel.is_paused:
             try:
                 started_time = time.time()
                 quick_sleep = False
                 for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
+                    await rest_requests_scheduler.reserve_requests()
                     candle: list = await self.channel.exchange_manager.exchange.get_kline_price(pair, time_frame)
                     try:
                         candle = candle[0]
@@ -70,7 +79,8 @@ class KlineUpdater(kline_channel.KlineProducer):
                         self.logger.debug(f"Not enough data to compute kline data in {time_frame} for {pair}. "
                                           f"Kline will be updated with the next refresh.")
 
-                sleep_time = max((self.QUICK_KLINE_REFRESH_TIME if quick_sleep else self.refresh_time)
+                sleep_time = max((self.QUICK_KLINE_REFRESH_TIME if quick_sleep
+                                  else rest_requests_scheduler.get_refresh_time(feed_name))
                                  - (time.time() - started_time), 0)
                 await asyncio.sleep(sleep_time)
             except errors.FailedRequest as e:
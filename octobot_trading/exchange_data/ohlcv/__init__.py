@@ -16,14 +16,19 @@
 
 from octobot_trading.exchange_data.ohlcv import candles_manager
 from octobot_trading.exchange_data.ohlcv import candles_adapter
+from octobot_trading.exchange_data.ohlcv import candles_cache
 from octobot_trading.exchange_data.ohlcv import channel
 
 from octobot_trading.exchange_data.ohlcv.candles_manager import (
     CandlesManager,
+    CandlesView,
 )
 from octobot_trading.exchange_data.ohlcv.preloaded_candles_manager import (
     PreloadedCandlesManager,
 )
+from octobot_trading.exchange_data.ohlcv.candles_cache import (
+    CandlesCache,
+)
 from octobot_trading.exchange_data.ohlcv.candles_adapter import (
     get_symbol_close_candles,
     get_symbol_open_candles,
@@ -44,7 +49,9 @@ from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater import (
 
 __all__ = [
     "CandlesManager",
+    "CandlesView",
     "PreloadedCandlesManager",
+    "CandlesCache",
     "get_symbol_close_candles",
     "get_symbol_open_candles",
     "get_symbol_high_candles",
@@ -19,7 +19,7 @@ import octobot_commons.data_util as data_util
 import octobot_commons.enums as enums
 
 
-def get_symbol_close_candles(symbol_data, time_frame, limit, include_in_construction):
+def get_symbol_close_candles(symbol_data, time_frame, limit, include_in_construction, copy=True):
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
@@ -27,10 +27,10 @@ def get_symbol_close_candles(symbol_data, time_frame, limit, include_in_construc
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_CLOSE.value)
-    return symbol_data.symbol_candles[tf].get_symbol_close_candles(limit)
+    return symbol_data.symbol_candles[tf].get_symbol_close_candles(limit, copy=copy)
 
 
-def get_symbol_open_candles(symbol_data, time_frame, limit, include_in_construction):
+def get_symbol_open_candles(symbol_data, time_frame, limit, include_in_construction, copy=True):
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
@@ -38,10 +38,10 @@ def get_symbol_open_candles(symbol_data, time_frame, limit, include_in_construct
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_OPEN.value)
-    return symbol_data.symbol_candles[tf].get_symbol_open_candles(limit)
+    return symbol_data.symbol_candles[tf].get_symbol_open_candles(limit, copy=copy)
 
 
-def get_symbol_high_candles(symbol_data, time_frame, limit, include_in_construction):
+def get_symbol_high_candles(symbol_data, time_frame, limit, include_in_construction, copy=True):
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
@@ -49,10 +49,10 @@ def get_symbol_high_candles(symbol_data, time_frame, limit, include_in_construct
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_HIGH.value)
-    return symbol_data.symbol_candles[tf].get_symbol_high_candles(limit)
+    return symbol_data.symbol_candles[tf].get_symbol_high_candles(limit, copy=copy)
 
 
-def get_symbol_low_candles(symbol_data, time_frame, limit, include_in_construction):
+def get_symbol_low_candles(symbol_data, time_frame, limit, include_in_construction, copy=True):
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
@@ -60,10 +60,10 @@ def get_symbol_low_candles(symbol_data, time_frame, limit, include_in_constructi
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_LOW.value)
-    return symbol_data.symbol_candles[tf].get_symbol_low_candles(limit)
+    return symbol_data.symbol_candles[tf].get_symbol_low_candles(limit, copy=copy)
 
 
-def get_symbol_volume_candles(symbol_data, time_frame, limit, include_in_construction):
+def get_symbol_volume_candles(symbol_data, time_frame, limit, include_in_construction, copy=True):
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
@@ -71,10 +71,10 @@ def get_symbol_volume_candles(symbol_data, time_frame, limit, include_in_constru
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_VOL.value)
-    return symbol_data.symbol_candles[tf].get_symbol_volume_candles(limit)
+    return symbol_data.symbol_candles[tf].get_symbol_volume_candles(limit, copy=copy)
 
 
-def get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construction):
+def get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construction, copy=True):
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
@@ -82,7 +82,7 @@ def get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construct
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_TIME.value)
-    return symbol_data.symbol_candles[tf].get_symbol_time_candles(limit)
+    return symbol_data.symbol_candles[tf].get_symbol_time_candles(limit, copy=copy)
 
 
 def get_candle_as_list(candle_arrays_dict: dict, candle_index: int) -> list:
@@ -0,0 +1,137 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import threading
+
+import numpy as np
+
+import octobot_commons.enums as enums
+import octobot_commons.logging as logging
+import octobot_commons.symbols as symbols
+
+import octobot_trading.constants as constants
+import octobot_trading.exchange_data.ohlcv.candles_manager as candles_manager
+
+
+class CandlesCache:
+    """
+    Local candles history: stores one (candles count, CANDLE_VALUES_COUNT) float64 .npy file per exchange, symbol
+    and time frame. Files are read as memory mapped arrays. The cache is written when initializing candles only.
+    Methods can be called concurrently from executor threads.
+    """
+    FILE_EXTENSION = ".npy"
+
+    def __init__(self, cache_path=constants.CANDLES_CACHE_PATH,
+                 max_candles_count=constants.CANDLES_CACHE_MAX_CANDLES_COUNT,
+                 max_size=constants.CANDLES_CACHE_MAX_SIZE):
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.cache_path = cache_path
+        # max candles count per exchange, symbol and time frame
+        self.max_candles_count = max_candles_count
+        # max size of the whole cache in bytes
+        self.max_size = max_size
+        # file path: (update time, size) of cache files, loaded on first update
+        self._files_info = None
+        # guards _files_info and cache size enforcement
+        self._files_info_lock = threading.Lock()
+
+    def get_candles(self, exchange_name, symbol, time_frame):
+        """
+        :return: the cached candles as a read-only (candles count, CANDLE_VALUES_COUNT) array, sorted by time. The
+        array is empty when there is no cached candle or when the cache file is invalid
+        """
+        file_path = self._get_file_path(exchange_name, symbol, time_frame)
+        try:
+            candles = np.load(file_path, mmap_mode="r")
+        except FileNotFoundError:
+            return self._get_empty_candles()
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring invalid candles cache file {file_path}: {e}")
+            return self._get_empty_candles()
+        if candles.ndim != 2 or candles.shape[1] != candles_manager.CANDLE_VALUES_COUNT \
+           or np.any(np.diff(candles[:, enums.PriceIndexes.IND_PRICE_TIME.value]) <= 0):
+            self.logger.warning(f"Ignoring invalid candles cache file {file_path}")
+            return self._get_empty_candles()
+        return candles
+
+    def set_candles(self, exchange_name, symbol, time_frame, candles):
+        """
+        Replace the cached candles of this exchange, symbol and time frame by the max_candles_count last given
+        candles. candles must be completed candles sorted by time.
+        """
+        file_path = self._get_file_path(exchange_name, symbol, time_frame)
+        candles = np.array(candles[-self.max_candles_count:], dtype=np.float64)
+        if candles.ndim != 2 or len(candles) == 0:
+            return
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # write in a temporary file first to never leave a partially written cache file
+        temp_file_path = f"{file_path}.tmp{self.FILE_EXTENSION}"
+        np.save(temp_file_path, candles[:, :candles_manager.CANDLE_VALUES_COUNT])
+        os.replace(temp_file_path, file_path)
+        with self._files_info_lock:
+            self._get_files_info()[file_path] = (os.path.getmtime(file_path), os.path.getsize(file_path))
+            self._ensure_max_size(file_path)
+
+    def clear(self, exchange_name, symbol, time_frame):
+        file_path = self._get_file_path(exchange_name, symbol, time_frame)
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+        with self._files_info_lock:
+            if self._files_info is not None:
+                self._files_info.pop(file_path, None)
+
+    def _get_files_info(self):
+        # should be called with _files_info_lock acquired
+        if self._files_info is None:
+            self._files_info = {}
+            for root, _, files in os.walk(self.cache_path):
+                for file_name in files:
+                    if file_name.endswith(self.FILE_EXTENSION):
+                        file_path = os.path.join(root, file_name)
+                        self._files_info[file_path] = (os.path.getmtime(file_path), os.path.getsize(file_path))
+        return self._files_info
+
+    def _ensure_max_size(self, kept_file_path):
+        # should be called with _files_info_lock acquired
+        files_info = self._get_files_info()
+        total_size = sum(file_size for _, file_size in files_info.values())
+        if total_size <= self.max_size:
+            return
+        # remove the least recently updated files until the cache fits in max_size
+        for file_path, (_, file_size) in sorted(files_info.items(), key=lambda file_info: file_info[1][0]):
+            if file_path == kept_file_path:
+                continue
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+            files_info.pop(file_path, None)
+            total_size -= file_size
+            if total_size <= self.max_size:
+                return
+
+    def _get_file_path(self, exchange_name, symbol, time_frame):
+        return os.path.join(
+            self.cache_path,
+            exchange_name,
+            f"{symbols.merge_symbol(symbol)}_{enums.TimeFrames(time_frame).value}{self.FILE_EXTENSION}"
+        )
+
+    @staticmethod
+    def _get_empty_candles():
+        return np.full((0, candles_manager.CANDLE_VALUES_COUNT), fill_value=np.nan, dtype=np.float64)
@@ -22,6 +22,7 @@ cdef class CandlesManager(util.Initializable):
     cdef object logger
 
     cdef public bint candles_initialized
+    cdef public unsigned long long candles_version
     cdef public int max_candles_count
 
     cdef public object close_candles
@@ -40,14 +41,21 @@ cdef class CandlesManager(util.Initializable):
 
     cdef public bint reached_max
 
-    cpdef np.ndarray get_symbol_close_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_open_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_high_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_low_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_time_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_volume_candles(self, int limit=*)
+    cdef object _candles
+    cdef object _candles_buffer
+    cdef int _buffer_start
+    cdef dict _slot_by_time
 
-    cpdef dict get_symbol_prices(self, object limit=*)
+    cpdef np.ndarray get_symbol_close_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_open_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_high_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_low_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_time_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_volume_candles(self, int limit=*, bint copy=*)
+
+    cpdef dict get_symbol_prices(self, object limit=*, bint copy=*)
+    cpdef unsigned long long get_candles_version(self)
+    cpdef np.ndarray get_candles_array(self, int limit=*, bint copy=*)
     cpdef list get_candles(self, object limit=*)
     cpdef void upsert_candle(self, list updated_candle)
     cpdef void add_old_and_new_candles(self, list candles_data)
@@ -56,9 +64,14 @@ cdef class CandlesManager(util.Initializable):
 
     # private
     cdef void _set_all_candles(self, object new_candles_data)
+    cdef void _set_candle(self, int index, list candle_data)
+    cdef int _get_time_index(self, object candle_time)
     cdef void _change_current_candle(self)
+    cdef void _update_candles_views(self)
+    cdef void _update_values_views(self)
     cdef bint _should_add_new_candle(self, new_open_time)
     cdef void _check_max_candles(self)
     cdef object _inc_candle_index(self)
     cdef void _reset_candles(self)
-    cdef np.ndarray _extract_limited_data(self, np.ndarray data, int limit=*, int max_limit=*)
+    cdef np.ndarray _extract_limited_data(self, np.ndarray data, int limit=*, int max_limit=*, bint copy=*)
+    cdef np.ndarray _get_read_only_view(self, np.ndarray data)
@@ -15,12 +15,25 @@
 #  License along with this library.
 import numpy as np
 
-import octobot_commons.data_util as data_util
 import octobot_commons.enums as enums
 import octobot_commons.logging as logging
 
 import octobot_trading.util as util
 
+# candles values are stored in PriceIndexes order
+CANDLE_VALUES_COUNT = len(enums.PriceIndexes)
+
+
+class CandlesView(np.ndarray):
+    """
+    Read-only candles data returned by CandlesManager getters when copy=False.
+    version is the CandlesManager.candles_version at the time the view was created: the view content is
+    only valid until the candles manager version changes (new candle, candle update or candles reset).
+    """
+
+    def __array_finalize__(self, obj):
+        self.version = getattr(obj, "version", None)
+
 
 class CandlesManager(util.Initializable):
     MAX_CANDLES_COUNT = 1000
@@ -30,6 +43,8 @@ class CandlesManager(util.Initializable):
         self.logger = logging.get_logger(self.__class__.__name__)
 
         self.candles_initialized = False
+        # incremented on each candles update: identifies a candles state for CandlesView users
+        self.candles_version = 0
         self.max_candles_count = max_candles_count \
             if max_candles_count and max_candles_count > self.__class__.MAX_CANDLES_COUNT \
             else self.__class__.MAX_CANDLES_COUNT
@@ -48,6 +63,17 @@ class CandlesManager(util.Initializable):
         self.time_candles = None
         self.volume_candles = None
 
+        # (max_candles_count, CANDLE_VALUES_COUNT) [oldest candle -> newest candle] candles block,
+        # close_candles and other values arrays are strided column views on this block
+        self._candles = None
+        # candles are stored in a ring buffer of 2 * max_candles_count candles where each candle is written twice
+        # (at slot and slot + max_candles_count): the max_candles_count last candles are then always available as a
+        # contiguous ordered slice and adding a candle when reached_max is O(1) (no array shift)
+        self._candles_buffer = None
+        self._buffer_start = 0
+        # candle time -> ring buffer slot, used to find candles without scanning time_candles
+        self._slot_by_time = {}
+
         self.reached_max = False
         self._reset_candles()
 
@@ -57,6 +83,7 @@ class CandlesManager(util.Initializable):
     def _reset_candles(self):
         self.candles_initialized = False
         self.reached_max = False
+        self.candles_version += 1
 
         self.close_candles_index = 0
         self.open_candles_index = 0
@@ -65,62 +92,58 @@ class CandlesManager(util.Initializable):
         self.time_candles_index = 0
         self.volume_candles_index = 0
 
-        self.close_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.open_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.high_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.low_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.time_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.volume_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+        self._candles_buffer = np.full((2 * self.max_candles_count, CANDLE_VALUES_COUNT),
+                                       fill_value=np.nan, dtype=np.float64)
+        self._buffer_start = 0
+        self._slot_by_time = {}
+        self._update_candles_views()
 
     # getters
     def get_symbol_candles_count(self):
         return self.time_candles_index
 
-    def get_symbol_close_candles(self, limit=-1):
-        return self._extract_limited_data(self.close_candles, limit, max_limit=self.close_candles_index)
+    def get_symbol_close_candles(self, limit=-1, copy=True):
+        return self._extract_limited_data(self.close_candles, limit, max_limit=self.close_candles_index, copy=copy)
 
-    def get_symbol_open_candles(self, limit=-1):
-        return self._extract_limited_data(self.open_candles, limit, max_limit=self.open_candles_index)
+    def get_symbol_open_candles(self, limit=-1, copy=True):
+        return self._extract_limited_data(self.open_candles, limit, max_limit=self.open_candles_index, copy=copy)
 
-    def get_symbol_high_candles(self, limit=-1):
-        return self._extract_limited_data(self.high_candles, limit, max_limit=self.high_candles_index)
+    def get_symbol_high_candles(self, limit=-1, copy=True):
+        return self._extract_limited_data(self.high_candles, limit, max_limit=self.high_candles_index, copy=copy)
 
-    def get_symbol_low_candles(self, limit=-1):
-        return self._extract_limited_data(self.low_candles, limit, max_limit=self.low_candles_index)
+    def get_symbol_low_candles(self, limit=-1, copy=True):
+        return self._extract_limited_data(self.low_candles, limit, max_limit=self.low_candles_index, copy=copy)
 
-    def get_symbol_time_candles(self, limit=-1):
-        return self._extract_limited_data(self.time_candles, limit, max_limit=self.time_candles_index)
+    def get_symbol_time_candles(self, limit=-1, copy=True):
+        return self._extract_limited_data(self.time_candles, limit, max_limit=self.time_candles_index, copy=copy)
 
-    def get_symbol_volume_candles(self, limit=-1):
-        return self._extract_limited_data(self.volume_candles, limit, max_limit=self.volume_candles_index)
+    def get_symbol_volume_candles(self, limit=-1, copy=True):
+        return self._extract_limited_data(self.volume_candles, limit, max_limit=self.volume_candles_index, copy=copy)
 
-    def get_symbol_prices(self, limit=-1):
+    def get_symbol_prices(self, limit=-1, copy=True):
         return {
-            enums.PriceIndexes.IND_PRICE_CLOSE.value: self.get_symbol_close_candles(limit),
-            enums.PriceIndexes.IND_PRICE_OPEN.value: self.get_symbol_open_candles(limit),
-            enums.PriceIndexes.IND_PRICE_HIGH.value: self.get_symbol_high_candles(limit),
-            enums.PriceIndexes.IND_PRICE_LOW.value: self.get_symbol_low_candles(limit),
-            enums.PriceIndexes.IND_PRICE_VOL.value: self.get_symbol_volume_candles(limit),
-            enums.PriceIndexes.IND_PRICE_TIME.value: self.get_symbol_time_candles(limit)
+            enums.PriceIndexes.IND_PRICE_CLOSE.value: self.get_symbol_close_candles(limit, copy=copy),
+            enums.PriceIndexes.IND_PRICE_OPEN.value: self.get_symbol_open_candles(limit, copy=copy),
+            enums.PriceIndexes.IND_PRICE_HIGH.value: self.get_symbol_high_candles(limit, copy=copy),
+            enums.PriceIndexes.IND_PRICE_LOW.value: self.get_symbol_low_candles(limit, copy=copy),
+            enums.PriceIndexes.IND_PRICE_VOL.value: self.get_symbol_volume_candles(limit, copy=copy),
+            enums.PriceIndexes.IND_PRICE_TIME.value: self.get_symbol_time_candles(limit, copy=copy)
         }
 
+    def get_candles_version(self):
+        return self.candles_version
+
+    def get_candles_array(self, limit=-1, copy=True):
+        """
+        :param limit: the number of candles to return, -1 for all candles
+        :param copy: when False, return a read-only CandlesView on the stored candles
+        :return: the (candles count, CANDLE_VALUES_COUNT) [oldest candle -> newest candle] candles array
+        where candles values are in PriceIndexes order
+        """
+        return self._extract_limited_data(self._candles, limit, max_limit=self.time_candles_index, copy=copy)
+
     def get_candles(self, limit=-1):
-        candles_size = self.close_candles_index if limit == -1 else limit
-        candles = [[]] * candles_size
-        iter_range = range(self.close_candles_index) if limit == -1 \
-            else range(self.close_candles_index-limit, self.close_candles_index)
-        candles_index = 0
-        for index in iter_range:
-            candle = [0] * len(enums.PriceIndexes)
-            candle[enums.PriceIndexes.IND_PRICE_CLOSE.value] = self.close_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_OPEN.value] = self.open_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_HIGH.value] = self.high_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_LOW.value] = self.low_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_VOL.value] = self.volume_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_TIME.value] = self.time_candles[index]
-            candles[candles_index] = candle
-            candles_index += 1
-        return candles
+        return self.get_candles_array(limit, copy=False).tolist()
 
     def replace_all_candles(self, all_candles_data):
         self._reset_candles()
@@ -128,15 +151,10 @@ class CandlesManager(util.Initializable):
         self.candles_initialized = True
 
     def upsert_candle(self, updated_candle):
-        updated_candle_time = updated_candle[enums.PriceIndexes.IND_PRICE_TIME.value]
-        for index, candle_time in enumerate(self.time_candles):
-            if candle_time == updated_candle_time:
-                self.close_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_CLOSE.value]
-                self.open_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_OPEN.value]
-                self.high_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_HIGH.value]
-                self.low_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_LOW.value]
-                self.volume_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_VOL.value]
-                return
+        index = self._get_time_index(updated_candle[enums.PriceIndexes.IND_PRICE_TIME.value])
+        if index != -1:
+            self._set_candle(index, updated_candle)
+            return
 
         # candle not in db, add it
         self.add_new_candle(updated_candle)
@@ -149,7 +167,7 @@ class CandlesManager(util.Initializable):
         """
         # check old candles
         for old_candle in candles_data[:-1]:
-            if old_candle[enums.PriceIndexes.IND_PRICE_TIME.value] not in self.time_candles:
+            if self._should_add_new_candle(old_candle[enums.PriceIndexes.IND_PRICE_TIME.value]):
                 self.add_new_candle(old_candle)
 
         try:
@@ -165,12 +183,7 @@ class CandlesManager(util.Initializable):
         if self._should_add_new_candle(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value]):
             try:
                 self._check_max_candles()
-                self.close_candles[self.close_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_CLOSE.value]
-                self.open_candles[self.open_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_OPEN.value]
-                self.high_candles[self.high_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_HIGH.value]
-                self.low_candles[self.low_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_LOW.value]
-                self.time_candles[self.time_candles_index] = float(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value])
-                self.volume_candles[self.volume_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_VOL.value]
+                self._set_candle(self.close_candles_index, new_candle_data)
                 self._inc_candle_index()
             except IndexError as e:
                 self.logger.error(f"Fail to add new candle {new_candle_data} : {e}")
@@ -183,16 +196,47 @@ class CandlesManager(util.Initializable):
         else:
             self.add_new_candle(new_candles_data)
 
+    def _set_candle(self, index, candle_data):
+        # write the candle in both of its ring buffer slots to keep the candles views contiguous
+        slot = (self._buffer_start + index) % self.max_candles_count
+        candle_time = float(candle_data[enums.PriceIndexes.IND_PRICE_TIME.value])
+        previous_time = self._candles_buffer[slot, enums.PriceIndexes.IND_PRICE_TIME.value]
+        if previous_time != candle_time:
+            # slot is reused: forget the overwritten candle
+            self._slot_by_time.pop(previous_time, None)
+        self._slot_by_time[candle_time] = slot
+        self.candles_version += 1
+        candle_values = candle_data[:CANDLE_VALUES_COUNT]
+        self._candles_buffer[slot] = candle_values
+        self._candles_buffer[slot + self.max_candles_count] = candle_values
+
+    def _get_time_index(self, candle_time):
+        # return the index of the candle at candle_time in time_candles or -1 if missing
+        try:
+            return (self._slot_by_time[candle_time] - self._buffer_start) % self.max_candles_count
+        except KeyError:
+            return -1
+
     def _change_current_candle(self):
-        self.close_candles = data_util.shift_value_array(self.close_candles, -1, np.nan, np.float64)
-        self.open_candles = data_util.shift_value_array(self.open_candles, -1, np.nan, np.float64)
-        self.high_candles = data_util.shift_value_array(self.high_candles, -1, np.nan, np.float64)
-        self.low_candles = data_util.shift_value_array(self.low_candles, -1, np.nan, np.float64)
-        self.volume_candles = data_util.shift_value_array(self.volume_candles, -1, np.nan, np.float64)
-        self.time_candles = data_util.shift_value_array(self.time_candles, -1, np.nan, np.float64)
+        # drop the oldest candle by moving the ring buffer start: its slot will be used by the next candle
+        self._buffer_start = (self._buffer_start + 1) % self.max_candles_count
+        self._update_candles_views()
+
+    def _update_candles_views(self):
+        # [oldest candle -> newest candle] view on the ring buffer, nothing is copied
+        self._candles = self._candles_buffer[self._buffer_start:self._buffer_start + self.max_candles_count]
+        self._update_values_views()
+
+    def _update_values_views(self):
+        self.close_candles = self._candles[:, enums.PriceIndexes.IND_PRICE_CLOSE.value]
+        self.open_candles = self._candles[:, enums.PriceIndexes.IND_PRICE_OPEN.value]
+        self.high_candles = self._candles[:, enums.PriceIndexes.IND_PRICE_HIGH.value]
+        self.low_candles = self._candles[:, enums.PriceIndexes.IND_PRICE_LOW.value]
+        self.time_candles = self._candles[:, enums.PriceIndexes.IND_PRICE_TIME.value]
+        self.volume_candles = self._candles[:, enums.PriceIndexes.IND_PRICE_VOL.value]
 
     def _should_add_new_candle(self, new_open_time):
-        return new_open_time not in self.time_candles
+        return new_open_time not in self._slot_by_time
 
     def _check_max_candles(self):
         if self.reached_max:
@@ -209,14 +253,23 @@ class CandlesManager(util.Initializable):
         else:
             self.reached_max = True
 
-    def _extract_limited_data(self, data, limit=-1, max_limit=-1):
+    def _extract_limited_data(self, data, limit=-1, max_limit=-1, copy=True):
         max_handled_limit: int = self.max_candles_count if self.reached_max else max_limit
         if limit == -1:
             if max_limit == -1:
-                return np.array(data, dtype=np.float64)
-            return np.array(data[:max_handled_limit], dtype=np.float64)
-
-        if max_limit == -1:
-            return np.array(data[-min(limit, len(data)):], dtype=np.float64)
+                limited_data = data
+            else:
+                limited_data = data[:max_handled_limit]
+        elif max_limit == -1:
+            limited_data = data[-min(limit, len(data)):]
         else:
-            return np.array(data[max(0, max_handled_limit - limit): max_handled_limit], dtype=np.float64)
+            limited_data = data[max(0, max_handled_limit - limit): max_handled_limit]
+        if copy:
+            return np.array(limited_data, dtype=np.float64)
+        return self._get_read_only_view(limited_data)
+
+    def _get_read_only_view(self, data):
+        view = data.view(CandlesView)
+        view.version = self.candles_version
+        view.flags.writeable = False
+        return view
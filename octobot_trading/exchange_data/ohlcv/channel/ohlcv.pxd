@@ -18,7 +18,7 @@ cimport octobot_trading.exchange_channel as exchanges_channel
 
 
 cdef class OHLCVProducer(exchanges_channel.ExchangeChannelProducer):
-    pass
+    cpdef bint has_consumers(self, object time_frame, str symbol)
 
 cdef class OHLCVChannel(exchanges_channel.TimeFrameExchangeChannel):
     pass
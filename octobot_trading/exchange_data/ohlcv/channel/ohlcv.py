@@ -26,8 +26,7 @@ class OHLCVProducer(exchanges_channel.ExchangeChannelProducer):
 
     async def perform(self, time_frame, symbol, candle, replace_all=False, partial=False):
         try:
-            if self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or \
-                    self.channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame.value):
+            if self.has_consumers(time_frame, symbol):
                 await self.channel.exchange_manager.get_symbol_data(symbol) \
                     .handle_candles_update(time_frame, candle, replace_all=replace_all, partial=partial, upsert=False)
                 if candle and (partial or replace_all):
@@ -42,6 +41,13 @@ class OHLCVProducer(exchanges_channel.ExchangeChannelProducer):
         except Exception as e:
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
+    def has_consumers(self, time_frame, symbol):
+        """
+        :return: True when pushed candles of this time frame and symbol are stored and sent to consumers
+        """
+        return bool(self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or
+                    self.channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame.value))
+
     async def send(self, cryptocurrency, symbol, time_frame, candle):
         for consumer in self.channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame):
             await consumer.queue.put({
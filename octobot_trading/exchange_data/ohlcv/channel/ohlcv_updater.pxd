@@ -23,8 +23,21 @@ cdef class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
     cdef bint is_initialized
     cdef dict initialized_candles_by_tf_by_symbol
 
+    cdef public bint aggregate_time_frames
+    cdef public list aggregated_time_frames
+    cdef dict _last_aggregated_candle_time_by_tf_by_symbol
+    cdef dict _aggregated_candles_count_by_tf_by_symbol
+
+    cdef public object candles_cache
+
     cdef list _get_traded_pairs(self)
     cdef list _get_time_frames(self)
+    cdef object _get_shortest_time_frame(self)
+    cdef list _get_aggregated_time_frames(self)
+    cdef object _get_aggregated_candle(self, object symbol_data, object time_frame, double candle_time,
+                                       int shortest_candles_count)
+    cdef double _get_last_aggregated_candle_time(self, object symbol_data, str pair, object time_frame)
+    cdef void _set_last_aggregated_candle_time(self, str pair, object time_frame, double candle_time)
     cdef int _get_historical_candles_count(self)
     cdef double _ensure_correct_sleep_time(self, double sleep_time_candidate, double time_frame_sleep)
     cdef void _set_initialized(self, str pair, object time_frame, bint initialized)
@@ -22,6 +22,7 @@ import octobot_commons.enums as common_enums
 
 import octobot_trading.errors as errors
 import octobot_trading.constants as constants
+import octobot_trading.exchange_data.ohlcv.candles_cache as candles_cache
 import octobot_trading.exchange_data.ohlcv.channel.ohlcv as ohlcv_channel
 import octobot_trading.exchanges as exchanges
 
@@ -38,12 +39,27 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
     OHLCV_INITIALIZATION_TIMEOUT = 60
     OHLCV_INITIALIZATION_RETRY_DELAY = 10
 
+    # larger time frames are not always aligned on the same start time on every exchange
+    OHLCV_MAX_AGGREGATED_TIME_FRAME_MINUTES = common_enums.TimeFramesMinutes[common_enums.TimeFrames.ONE_DAY]
+    # use exchange candles instead of aggregated candles every OHLCV_AGGREGATION_RECONCILIATION_INTERVAL candles
+    OHLCV_AGGREGATION_RECONCILIATION_INTERVAL = 10
+
     def __init__(self, channel):
         super().__init__(channel)
         self.tasks = []
         self.is_initialized = False
         self.initialized_candles_by_tf_by_symbol = {}
 
+        # when True, time frames that can be built from the shortest time frame candles are not fetched from the
+        # exchange after initialization
+        self.aggregate_time_frames = constants.ENABLE_LOCAL_OHLCV_AGGREGATION
+        self.aggregated_time_frames = []
+        self._last_aggregated_candle_time_by_tf_by_symbol = {}
+        self._aggregated_candles_count_by_tf_by_symbol = {}
+
+        # when set, only the candles that are missing from the local candles history are fetched at initialization
+        self.candles_cache = candles_cache.CandlesCache() if constants.ENABLE_CANDLES_CACHE else None
+
     async def start(self):
         """
         Creates OHLCV refresh tasks
@@ -54,9 +70,14 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
             if self.channel.is_paused:
                 await self.pause()
             else:
+                self.aggregated_time_frames = self._get_aggregated_time_frames()
+                if self.aggregated_time_frames:
+                    self.logger.debug(f"Building {[tf.value for tf in self.aggregated_time_frames]} candles from "
+                                      f"{self._get_shortest_time_frame().value} candles")
                 self.tasks = [
                     asyncio.create_task(self._candle_callback(time_frame, pair))
-                    for time_frame in self.channel.exchange_manager.exchange_config.traded_time_frames
+                    for time_frame in self._get_time_frames()
+                    if time_frame not in self.aggregated_time_frames
                     for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs]
 
     def _get_traded_pairs(self):
@@ -65,6 +86,25 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
     def _get_time_frames(self):
         return self.channel.exchange_manager.exchange_config.traded_time_frames
 
+    def _get_shortest_time_frame(self):
+        return self.channel.exchange_manager.exchange_config.get_shortest_time_frame()
+
+    def _get_aggregated_time_frames(self):
+        """
+        :return: the traded time frames which candles can be built from the shortest time frame candles
+        """
+        if not self.aggregate_time_frames or len(self._get_time_frames()) < 2:
+            return []
+        shortest_time_frame = self._get_shortest_time_frame()
+        shortest_time_frame_minutes = common_enums.TimeFramesMinutes[shortest_time_frame]
+        return [
+            time_frame
+            for time_frame in self._get_time_frames()
+            if time_frame is not shortest_time_frame
+            and common_enums.TimeFramesMinutes[time_frame] % shortest_time_frame_minutes == 0
+            and common_enums.TimeFramesMinutes[time_frame] <= self.OHLCV_MAX_AGGREGATED_TIME_FRAME_MINUTES
+        ]
+
     async def fetch_and_push(self):
         return await self._initialize(True)
 
@@ -96,6 +136,11 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
         return self.OHLCV_OLD_LIMIT
 
     async def _get_init_candles(self, time_frame, pair):
+        if self.candles_cache is None:
+            return await self._fetch_init_candles(time_frame, pair)
+        return await self._get_cached_init_candles(time_frame, pair)
+
+    async def _fetch_init_candles(self, time_frame, pair):
         historical_candles_count_limit = self._get_historical_candles_count()
         if historical_candles_count_limit > constants.DEFAULT_CANDLE_HISTORY_SIZE:
             tf_seconds = common_enums.TimeFramesMinutes[time_frame] * common_constants.MINUTE_TO_SECONDS
@@ -104,14 +149,76 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
             start_time = end_time - (historical_candles_count_limit + 1) * tf_seconds * \
                 common_constants.MSECONDS_TO_SECONDS
             candles = []
-            async for new_candles in exchanges.get_historical_ohlcv(self.channel.exchange_manager, pair,
-                                                                    time_frame, start_time, end_time):
+            get_historical_ohlcv = exchanges.get_concurrent_historical_ohlcv \
+                if constants.ENABLE_CONCURRENT_HISTORICAL_OHLCV_FETCH else exchanges.get_historical_ohlcv
+            async for new_candles in get_historical_ohlcv(self.channel.exchange_manager, pair,
+                                                          time_frame, start_time, end_time):
                 candles += new_candles
             return candles
         candles: list = await self.channel.exchange_manager.exchange \
             .get_symbol_prices(pair, time_frame, limit=self.OHLCV_OLD_LIMIT)
         return candles
 
+    async def _get_cached_init_candles(self, time_frame, pair):
+        """
+        Completes the locally cached candles history with the candles that have been created since and stores the
+        result back in cache. Fetches the whole history when the cached candles can't be completed.
+        The cache is only written here, at initialization: it is not updated with the candles received afterwards.
+        Cache files are read and written in the default executor not to block the event loop. Cache errors are
+        logged and ignored.
+        """
+        exchange_name = self.channel.exchange_manager.exchange_name
+        historical_candles_count_limit = self._get_historical_candles_count()
+        tf_seconds = common_enums.TimeFramesMinutes[time_frame] * common_constants.MINUTE_TO_SECONDS
+        current_candle_time = time.time() // tf_seconds * tf_seconds
+        # historical_candles_count_limit candles including the current one
+        min_candle_time = current_candle_time - (historical_candles_count_limit - 1) * tf_seconds
+        loop = asyncio.get_event_loop()
+        try:
+            cached_candles = await loop.run_in_executor(
+                None, _load_cached_candles, self.candles_cache, exchange_name, pair, time_frame, min_candle_time
+            )
+        except OSError as e:
+            self.logger.warning(f"Ignoring {pair} {time_frame} candles cache: failed to read cached candles: {e}")
+            cached_candles = []
+        candles = None
+        if cached_candles and cached_candles[0][common_enums.PriceIndexes.IND_PRICE_TIME.value] <= min_candle_time:
+            candles = await self._complete_cached_candles(time_frame, pair, cached_candles, current_candle_time,
+                                                          tf_seconds)
+        if candles is None:
+            candles = await self._fetch_init_candles(time_frame, pair)
+        else:
+            candles = candles[-historical_candles_count_limit:]
+            self.logger.debug(f"Using {len(cached_candles)} cached candles for {pair} on {time_frame}")
+        if candles and len(candles) > 1:
+            # only cache completed candles
+            try:
+                await loop.run_in_executor(
+                    None, self.candles_cache.set_candles, exchange_name, pair, time_frame, candles[:-1]
+                )
+            except OSError as e:
+                self.logger.warning(f"Failed to cache {pair} {time_frame} candles: {e}")
+        return candles
+
+    async def _complete_cached_candles(self, time_frame, pair, cached_candles, current_candle_time, tf_seconds):
+        last_cached_candle_time = cached_candles[-1][common_enums.PriceIndexes.IND_PRICE_TIME.value]
+        # missing candles including the current one
+        missing_candles_count = int((current_candle_time - last_cached_candle_time) // tf_seconds)
+        if not 0 < missing_candles_count < self.OHLCV_OLD_LIMIT:
+            return None
+        # also fetch the last cached candle to make sure no candle is missing in between
+        fetched_candles = await self.channel.exchange_manager.exchange \
+            .get_symbol_prices(pair, time_frame, limit=missing_candles_count + 1)
+        new_candles = [
+            candle
+            for candle in fetched_candles or []
+            if candle[common_enums.PriceIndexes.IND_PRICE_TIME.value] > last_cached_candle_time
+        ]
+        if not new_candles or \
+                new_candles[0][common_enums.PriceIndexes.IND_PRICE_TIME.value] != last_cached_candle_time + tf_seconds:
+            return None
+        return cached_candles + new_candles
+
     async def _initialize_candles(self, time_frame, pair, should_retry) \
             -> (str, common_enums.TimeFrames, list):
         """
@@ -231,8 +338,105 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
             # A fresh candle happened
             last_candle_timestamp = current_candle_timestamp
             await self._push_complete_candles(time_frame, pair, candles)
+            if self.aggregated_time_frames and time_frame is self._get_shortest_time_frame():
+                await self._push_aggregated_candles(pair, candles)
         return last_candle_timestamp, should_sleep_time
 
+    async def _push_aggregated_candles(self, pair, shortest_time_frame_candles):
+        """
+        Push the aggregated time frames candles that are completed by the given shortest time frame candles
+        """
+        shortest_time_frame = self._get_shortest_time_frame()
+        completed_candles = shortest_time_frame_candles[:-1]
+        symbol_data = self.channel.exchange_manager.get_symbol_data(pair)
+        # aggregated candles are built from the shortest time frame candles manager: make sure it is up-to-date
+        # when candles have not already been stored while being pushed
+        if not self.has_consumers(shortest_time_frame, pair):
+            await symbol_data.handle_candles_update(shortest_time_frame, completed_candles, partial=True)
+        shortest_time_frame_seconds = \
+            common_enums.TimeFramesMinutes[shortest_time_frame] * common_constants.MINUTE_TO_SECONDS
+        for time_frame in self.aggregated_time_frames:
+            if not self.initialized_candles_by_tf_by_symbol[pair].get(time_frame, False):
+                continue
+            time_frame_seconds = common_enums.TimeFramesMinutes[time_frame] * common_constants.MINUTE_TO_SECONDS
+            for candle in completed_candles:
+                candle_close_time = candle[common_enums.PriceIndexes.IND_PRICE_TIME.value] + shortest_time_frame_seconds
+                if candle_close_time % time_frame_seconds == 0 \
+                   and candle_close_time - time_frame_seconds > \
+                        self._get_last_aggregated_candle_time(symbol_data, pair, time_frame):
+                    await self._push_aggregated_candle(
+                        symbol_data, time_frame, pair, candle_close_time - time_frame_seconds,
+                        len(completed_candles) + time_frame_seconds // shortest_time_frame_seconds
+                    )
+
+    async def _push_aggregated_candle(self, symbol_data, time_frame, pair, candle_time, shortest_candles_count):
+        self._set_last_aggregated_candle_time(pair, time_frame, candle_time)
+        aggregated_candles_count = self._aggregated_candles_count_by_tf_by_symbol[pair][time_frame] + 1
+        candle = None
+        if aggregated_candles_count % self.OHLCV_AGGREGATION_RECONCILIATION_INTERVAL:
+            candle = self._get_aggregated_candle(symbol_data, time_frame, candle_time, shortest_candles_count)
+        if candle is None:
+            # reconcile with exchange candles
+            candles: list = await self.channel.exchange_manager.exchange.get_symbol_prices(
+                pair,
+                time_frame,
+                limit=self.OHLCV_LIMIT)
+            if candles and len(candles) > 1:
+                self._aggregated_candles_count_by_tf_by_symbol[pair][time_frame] = 0
+                await self._push_complete_candles(time_frame, pair, candles)
+            return
+        self._aggregated_candles_count_by_tf_by_symbol[pair][time_frame] = aggregated_candles_count
+        await self.push(time_frame, pair, [candle], partial=True)
+
+    def _get_aggregated_candle(self, symbol_data, time_frame, candle_time, shortest_candles_count):
+        """
+        :return: the time_frame candle starting at candle_time built from the shortest time frame candles or None
+        when shortest time frame candles are missing
+        """
+        time_frame_seconds = common_enums.TimeFramesMinutes[time_frame] * common_constants.MINUTE_TO_SECONDS
+        shortest_time_frame = self._get_shortest_time_frame()
+        try:
+            shortest_candles = symbol_data.symbol_candles[shortest_time_frame]\
+                .get_candles_array(shortest_candles_count, copy=False)
+        except KeyError:
+            return None
+        times = shortest_candles[:, common_enums.PriceIndexes.IND_PRICE_TIME.value]
+        candles = shortest_candles[(times >= candle_time) & (times < candle_time + time_frame_seconds)]
+        if len(candles) != time_frame_seconds // (common_enums.TimeFramesMinutes[shortest_time_frame] *
+                                                  common_constants.MINUTE_TO_SECONDS):
+            return None
+        candle = [0] * len(common_enums.PriceIndexes)
+        candle[common_enums.PriceIndexes.IND_PRICE_TIME.value] = candle_time
+        candle[common_enums.PriceIndexes.IND_PRICE_OPEN.value] = \
+            float(candles[0, common_enums.PriceIndexes.IND_PRICE_OPEN.value])
+        candle[common_enums.PriceIndexes.IND_PRICE_HIGH.value] = \
+            float(candles[:, common_enums.PriceIndexes.IND_PRICE_HIGH.value].max())
+        candle[common_enums.PriceIndexes.IND_PRICE_LOW.value] = \
+            float(candles[:, common_enums.PriceIndexes.IND_PRICE_LOW.value].min())
+        candle[common_enums.PriceIndexes.IND_PRICE_CLOSE.value] = \
+            float(candles[-1, common_enums.PriceIndexes.IND_PRICE_CLOSE.value])
+        candle[common_enums.PriceIndexes.IND_PRICE_VOL.value] = \
+            float(candles[:, common_enums.PriceIndexes.IND_PRICE_VOL.value].sum())
+        return candle
+
+    def _get_last_aggregated_candle_time(self, symbol_data, pair, time_frame):
+        try:
+            return self._last_aggregated_candle_time_by_tf_by_symbol[pair][time_frame]
+        except KeyError:
+            # nothing aggregated yet: use the last candle from initialization
+            try:
+                last_candle_times = symbol_data.symbol_candles[time_frame].get_symbol_time_candles(1)
+                return last_candle_times[-1] if len(last_candle_times) else 0
+            except KeyError:
+                return 0
+
+    def _set_last_aggregated_candle_time(self, pair, time_frame, candle_time):
+        if pair not in self._last_aggregated_candle_time_by_tf_by_symbol:
+            self._last_aggregated_candle_time_by_tf_by_symbol[pair] = {}
+            self._aggregated_candles_count_by_tf_by_symbol[pair] = {}
+        self._last_aggregated_candle_time_by_tf_by_symbol[pair][time_frame] = candle_time
+        self._aggregated_candles_count_by_tf_by_symbol[pair].setdefault(time_frame, 0)
+
     def _ensure_correct_sleep_time(self, sleep_time_candidate, time_frame_sleep):
         if sleep_time_candidate < OHLCVUpdater.OHLCV_MIN_REFRESH_TIME:
             return OHLCVUpdater.OHLCV_MIN_REFRESH_TIME
@@ -262,3 +466,14 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
     #         for time_frame in time_frames:
     #             self.__create_time_frame_candle_task(time_frame)
     #             self.logger.info(f"global_data_callback: added {time_frame}")
+
+
+def _load_cached_candles(cache, exchange_name, pair, time_frame, min_candle_time):
+    """
+    :return: the cached candles list from min_candle_time
+    """
+    cached_candles = cache.get_candles(exchange_name, pair, time_frame)
+    # boolean indexing copies candles: the cache file is not referenced anymore
+    return cached_candles[
+        cached_candles[:, common_enums.PriceIndexes.IND_PRICE_TIME.value] >= min_candle_time
+    ].tolist()
@@ -37,3 +37,6 @@ cdef class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
     cdef bint require_last_init_candles_pairs_push
     cdef list traded_pairs
     cdef list traded_time_frame
+
+    cdef dict ohlcv_cursors_by_pair_by_time_frame
+    cdef int ohlcv_prefetch_candles_count
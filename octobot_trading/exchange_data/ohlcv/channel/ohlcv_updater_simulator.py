@@ -19,6 +19,7 @@ import octobot_commons.constants as constants
 import octobot_commons.enums as enums
 import octobot_commons.errors as errors
 
+import octobot_trading.constants as trading_constants
 import octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater as ohlcv_updater
 import octobot_trading.util as util
 
@@ -42,6 +43,16 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
         self.traded_pairs = self._get_traded_pairs()
         self.traded_time_frame = self._get_time_frames()
 
+        # pair: time frame: [prefetched ohlcv data, index of the next data to read, prefetched from timestamp,
+        # prefetched until timestamp]
+        self.ohlcv_cursors_by_pair_by_time_frame = {}
+        # candles to prefetch per pair and time frame: split the prefetched candles budget between cursors
+        self.ohlcv_prefetch_candles_count = max(
+            trading_constants.BACKTESTING_OHLCV_PREFETCH_MIN_CANDLES_COUNT,
+            trading_constants.BACKTESTING_OHLCV_PREFETCH_MAX_CANDLES_COUNT //
+            max(1, len(self.traded_pairs) * len(self.traded_time_frame))
+        )
+
     async def start(self):
         if not self.is_initialized:
             await self._initialize(False)
@@ -56,13 +67,12 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
                     # (selection is <= and >=)
                     # Use timestamp + self.future_candle_sec_length to include the future candle on the future candles
                     # time frame that will be sorted in exchange simulator for later uses.
-                    ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
-                        exchange_name=self.exchange_name,
-                        symbol=pair,
-                        time_frame=time_frame,
-                        inferior_timestamp=self.last_timestamp_pushed + 1,
-                        superior_timestamp=timestamp + (self.future_candle_sec_length
-                                                        if self.future_candle_time_frame is time_frame else 0)
+                    ohlcv_data: list = await self._get_ohlcv_from_timestamps(
+                        pair,
+                        time_frame,
+                        self.last_timestamp_pushed + 1,
+                        timestamp + (self.future_candle_sec_length
+                                     if self.future_candle_time_frame is time_frame else 0)
                     )
                     if ohlcv_data:
                         pushed_data = await self._handle_ohlcv_data(ohlcv_data, time_frame, pair, timestamp)
@@ -89,6 +99,41 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
             self.last_timestamp_pushed = timestamp
             self.require_last_init_candles_pairs_push = False
 
+    async def _get_ohlcv_from_timestamps(self, pair, time_frame, inferior_timestamp, superior_timestamp):
+        """
+        :return: the ohlcv data between inferior_timestamp and superior_timestamp (included). Data are read from
+        the importer by windows of ohlcv_prefetch_candles_count candles and then selected from memory
+        """
+        cursor = self.ohlcv_cursors_by_pair_by_time_frame.setdefault(pair, {}).get(time_frame)
+        if cursor is None or inferior_timestamp < cursor[2] or superior_timestamp > cursor[3]:
+            prefetched_until = superior_timestamp + self.ohlcv_prefetch_candles_count * \
+                enums.TimeFramesMinutes[time_frame] * constants.MINUTE_TO_SECONDS
+            cursor = [
+                await self.exchange_data_importer.get_ohlcv_from_timestamps(
+                    exchange_name=self.exchange_name,
+                    symbol=pair,
+                    time_frame=time_frame,
+                    inferior_timestamp=inferior_timestamp,
+                    superior_timestamp=prefetched_until
+                ),
+                0,
+                inferior_timestamp,
+                prefetched_until
+            ]
+            self.ohlcv_cursors_by_pair_by_time_frame[pair][time_frame] = cursor
+        ohlcv_data = cursor[0]
+        # timestamps are usually increasing: start from the last read data
+        start_index = cursor[1]
+        while start_index > 0 and ohlcv_data[start_index - 1][0] >= inferior_timestamp:
+            start_index -= 1
+        while start_index < len(ohlcv_data) and ohlcv_data[start_index][0] < inferior_timestamp:
+            start_index += 1
+        cursor[1] = start_index
+        end_index = start_index
+        while end_index < len(ohlcv_data) and ohlcv_data[end_index][0] <= superior_timestamp:
+            end_index += 1
+        return ohlcv_data[start_index:end_index]
+
     async def _handle_ohlcv_data(self, ohlcv_data, time_frame, pair, timestamp):
         has_future_candle = False
         if self.future_candle_time_frame is time_frame:
@@ -134,6 +179,7 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
     async def _initialize_candles(self, time_frame, pair, should_retry):
         # fetch history
         ohlcv_data = None
+        self.ohlcv_cursors_by_pair_by_time_frame.get(pair, {}).pop(time_frame, None)
         try:
             # only load candles starting from the star time of the backtesting
             ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
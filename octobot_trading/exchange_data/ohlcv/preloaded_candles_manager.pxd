@@ -19,6 +19,14 @@ cimport numpy as np
 
 
 cdef class PreloadedCandlesManager(candles_manager.CandlesManager):
+    cdef public bint compact
+    cdef public object mmap_path
+
+    cdef object _candles_times
+    cdef double _time_step
+
+    cpdef void replace_all_candles_array(self, object all_candles_array)
+
     cpdef int get_preloaded_symbol_candles_count(self)
     cpdef np.ndarray get_preloaded_symbol_close_candles(self)
     cpdef np.ndarray get_preloaded_symbol_open_candles(self)
@@ -29,4 +37,5 @@ cdef class PreloadedCandlesManager(candles_manager.CandlesManager):
 
     # private
     cdef int _get_candle_index(self, list candle)
-    cdef np.ndarray _get_candle_values_array(self, list candles, int key)
+    cdef np.ndarray _get_candles_block(self, object candles)
+    cdef void _update_time_step(self)
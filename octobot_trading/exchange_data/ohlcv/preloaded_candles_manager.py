@@ -20,9 +20,49 @@ import octobot_commons.constants as commons_constants
 
 import octobot_trading.exchange_data.ohlcv.candles_manager as candles_manager
 
+# in compact mode, candles values blocks contain every candle value but the time, in PriceIndexes order
+COMPACT_PRICE_INDEXES = [
+    price_index.value
+    for price_index in enums.PriceIndexes
+    if price_index is not enums.PriceIndexes.IND_PRICE_TIME
+]
+
 
 class PreloadedCandlesManager(candles_manager.CandlesManager):
 
+    def __init__(self, max_candles_count=None, compact=False, mmap_path=None):
+        # when True, candles times are stored in a float64 array and other candles values in a float32 block
+        # (28 instead of 48 bytes per candle). Copied candles are always returned as float64 arrays
+        self.compact = compact
+        # when set, candles values are stored in this file and loaded in memory by the OS when required
+        self.mmap_path = mmap_path
+        # only used in compact mode, time_candles is a view on this array
+        self._candles_times = None
+        super().__init__(max_candles_count=max_candles_count)
+
+    def replace_all_candles_array(self, all_candles_array):
+        """
+        Same as replace_all_candles using a (candles count, >= CANDLE_VALUES_COUNT) array, without building
+        intermediate python lists
+        """
+        self._reset_candles()
+        self._set_all_candles(all_candles_array)
+        self.candles_initialized = True
+
+    def get_candles_array(self, limit=-1, copy=True):
+        if not self.compact:
+            return super().get_candles_array(limit, copy)
+        # candles times are not stored in the float32 values block
+        candles_times = self._extract_limited_data(
+            self._candles_times, limit, max_limit=self.time_candles_index, copy=False
+        )
+        candles = np.empty((len(candles_times), candles_manager.CANDLE_VALUES_COUNT), dtype=np.float64)
+        candles[:, enums.PriceIndexes.IND_PRICE_TIME.value] = candles_times
+        candles[:, COMPACT_PRICE_INDEXES] = self._extract_limited_data(
+            self._candles, limit, max_limit=self.time_candles_index, copy=False
+        )
+        return candles if copy else self._get_read_only_view(candles)
+
     def get_preloaded_symbol_candles_count(self):
         return len(self.time_candles)
 
@@ -45,31 +85,70 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         return self.volume_candles
 
     def _set_all_candles(self, new_candles_data):
-        self.close_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_CLOSE.value)
-        self.open_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_OPEN.value)
-        self.high_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_HIGH.value)
-        self.low_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_LOW.value)
-        self.time_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_TIME.value)
-        self.volume_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_VOL.value)
-
-    def _get_candle_values_array(self, candles, key):
-        return np.array([candle[key] for candle in candles], dtype=np.float64)
+        self._candles = self._get_candles_block(new_candles_data)
+        self._update_values_views()
+        self._update_time_step()
+
+    def _update_time_step(self):
+        # preloaded candles are sorted and usually evenly spaced: store the time between two candles to find
+        # candles indexes without searching
+        self._time_step = 0
+        candles_count = len(self.time_candles)
+        if candles_count > 1:
+            time_step = self.time_candles[1] - self.time_candles[0]
+            if time_step > 0 and self.time_candles[-1] - self.time_candles[0] == time_step * (candles_count - 1):
+                self._time_step = time_step
+
+    def _get_candles_block(self, candles):
+        values_dtype = np.float32 if self.compact else np.float64
+        values_count = len(COMPACT_PRICE_INDEXES) if self.compact else candles_manager.CANDLE_VALUES_COUNT
+        if len(candles) == 0:
+            candles_block = np.full((0, values_count), fill_value=np.nan, dtype=values_dtype)
+            if self.compact:
+                self._candles_times = np.full(0, fill_value=np.nan, dtype=np.float64)
+        elif self.compact:
+            # times are stored in _candles_times only
+            if not isinstance(candles, np.ndarray):
+                candles = np.array(
+                    [candle[:candles_manager.CANDLE_VALUES_COUNT] for candle in candles], dtype=np.float64
+                )
+            self._candles_times = np.array(candles[:, enums.PriceIndexes.IND_PRICE_TIME.value], dtype=np.float64)
+            candles_block = candles[:, COMPACT_PRICE_INDEXES]
+        elif isinstance(candles, np.ndarray):
+            candles_block = candles[:, :candles_manager.CANDLE_VALUES_COUNT]
+        else:
+            candles_block = [candle[:candles_manager.CANDLE_VALUES_COUNT] for candle in candles]
+        if self.mmap_path is None or len(candles) == 0:
+            return np.array(candles_block, dtype=values_dtype)
+        mapped_candles_block = np.lib.format.open_memmap(
+            self.mmap_path, mode="w+", dtype=values_dtype, shape=(len(candles), values_count)
+        )
+        mapped_candles_block[:] = candles_block
+        mapped_candles_block.flush()
+        return mapped_candles_block
+
+    def _update_values_views(self):
+        if not self.compact:
+            candles_manager.CandlesManager._update_values_views(self)
+            return
+        self.close_candles = self._candles[:, COMPACT_PRICE_INDEXES.index(enums.PriceIndexes.IND_PRICE_CLOSE.value)]
+        self.open_candles = self._candles[:, COMPACT_PRICE_INDEXES.index(enums.PriceIndexes.IND_PRICE_OPEN.value)]
+        self.high_candles = self._candles[:, COMPACT_PRICE_INDEXES.index(enums.PriceIndexes.IND_PRICE_HIGH.value)]
+        self.low_candles = self._candles[:, COMPACT_PRICE_INDEXES.index(enums.PriceIndexes.IND_PRICE_LOW.value)]
+        self.time_candles = self._candles_times
+        self.volume_candles = self._candles[:, COMPACT_PRICE_INDEXES.index(enums.PriceIndexes.IND_PRICE_VOL.value)]
 
     def _get_candle_index(self, candle):
         # Uses the given candle to find the index on the associated candle in preloaded candles.
         # The goal of this method is to quickly identify where the limit between past and future candles
         # should be when handling preloaded candles.
-
-        # return actual index + 1 as it is used as a select length
-        select_index = 0 if self.time_candles_index == 0 else self.time_candles_index - 1
-        for delta_index, time_value in enumerate(self.time_candles[select_index:]):
-            if time_value == candle[enums.PriceIndexes.IND_PRICE_TIME.value]:
-                return self.time_candles_index + delta_index
-        # candle in past candles
-        for index, time_value in enumerate(self.time_candles[:select_index]):
-            if time_value == candle[enums.PriceIndexes.IND_PRICE_TIME.value]:
-                return index
-        return commons_constants.DEFAULT_IGNORED_VALUE
+        index = self._get_time_index(candle[enums.PriceIndexes.IND_PRICE_TIME.value])
+        if index == -1:
+            return commons_constants.DEFAULT_IGNORED_VALUE
+        # return actual index + 1 as it is used as a select length when the candle is not before the current one
+        if self.time_candles_index > 0 and index >= self.time_candles_index - 1:
+            return index + 1
+        return index
 
     def add_old_and_new_candles(self, candles_data):
         # candles are already loaded, just set indexes to the new candle
@@ -85,23 +164,45 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         self.low_candles_index = current_index
         self.time_candles_index = current_index
         self.volume_candles_index = current_index
+        self.candles_version += 1
 
-    def _extract_limited_data(self, data, limit=-1, max_limit=-1):
+    def _extract_limited_data(self, data, limit=-1, max_limit=-1, copy=True):
         if limit == -1:
-            if max_limit == -1:
-                return data
-            return np.array(data[:max_limit], dtype=np.float64)
-
-        if max_limit == -1:
-            return np.array(data[-min(limit, len(data)):], dtype=np.float64)
+            limited_data = data if max_limit == -1 else data[:max_limit]
+        elif max_limit == -1:
+            limited_data = data[-min(limit, len(data)):]
         else:
-            return np.array(data[max(0, max_limit - limit): max_limit], dtype=np.float64)
+            limited_data = data[max(0, max_limit - limit): max_limit]
+        if copy:
+            return np.array(limited_data, dtype=np.float64)
+        return self._get_read_only_view(limited_data)
 
     def add_new_candle(self, new_candle_data):
         self.logger.error("add_new_candle should not be called")
 
+    def _get_time_index(self, candle_time):
+        if self._time_step > 0:
+            index = int((candle_time - self.time_candles[0]) // self._time_step)
+            if 0 <= index < len(self.time_candles) and self.time_candles[index] == candle_time:
+                return index
+        # missing candles: preloaded candles are sorted by time
+        index = int(np.searchsorted(self.time_candles, candle_time))
+        if index < len(self.time_candles) and self.time_candles[index] == candle_time:
+            return index
+        return -1
+
+    def _set_candle(self, index, candle_data):
+        # preloaded candles are not stored in a ring buffer
+        if self.compact:
+            self._candles[index] = [candle_data[price_index] for price_index in COMPACT_PRICE_INDEXES]
+            self._candles_times[index] = candle_data[enums.PriceIndexes.IND_PRICE_TIME.value]
+        else:
+            self._candles[index] = candle_data[:candles_manager.CANDLE_VALUES_COUNT]
+        self.candles_version += 1
+
     def _reset_candles(self):
         self.candles_initialized = False
+        self.candles_version += 1
 
         self.close_candles_index = 0
         self.open_candles_index = 0
@@ -110,9 +211,6 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         self.time_candles_index = 0
         self.volume_candles_index = 0
 
-        self.close_candles = np.ndarray((0,))
-        self.open_candles = np.ndarray((0,))
-        self.high_candles = np.ndarray((0,))
-        self.low_candles = np.ndarray((0,))
-        self.time_candles = np.ndarray((0,))
-        self.volume_candles = np.ndarray((0,))
+        self._candles = self._get_candles_block([])
+        self._update_values_views()
+        self._time_step = 0
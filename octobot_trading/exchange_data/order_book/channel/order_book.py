@@ -17,6 +17,7 @@ import asyncio
 
 import async_channel.constants as constants
 
+import octobot_trading.constants as trading_constants
 import octobot_trading.exchange_channel as exchanges_channel
 
 
@@ -55,6 +56,7 @@ class OrderBookProducer(exchanges_channel.ExchangeChannelProducer):
 class OrderBookChannel(exchanges_channel.ExchangeChannel):
     PRODUCER_CLASS = OrderBookProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    CONFLATION_INTERVAL = trading_constants.ORDER_BOOK_CONFLATION_INTERVAL
 
 
 class OrderBookTickerProducer(exchanges_channel.ExchangeChannelProducer):
@@ -38,15 +38,21 @@ class OrderBookUpdater(order_book_channel.OrderBookProducer):
             self.refresh_time = 9
         elif refresh_threshold is enums.RestExchangePairsRefreshMaxThresholds.SLOW:
             self.refresh_time = 15
+        self.channel.exchange_manager.rest_requests_scheduler.register_feed(
+            self.CHANNEL_NAME, self.refresh_time, enums.RestRequestsPriorities.LOW,
+            requests_count=len(self.channel.exchange_manager.exchange_config.traded_symbol_pairs)
+        )
         if self.channel.is_paused:
             await self.pause()
         else:
             await self.start_update_loop()
 
     async def start_update_loop(self):
+        rest_requests_scheduler = self.channel.exchange_manager.rest_requests_scheduler
         while not self.should_stop and not self.channel.is_paused:
             try:
                 for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
+                    await rest_requests_scheduler.reserve_requests()
                     order_book = await self.channel.exchange_manager.exchange.get_order_book(pair)
                     try:
                         asks, bids = order_book[enums.ExchangeConstantsOrderBookInfoColumns.ASKS.value], \
@@ -58,7 +64,7 @@ class OrderBookUpdater(order_book_channel.OrderBookProducer):
                         self.logger.warning(str(e))
                     except TypeError as e:
                         self.logger.error(f"Failed to fetch order book for {pair} : {e}")
-                await asyncio.sleep(self.refresh_time)
+                await asyncio.sleep(rest_requests_scheduler.get_refresh_time(self.CHANNEL_NAME))
             except errors.FailedRequest as e:
                 self.logger.warning(str(e))
                 # avoid spamming on disconnected situation
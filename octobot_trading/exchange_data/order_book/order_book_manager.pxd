@@ -21,6 +21,7 @@ cdef class OrderBookManager(util.Initializable):
     cdef object logger
 
     cdef public bint order_book_initialized
+    cdef public bint is_l2
 
     cdef public double ask_quantity
     cdef public double ask_price
@@ -31,12 +32,22 @@ cdef class OrderBookManager(util.Initializable):
     cdef public object bids # SortedDict
 
     cdef public double timestamp
+    cdef public unsigned long long book_version
+
+    cdef tuple _ask_levels
+    cdef tuple _bid_levels
+    cdef tuple _ask_depth
+    cdef tuple _bid_depth
+    cdef dict _depth_queries_cache
+    cdef object _depth_queries_cache_version
 
     cpdef void reset_order_book(self)
     cpdef void order_book_ticker_update(self, double ask_quantity, double ask_price,
                                         double bid_quantity, double bid_price)
     cpdef void handle_new_book(self, dict orders)
     cpdef void handle_new_books(self, list asks, list bids, object timestamp=*)
+    cpdef bint handle_book_snapshot(self, list asks, list bids, object timestamp=*)
+    cpdef object handle_level_updates(self, list asks, list bids, object timestamp=*) # object to raise errors
     cpdef void handle_book_adds(self, list orders)
     cpdef void handle_book_deletes(self, list orders)
     cpdef void handle_book_updates(self, list orders)
@@ -44,6 +55,12 @@ cdef class OrderBookManager(util.Initializable):
     cpdef tuple get_bid(self)
     cpdef object get_asks(self, double price)
     cpdef object get_bids(self, double price)
+    cpdef tuple get_ask_levels(self)
+    cpdef tuple get_bid_levels(self)
+    cpdef object cost_to_fill(self, double quantity, str side)
+    cpdef object vwap_for_quantity(self, double quantity, str side)
+    cpdef double depth_within(self, double percent, str side)
+    cpdef object price_for_notional(self, double notional, str side)
 
     cdef object _handle_book_delete(self, dict order) # using object to prevent ignoring KeyError
     cdef object _handle_book_update(self, dict order) # using object to prevent ignoring KeyError
@@ -52,6 +69,15 @@ cdef class OrderBookManager(util.Initializable):
     cdef void _set_bids(self, double price, list bids)
     cdef void _remove_asks(self, double price)
     cdef void _remove_bids(self, double price)
+    cdef tuple _get_levels_arrays(self, object book_side, bint reverse)
+    cdef object _get_cached_depth_query(self, object query, double value, str side)
+    cdef tuple _get_depth(self, str side)
+
+cdef tuple _get_cumulated_depth(object prices, object sizes)
+cdef double _get_orders_size(list orders)
+cdef dict _get_levels_dict(list price_size_list)
+cdef list _get_level_changes(object book_side, list price_size_list)
+cdef void _set_level(object book_side, double price, double size)
 
 cdef int _order_id_index(str order_id, list order_list)
 cdef list _convert_price_size_list_to_order(list price_size_list, str side)
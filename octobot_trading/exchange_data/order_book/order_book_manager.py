@@ -14,10 +14,12 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import decimal
+import numpy as np
 import sortedcontainers
 
 import octobot_commons.logging as logging
 
+import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.util as util
 from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
@@ -27,14 +29,27 @@ INVALID_PARSED_VALUE = -1
 
 
 class OrderBookManager(util.Initializable):
-    def __init__(self):
+    def __init__(self, is_l2=constants.ENABLE_L2_ORDER_BOOK):
         super().__init__()
         self.logger = logging.get_logger(self.__class__.__name__)
         self.order_book_initialized = False
+        # when True, asks and bids are aggregated by price: price: size instead of price: [orders]
+        self.is_l2 = is_l2
         self.asks = sortedcontainers.SortedDict()
         self.bids = sortedcontainers.SortedDict()
         self.timestamp = 0
         self.ask_quantity, self.ask_price, self.bid_quantity, self.bid_price = 0, 0, 0, 0
+        # incremented on each book update
+        self.book_version = 0
+        # (book_version, prices, sizes) levels arrays cache
+        self._ask_levels = None
+        self._bid_levels = None
+        # (book_version, prices, cumulated sizes, cumulated notional) depth arrays cache
+        self._ask_depth = None
+        self._bid_depth = None
+        # depth queries results of the current book version
+        self._depth_queries_cache = {}
+        self._depth_queries_cache_version = None
 
     async def initialize_impl(self):
         self.reset_order_book()
@@ -45,6 +60,7 @@ class OrderBookManager(util.Initializable):
         self.bids.clear()
         self.timestamp = 0
         self.ask_quantity, self.ask_price, self.bid_quantity, self.bid_price = 0, 0, 0, 0
+        self.book_version += 1
 
     def order_book_ticker_update(self, ask_quantity, ask_price, bid_quantity, bid_price):
         self.ask_quantity, self.ask_price = ask_quantity, ask_price
@@ -60,12 +76,50 @@ class OrderBookManager(util.Initializable):
 
     def handle_new_books(self, asks, bids, timestamp=None):
         self.reset_order_book()
-        self.handle_book_adds(_convert_price_size_list_to_order(asks, enums.TradeOrderSide.SELL.value))
-        self.handle_book_adds(_convert_price_size_list_to_order(bids, enums.TradeOrderSide.BUY.value))
+        if self.is_l2:
+            # SortedDict sorts given levels at once instead of inserting them one by one
+            self.asks = sortedcontainers.SortedDict(_get_levels_dict(asks))
+            self.bids = sortedcontainers.SortedDict(_get_levels_dict(bids))
+        else:
+            self.handle_book_adds(_convert_price_size_list_to_order(asks, enums.TradeOrderSide.SELL.value))
+            self.handle_book_adds(_convert_price_size_list_to_order(bids, enums.TradeOrderSide.BUY.value))
         if timestamp:
             self.timestamp = timestamp
         self.order_book_initialized = True
 
+    def handle_level_updates(self, asks, bids, timestamp=None):
+        """
+        Updates the given [price, size] levels, a 0 size removes the level
+        """
+        if not self.is_l2:
+            raise ValueError("handle_level_updates requires an L2 order book (is_l2=True)")
+        for price, size in asks:
+            _set_level(self.asks, float(price), float(size))
+        for price, size in bids:
+            _set_level(self.bids, float(price), float(size))
+        if timestamp:
+            self.timestamp = timestamp
+        self.book_version += 1
+
+    def handle_book_snapshot(self, asks, bids, timestamp=None):
+        """
+        Updates the book to the given [price, size] levels snapshot by only applying changed levels
+        :return: True if the book changed
+        """
+        if not self.is_l2:
+            # no level to compare with: rebuild the book
+            self.handle_new_books(asks, bids, timestamp=timestamp)
+            return True
+        ask_changes = _get_level_changes(self.asks, asks)
+        bid_changes = _get_level_changes(self.bids, bids)
+        if timestamp:
+            self.timestamp = timestamp
+        self.order_book_initialized = True
+        if ask_changes or bid_changes:
+            self.handle_level_updates(ask_changes, bid_changes)
+            return True
+        return False
+
     def handle_book_adds(self, orders):
         for order in orders:
             try:
@@ -88,6 +142,13 @@ class OrderBookManager(util.Initializable):
                 self.logger.error(f"Error when updating order in order_book : {e}")
 
     def _handle_book_add(self, order):
+        self.book_version += 1
+        if self.is_l2:
+            book_side = self.bids if order[ECOBIC.SIDE.value] == enums.TradeOrderSide.BUY.value else self.asks
+            price = float(order[ECOBIC.PRICE.value])
+            _set_level(book_side, price, book_side.get(price, 0) + float(order[ECOBIC.SIZE.value]))
+            return
+
         # Add buy side orders
         if order[ECOBIC.SIDE.value] == enums.TradeOrderSide.BUY.value:
             bids = self.get_bids(order[ECOBIC.PRICE.value])
@@ -107,6 +168,12 @@ class OrderBookManager(util.Initializable):
         self._set_asks(order[ECOBIC.PRICE.value], asks)
 
     def _handle_book_delete(self, order):
+        self.book_version += 1
+        if self.is_l2:
+            book_side = self.bids if order[ECOBIC.SIDE.value] == enums.TradeOrderSide.BUY.value else self.asks
+            book_side.pop(float(order[ECOBIC.PRICE.value]), None)
+            return
+
         price = decimal.Decimal(order[ECOBIC.PRICE.value])
 
         # Delete buy side orders
@@ -132,6 +199,15 @@ class OrderBookManager(util.Initializable):
                 self._remove_asks(price)
 
     def _handle_book_update(self, order):
+        self.book_version += 1
+        if self.is_l2:
+            book_side = self.bids if order[ECOBIC.SIDE.value] == enums.TradeOrderSide.BUY.value else self.asks
+            price = float(order[ECOBIC.PRICE.value])
+            size = order.get(ECOBIC.SIZE.value, INVALID_PARSED_VALUE)
+            if price in book_side and size != INVALID_PARSED_VALUE:
+                _set_level(book_side, price, float(size))
+            return
+
         size = decimal.Decimal(order.get(ECOBIC.SIZE.value, INVALID_PARSED_VALUE))
         price = decimal.Decimal(order[ECOBIC.PRICE.value])
 
@@ -168,17 +244,180 @@ class OrderBookManager(util.Initializable):
         del self.bids[price]
 
     def get_ask(self):
+        if self.is_l2:
+            price, size = self.asks.peekitem(0)
+            return price, [_convert_price_size_to_order([price, size], enums.TradeOrderSide.SELL.value)]
         return self.asks.peekitem(0)
 
     def get_bid(self):
+        if self.is_l2:
+            price, size = self.bids.peekitem(-1)
+            return price, [_convert_price_size_to_order([price, size], enums.TradeOrderSide.BUY.value)]
         return self.bids.peekitem(-1)
 
     def get_asks(self, price):
+        if self.is_l2:
+            size = self.asks.get(price, None)
+            return None if size is None \
+                else [_convert_price_size_to_order([price, size], enums.TradeOrderSide.SELL.value)]
         return self.asks.get(price, None)
 
     def get_bids(self, price):
+        if self.is_l2:
+            size = self.bids.get(price, None)
+            return None if size is None \
+                else [_convert_price_size_to_order([price, size], enums.TradeOrderSide.BUY.value)]
         return self.bids.get(price, None)
 
+    def get_ask_levels(self):
+        """
+        :return: the (prices, sizes) arrays of the ask levels, from the lowest price.
+        Arrays are shared until the next book update: they should not be modified
+        """
+        if self._ask_levels is None or self._ask_levels[0] != self.book_version:
+            self._ask_levels = (self.book_version, ) + self._get_levels_arrays(self.asks, False)
+        return self._ask_levels[1], self._ask_levels[2]
+
+    def get_bid_levels(self):
+        """
+        :return: the (prices, sizes) arrays of the bid levels, from the highest price.
+        Arrays are shared until the next book update: they should not be modified
+        """
+        if self._bid_levels is None or self._bid_levels[0] != self.book_version:
+            self._bid_levels = (self.book_version, ) + self._get_levels_arrays(self.bids, True)
+        return self._bid_levels[1], self._bid_levels[2]
+
+    def cost_to_fill(self, quantity, side):
+        """
+        :param quantity: the quantity to buy or sell
+        :param side: the TradeOrderSide of the order to fill: buy orders are filled by asks, sell orders by bids
+        :return: the notional value (quote) of the levels filling quantity, None if the book is not deep enough
+        """
+        return self._get_cached_depth_query(self._compute_cost_to_fill, quantity, side)
+
+    def vwap_for_quantity(self, quantity, side):
+        """
+        :return: the average fill price of quantity, None if the book is not deep enough
+        """
+        cost = self.cost_to_fill(quantity, side)
+        return None if cost is None or quantity <= 0 else cost / quantity
+
+    def depth_within(self, percent, side):
+        """
+        :param percent: the max distance from the best price, in percent (1 for 1%)
+        :return: the quantity available to fill an order of the given side within percent of the best price
+        """
+        return self._get_cached_depth_query(self._compute_depth_within, percent, side)
+
+    def price_for_notional(self, notional, side):
+        """
+        :param notional: the notional value (quote) to buy or sell
+        :return: the price of the last level required to fill notional, None if the book is not deep enough
+        """
+        return self._get_cached_depth_query(self._compute_price_for_notional, notional, side)
+
+    def _get_cached_depth_query(self, query, value, side):
+        if self._depth_queries_cache_version != self.book_version:
+            self._depth_queries_cache = {}
+            self._depth_queries_cache_version = self.book_version
+        key = (query.__name__, value, side)
+        try:
+            return self._depth_queries_cache[key]
+        except KeyError:
+            result = self._depth_queries_cache[key] = query(value, side)
+            return result
+
+    def _compute_cost_to_fill(self, quantity, side):
+        prices, cumulated_sizes, cumulated_notional = self._get_depth(side)
+        # first level completing quantity
+        index = int(np.searchsorted(cumulated_sizes, quantity))
+        if index >= len(prices):
+            return None
+        previous_size, previous_notional = (cumulated_sizes[index - 1], cumulated_notional[index - 1]) \
+            if index > 0 else (0, 0)
+        return float(previous_notional + (quantity - previous_size) * prices[index])
+
+    def _compute_depth_within(self, percent, side):
+        prices, cumulated_sizes, _ = self._get_depth(side)
+        if len(prices) == 0:
+            return 0
+        if side == enums.TradeOrderSide.BUY.value:
+            # asks: increasing prices
+            index = int(np.searchsorted(prices, prices[0] * (1 + percent / 100), side="right"))
+        else:
+            # bids: decreasing prices
+            index = int(np.searchsorted(-prices, -prices[0] * (1 - percent / 100), side="right"))
+        return float(cumulated_sizes[index - 1]) if index > 0 else 0
+
+    def _compute_price_for_notional(self, notional, side):
+        prices, _, cumulated_notional = self._get_depth(side)
+        index = int(np.searchsorted(cumulated_notional, notional))
+        return None if index >= len(prices) else float(prices[index])
+
+    def _get_depth(self, side):
+        """
+        :return: the (prices, cumulated sizes, cumulated notional) arrays of the levels filling an order of the
+        given side, from the best price
+        """
+        if side == enums.TradeOrderSide.BUY.value:
+            if self._ask_depth is None or self._ask_depth[0] != self.book_version:
+                prices, sizes = self.get_ask_levels()
+                self._ask_depth = (self.book_version, ) + _get_cumulated_depth(prices, sizes)
+            return self._ask_depth[1:]
+        if self._bid_depth is None or self._bid_depth[0] != self.book_version:
+            prices, sizes = self.get_bid_levels()
+            self._bid_depth = (self.book_version, ) + _get_cumulated_depth(prices, sizes)
+        return self._bid_depth[1:]
+
+    def _get_levels_arrays(self, book_side, reverse):
+        prices = reversed(book_side.keys()) if reverse else book_side.keys()
+        sizes = reversed(book_side.values()) if reverse else book_side.values()
+        if not self.is_l2:
+            sizes = [_get_orders_size(orders) for orders in sizes]
+        return (np.fromiter(prices, dtype=np.float64, count=len(book_side)),
+                np.fromiter(sizes, dtype=np.float64, count=len(book_side)))
+
+
+def _get_cumulated_depth(prices, sizes):
+    return prices, np.cumsum(sizes), np.cumsum(prices * sizes)
+
+
+def _get_orders_size(orders):
+    size = 0
+    for order in orders:
+        size += float(order[ECOBIC.SIZE.value])
+    return size
+
+
+def _get_levels_dict(price_size_list):
+    return {
+        float(price_size[0]): float(price_size[1])
+        for price_size in price_size_list
+        if float(price_size[1]) > 0
+    }
+
+
+def _get_level_changes(book_side, price_size_list):
+    changes = []
+    snapshot_prices = set()
+    for price_size in price_size_list:
+        price, size = float(price_size[0]), float(price_size[1])
+        snapshot_prices.add(price)
+        if book_side.get(price, 0) != size:
+            changes.append([price, size])
+    # levels that are not in snapshot anymore
+    for price in book_side:
+        if price not in snapshot_prices:
+            changes.append([price, 0])
+    return changes
+
+
+def _set_level(book_side, price, size):
+    if size > 0:
+        book_side[price] = size
+    else:
+        book_side.pop(price, None)
+
 
 def _order_id_index(order_id, order_list):
     """
@@ -0,0 +1,34 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class PairsPollingScheduler:
+    cdef public object exchange_manager
+    cdef public double refresh_time
+    cdef public double min_refresh_time_ratio
+    cdef public double max_refresh_time_ratio
+    cdef public double volatility_threshold
+    cdef public dict pairs
+    cdef public set active_pairs
+
+    cpdef double get_tick_time(self)
+    cpdef list get_pairs_to_refresh(self, list pairs, list channels, object current_time=*)
+    cpdef void update_pair(self, str pair, object price, object current_time=*)
+    cpdef void remove_pair(self, str pair)
+
+    cdef double _get_refresh_time_ratio(self, str pair, double volatility)
+    cdef set _get_active_pairs(self)
+
+cpdef bint is_pair_consumed(list channels, str pair)
@@ -0,0 +1,131 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import math
+import time
+
+import async_channel.constants as channel_constants
+
+import octobot_trading.constants as constants
+
+
+class PairsPollingScheduler:
+    """
+    Adaptive pairs polling: pairs with open orders, open positions or a recent volatility are refreshed more often
+    than refresh_time while idle pairs back off. Pairs that are not consumed are not refreshed at all.
+    """
+    # weight of the last price change in the pair volatility
+    VOLATILITY_SMOOTHING = 0.5
+    # pair data indexes
+    LAST_PRICE = 0
+    LAST_UPDATE_TIME = 1
+    VOLATILITY = 2
+    NEXT_REFRESH_TIME = 3
+
+    def __init__(self, exchange_manager, refresh_time,
+                 min_refresh_time_ratio=constants.ADAPTIVE_POLLING_MIN_REFRESH_RATIO,
+                 max_refresh_time_ratio=constants.ADAPTIVE_POLLING_MAX_REFRESH_RATIO,
+                 volatility_threshold=constants.ADAPTIVE_POLLING_VOLATILITY_THRESHOLD):
+        self.exchange_manager = exchange_manager
+        # base pairs refresh time in seconds
+        self.refresh_time = refresh_time
+        self.min_refresh_time_ratio = min_refresh_time_ratio
+        self.max_refresh_time_ratio = max_refresh_time_ratio
+        self.volatility_threshold = volatility_threshold
+        # pair: [last price, last update time, volatility, next refresh time]
+        self.pairs = {}
+        # pairs with open orders or positions, updated by get_pairs_to_refresh
+        self.active_pairs = set()
+
+    def get_tick_time(self):
+        """
+        :return: the time to wait between two get_pairs_to_refresh calls
+        """
+        return self.refresh_time * self.min_refresh_time_ratio
+
+    def get_pairs_to_refresh(self, pairs, channels, current_time=None):
+        """
+        :param pairs: the pairs to consider
+        :param channels: the channels the refreshed data is pushed to
+        :param current_time: the current time, defaults to time.time()
+        :return: the consumed pairs which next refresh time is reached
+        """
+        current_time = time.time() if current_time is None else current_time
+        self.active_pairs = self._get_active_pairs()
+        return [
+            pair
+            for pair in pairs
+            if (pair not in self.pairs or self.pairs[pair][self.NEXT_REFRESH_TIME] <= current_time)
+            and is_pair_consumed(channels, pair)
+        ]
+
+    def update_pair(self, pair, price, current_time=None):
+        """
+        Schedule the next refresh of pair from its refreshed price
+        :param pair: the refreshed pair
+        :param price: the refreshed price, None when unavailable
+        :param current_time: the refresh time, defaults to time.time()
+        """
+        current_time = time.time() if current_time is None else current_time
+        price = float(price) if price else 0
+        update_time = current_time
+        try:
+            last_price, last_update_time, volatility, _ = self.pairs[pair]
+            if not price:
+                # keep the last price as volatility reference
+                price, update_time = last_price, last_update_time
+            elif last_price and current_time > last_update_time:
+                # price change scaled to a refresh_time period, as for a random walk
+                price_change = abs(price - last_price) / last_price * \
+                    math.sqrt(self.refresh_time / (current_time - last_update_time))
+                volatility += (price_change - volatility) * self.VOLATILITY_SMOOTHING
+        except KeyError:
+            # unknown volatility: use refresh_time
+            volatility = self.volatility_threshold
+        self.pairs[pair] = [price, update_time, volatility,
+                            current_time + self.refresh_time * self._get_refresh_time_ratio(pair, volatility)]
+
+    def remove_pair(self, pair):
+        self.pairs.pop(pair, None)
+
+    def _get_refresh_time_ratio(self, pair, volatility):
+        refresh_time_ratio = self.volatility_threshold / volatility if volatility else self.max_refresh_time_ratio
+        if pair in self.active_pairs:
+            # active pairs never back off
+            refresh_time_ratio = min(refresh_time_ratio, 1)
+        return min(max(refresh_time_ratio, self.min_refresh_time_ratio), self.max_refresh_time_ratio)
+
+    def _get_active_pairs(self):
+        exchange_personal_data = self.exchange_manager.exchange_personal_data
+        active_pairs = {
+            order.symbol
+            for order in exchange_personal_data.orders_manager.get_open_orders()
+        }
+        if self.exchange_manager.is_future:
+            for position in exchange_personal_data.positions_manager.get_symbol_positions():
+                if not position.is_idle():
+                    active_pairs.add(position.symbol)
+        return active_pairs
+
+
+def is_pair_consumed(channels, pair):
+    """
+    :return: True when a consumer of any of the given channels is registered for pair
+    """
+    for channel in channels:
+        if channel.get_filtered_consumers(symbol=channel_constants.CHANNEL_WILDCARD) \
+           or channel.get_filtered_consumers(symbol=pair):
+            return True
+    return False
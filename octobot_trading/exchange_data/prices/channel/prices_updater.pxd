@@ -15,8 +15,14 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 cimport octobot_trading.exchange_data.prices.channel.price as prices_channel
+cimport octobot_trading.exchange_data.pairs_polling_scheduler as pairs_polling_scheduler
 
 cdef class MarkPriceUpdater(prices_channel.MarkPriceProducer):
     cdef object recent_trades_consumer
     cdef object ticker_consumer
     cdef int refresh_time
+    cdef public pairs_polling_scheduler.PairsPollingScheduler pairs_polling_scheduler
+    cdef public bint is_bulk_fetching
+    cdef public int fetch_concurrency
+
+    cdef list _get_pairs_to_refresh(self, double refresh_time)
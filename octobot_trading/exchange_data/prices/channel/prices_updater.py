@@ -20,7 +20,7 @@ import octobot_trading.errors as errors
 import octobot_trading.exchange_channel as exchanges_channel
 import octobot_trading.constants as constants
 import octobot_trading.exchange_data.prices.channel.price as prices_channel
-import octobot_trading.exchange_data.prices.prices_manager as prices_manager
+import octobot_trading.exchange_data.pairs_polling_scheduler as pairs_polling_scheduler
 import octobot_trading.enums as enums
 
 
@@ -34,6 +34,13 @@ class MarkPriceUpdater(prices_channel.MarkPriceProducer):
         self.recent_trades_consumer = None
         self.ticker_consumer = None
         self.refresh_time = MarkPriceUpdater.MARK_PRICE_REFRESH_TIME
+        # when set, only consumed pairs are fetched, each at its own adaptive refresh time
+        self.pairs_polling_scheduler = pairs_polling_scheduler.PairsPollingScheduler(
+            channel.exchange_manager, self.refresh_time
+        ) if constants.ENABLE_ADAPTIVE_PAIRS_POLLING else None
+        # when True, every pair mark price is fetched in a single request, disabled when unsupported by the exchange
+        self.is_bulk_fetching = constants.ENABLE_BULK_FUNDING_AND_MARK_PRICES_FETCH
+        self.fetch_concurrency = constants.PAIRS_FETCH_CONCURRENCY
 
     async def start(self):
         refresh_threshold = self.channel.exchange_manager.get_rest_pairs_refresh_threshold()
@@ -83,11 +90,11 @@ class MarkPriceUpdater(prices_channel.MarkPriceProducer):
         Recent trades channel consumer callback
         """
         try:
-            mark_price = prices_manager.calculate_mark_price_from_recent_trade_prices(
-                [decimal.Decimal(str(last_price[enums.ExchangeConstantsOrderColumns.PRICE.value]))
-                 for last_price in recent_trades])
-
-            await self.push(symbol, mark_price, mark_price_source=enums.MarkPriceSources.RECENT_TRADE_AVERAGE.value)
+            mark_price = self.channel.exchange_manager.get_symbol_data(symbol).prices_manager.\
+                update_estimated_mark_price(recent_trades)
+            if mark_price is not None:
+                await self.push(symbol, mark_price,
+                                mark_price_source=enums.MarkPriceSources.RECENT_TRADE_AVERAGE.value)
         except Exception as e:
             self.logger.exception(e, True, f"Fail to handle recent trades update : {e}")
 
@@ -107,30 +114,84 @@ class MarkPriceUpdater(prices_channel.MarkPriceProducer):
         """
         Mark price updater from exchange data
         """
+        rest_requests_scheduler = self.channel.exchange_manager.rest_requests_scheduler
+        rest_requests_scheduler.register_feed(
+            self.CHANNEL_NAME, self.refresh_time, enums.RestRequestsPriorities.MEDIUM,
+            requests_count=len(self.channel.exchange_manager.exchange_config.traded_symbol_pairs)
+        )
         while not self.should_stop and not self.channel.is_paused:
+            refresh_time = rest_requests_scheduler.get_refresh_time(self.CHANNEL_NAME)
             try:
-                for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
-                    await self.fetch_market_price(pair)
+                pairs = self._get_pairs_to_refresh(refresh_time)
+                fetched_mark_prices = await self._fetch_mark_prices(pairs)
+                # publish the whole cycle at once
+                for pair, (mark_price, funding_rate) in zip(pairs, fetched_mark_prices):
+                    mark_price = await self._push_mark_price(pair, mark_price, funding_rate)
+                    if self.pairs_polling_scheduler is not None:
+                        self.pairs_polling_scheduler.update_pair(pair, mark_price)
             except (errors.NotSupported, NotImplementedError):
                 self.logger.warning(f"{self.channel.exchange_manager.exchange_name} is not supporting updates")
                 await self.pause()
             finally:
-                await asyncio.sleep(self.refresh_time)
+                await asyncio.sleep(refresh_time if self.pairs_polling_scheduler is None
+                                    else self.pairs_polling_scheduler.get_tick_time())
+
+    def _get_pairs_to_refresh(self, refresh_time):
+        if self.pairs_polling_scheduler is None:
+            return self.channel.exchange_manager.exchange_config.traded_symbol_pairs
+        self.pairs_polling_scheduler.refresh_time = refresh_time
+        channels = [self.channel]
+        if self.channel.exchange_manager.exchange.FUNDING_WITH_MARK_PRICE:
+            channels.append(exchanges_channel.get_chan(constants.FUNDING_CHANNEL, self.channel.exchange_manager.id))
+        return self.pairs_polling_scheduler.get_pairs_to_refresh(
+            self.channel.exchange_manager.exchange_config.traded_symbol_pairs, channels
+        )
+
+    async def _fetch_mark_prices(self, pairs: list) -> list:
+        """
+        :return: the (mark price, funding rate) of each pair, in pairs order
+        """
+        if self.is_bulk_fetching and pairs:
+            try:
+                mark_prices = await self.channel.exchange_manager.exchange.get_mark_prices(pairs)
+                return [(mark_prices.get(pair), None) for pair in pairs]
+            except (errors.NotSupported, NotImplementedError):
+                self.logger.warning(f"{self.channel.exchange_manager.exchange_name} is not supporting bulk mark "
+                                    f"prices updates, fetching mark prices by pair")
+                self.is_bulk_fetching = False
+            except Exception as e:
+                self.logger.exception(e, True, f"Fail to update mark prices : {e}")
+                return [(None, None) for _ in pairs]
+        return await self.channel.exchange_manager.rest_requests_scheduler.gather_requests(
+            self._fetch_mark_price, pairs, concurrency=self.fetch_concurrency
+        )
 
     async def fetch_market_price(self, symbol: str):
+        mark_price, funding_rate = await self._fetch_mark_price(symbol)
+        return await self._push_mark_price(symbol, mark_price, funding_rate)
+
+    async def _fetch_mark_price(self, symbol: str):
         try:
             if self.channel.exchange_manager.exchange.FUNDING_WITH_MARK_PRICE:
                 mark_price, funding_rate = await self.channel.exchange_manager.exchange. \
                     get_mark_price_and_funding(symbol)
-                mark_price = decimal.Decimal(str(mark_price))
-                await self.push_funding_rate(symbol, funding_rate)
-            else:
-                mark_price = await self.channel.exchange_manager.exchange.get_mark_price(symbol)
+                return decimal.Decimal(str(mark_price)), funding_rate
+            return await self.channel.exchange_manager.exchange.get_mark_price(symbol), None
+        except (errors.NotSupported, NotImplementedError) as ne:
+            raise ne
+        except Exception as e:
+            self.logger.exception(e, True, f"Fail to update funding rate : {e}")
+        return None, None
 
+    async def _push_mark_price(self, symbol: str, mark_price, funding_rate):
+        """
+        :return: the pushed mark price value
+        """
+        try:
+            await self.push_funding_rate(symbol, funding_rate)
             if mark_price:
                 await self.push(symbol, mark_price[enums.ExchangeConstantsMarkPriceColumns.MARK_PRICE.value])
-        except (errors.NotSupported, NotImplementedError) as ne:
-            raise ne
+                return mark_price[enums.ExchangeConstantsMarkPriceColumns.MARK_PRICE.value]
         except Exception as e:
             self.logger.exception(e, True, f"Fail to update funding rate : {e}")
         return None
@@ -20,20 +20,41 @@ cimport octobot_trading.util as util
 cdef class PriceEventsManager(util.Initializable):
     cdef object logger
 
-    cdef list events
+    cdef dict events
+    cdef object _trigger_above_events
+    cdef object _trigger_below_events
+    cdef dict _trailing_events
     cdef list _last_recent_prices
+    cdef list _last_recent_price_times
+    cdef dict _event_callbacks
+    cdef object _triggered_callbacks
+    cdef object _callbacks_dispatch_task
 
     cpdef void reset(self)
     cpdef void handle_recent_trades(self, list recent_trades)
     cpdef void handle_price(self, object price, double timestamp)
     cpdef object new_event(self, object price, double timestamp, bint trigger_above, bint allow_instant_fill=*) # return asyncio.Event
+    cpdef object new_trailing_event(self, object price, double timestamp, bint trigger_above, object trailing_percent,
+                                    bint allow_instant_fill=*) # return asyncio.Event
+    cpdef object get_trailing_stop_price(self, object event)
+    cpdef void add_event_callback(self, object event, object callback)
     cpdef object remove_event(self, object event_to_remove) # object is an asyncio.Event
     cpdef void clear_recent_prices(self)
 
+    cdef void _schedule_triggered_callbacks(self)
     cdef bint _is_triggered_by_last_recent_prices(self, object price, double timestamp, bint trigger_above)
     cdef void _add_recent_price(self, object price, double timestamp)
     cdef object _remove_and_set_event(self, object event_to_set) # return to propagate errors
+    cdef void _add_event(self, tuple price_event_tuple)
     cdef object _remove_event(self, object event_to_remove) # object is an asyncio.Event
+    cdef object _get_price_events_index(self, bint trigger_above)
+    cdef list _check_recent_prices_events(self)
+    cdef list _check_trailing_events(self, list sorted_times, list sorted_prices, list max_prices_from_time,
+                                     list min_prices_from_time)
     cdef list _check_events(self, object price, double timestamp)
 
 cdef tuple _new_price_event(object price, double timestamp, bint trigger_above)
+cdef object _new_price_events_index()
+cdef object _get_trailing_stop_price(object reference_price, object trailing_rate, bint trigger_above)
+cdef bint _update_trailing_tracker(list trailing_tracker, list sorted_prices, int from_index,
+                                   object max_price, object min_price)
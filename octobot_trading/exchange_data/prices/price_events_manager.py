@@ -14,8 +14,12 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import asyncio
+import bisect
+import collections
 import decimal
 
+import sortedcontainers
+
 import octobot_commons.logging as logging
 from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
 
@@ -30,13 +34,26 @@ class PriceEventsManager:
     The price event index from a price event tuple
     """
     PRICE_EVENT_INDEX = 2
-    PRICE_KEY = "price"
-    TIME_KEY = "time"
+    PRICE_EVENT_PRICE_INDEX = 0
 
     def __init__(self):
         self.logger = logging.get_logger(self.__class__.__name__)
-        self.events = []
+        # event: price event tuple
+        self.events = {}
+        # price events sorted by price: triggered by a price higher or equal to their price
+        self._trigger_above_events = _new_price_events_index()
+        # price events sorted by price: triggered by a price lower or equal to their price
+        self._trigger_below_events = _new_price_events_index()
+        # trailing event: [extreme price, stop price, timestamp, trigger_above, trailing rate] trailing tracker
+        self._trailing_events = {}
+        # recent prices and their timestamps as parallel lists
         self._last_recent_prices = []
+        self._last_recent_price_times = []
+        # event: coroutine function to call when the event is set
+        self._event_callbacks = {}
+        # (event, callback) of set events, called in trigger order by a single dispatch task
+        self._triggered_callbacks = collections.deque()
+        self._callbacks_dispatch_task = None
 
     def reset(self):
         """
@@ -44,6 +61,11 @@ class PriceEventsManager:
         """
         self.clear_recent_prices()
         self.events.clear()
+        self._trailing_events.clear()
+        self._event_callbacks.clear()
+        self._triggered_callbacks.clear()
+        self._trigger_above_events.clear()
+        self._trigger_below_events.clear()
 
     def handle_recent_trades(self, recent_trades):
         """
@@ -53,14 +75,15 @@ class PriceEventsManager:
         # reset recent prices on new recent trades
         self.clear_recent_prices()
         for recent_trade in recent_trades:
-            price = decimal.Decimal(str(recent_trade[ECOC.PRICE.value]))
-            timestamp = recent_trade[ECOC.TIMESTAMP.value]
-            try:
-                self._add_recent_price(price, timestamp)
-                for event_to_set in self._check_events(price, timestamp):
-                    self._remove_and_set_event(event_to_set)
-            except KeyError:
-                self.logger.error("Error when checking price events with recent trades data")
+            self._add_recent_price(
+                decimal.Decimal(str(recent_trade[ECOC.PRICE.value])), recent_trade[ECOC.TIMESTAMP.value]
+            )
+        try:
+            for event_to_set in self._check_recent_prices_events():
+                self._remove_and_set_event(event_to_set)
+        except KeyError:
+            self.logger.error("Error when checking price events with recent trades data")
+        self._schedule_triggered_callbacks()
 
     def handle_price(self, price, timestamp):
         """
@@ -71,15 +94,15 @@ class PriceEventsManager:
         self._add_recent_price(price, timestamp)
         for event_to_set in self._check_events(price, timestamp):
             self._remove_and_set_event(event_to_set)
+        self._schedule_triggered_callbacks()
 
     def clear_recent_prices(self):
         self._last_recent_prices = []
+        self._last_recent_price_times = []
 
     def _add_recent_price(self, price, timestamp):
-        self._last_recent_prices.append({
-            self.PRICE_KEY: price,
-            self.TIME_KEY: timestamp
-        })
+        self._last_recent_prices.append(price)
+        self._last_recent_price_times.append(timestamp)
 
     def new_event(self, price, timestamp, trigger_above, allow_instant_fill=True):
         """
@@ -98,9 +121,40 @@ class PriceEventsManager:
             price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX].set()
         else:
             # this event will be set when conditions are met
-            self.events.append(price_event_tuple)
+            self._add_event(price_event_tuple)
         return price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]
 
+    def new_trailing_event(self, price, timestamp, trigger_above, trailing_percent, allow_instant_fill=True):
+        """
+        Create a new trailing stop event: its stop price follows the most favorable price received after timestamp
+        by trailing_percent and the event is set once the price reaches the stop price.
+        Trailing prices are updated in place, the event is never re-created.
+        :param price: the initial reference price
+        :param timestamp: the timestamp to wait for
+        :param trigger_above: True if waiting for an upper stop price (the reference price is the lowest price)
+        :param trailing_percent: the distance between the reference price and the stop price in percent
+        :param allow_instant_fill: True if recent prices should be checked to fill this event
+        :return: the price event
+        """
+        trailing_rate = trailing_percent / decimal.Decimal(100)
+        stop_price = _get_trailing_stop_price(price, trailing_rate, trigger_above)
+        event = asyncio.Event()
+        if allow_instant_fill and self._is_triggered_by_last_recent_prices(stop_price, timestamp, trigger_above):
+            event.set()
+        else:
+            self._trailing_events[event] = [price, stop_price, timestamp, trigger_above, trailing_rate]
+        return event
+
+    def get_trailing_stop_price(self, event):
+        """
+        :param event: the event returned by new_trailing_event()
+        :return: the current stop price of this trailing event, None if this event is not tracked
+        """
+        try:
+            return self._trailing_events[event][1]
+        except KeyError:
+            return None
+
     def _is_triggered_by_last_recent_prices(self, price, timestamp, trigger_above):
         """
         Check if the give price and time would be instantly triggered by last recent trades
@@ -109,20 +163,49 @@ class PriceEventsManager:
         :param trigger_above: True if waiting for an upper price
         :return: True if it would be triggered
         """
-        for recent_price in self._last_recent_prices:
-            trade_price = recent_price[self.PRICE_KEY]
-            if timestamp <= recent_price[self.TIME_KEY] and (
-                (trigger_above and price <= trade_price) or
-                (not trigger_above and price >= trade_price)
-            ):
+        for trade_price, trade_time in zip(self._last_recent_prices, self._last_recent_price_times):
+            if timestamp <= trade_time and (price <= trade_price if trigger_above else price >= trade_price):
                 return True
         return False
 
+    def add_event_callback(self, event, callback):
+        """
+        Call callback when event is set instead of waiting for it in a dedicated task.
+        Callbacks are awaited one after the other in the order their events are set.
+        :param event: the event returned by new_event()
+        :param callback: the coroutine function to call
+        """
+        if event.is_set():
+            self._triggered_callbacks.append((event, callback))
+            self._schedule_triggered_callbacks()
+        elif event in self.events or event in self._trailing_events:
+            self._event_callbacks[event] = callback
+
+    def _schedule_triggered_callbacks(self):
+        if self._triggered_callbacks and (
+            self._callbacks_dispatch_task is None or self._callbacks_dispatch_task.done()
+        ):
+            self._callbacks_dispatch_task = asyncio.create_task(self._dispatch_triggered_callbacks())
+
+    async def _dispatch_triggered_callbacks(self):
+        while self._triggered_callbacks:
+            _, callback = self._triggered_callbacks.popleft()
+            try:
+                await callback()
+            except Exception as e:
+                self.logger.exception(e, True, f"Error when calling price event callback: {e}")
+
     def remove_event(self, event_to_remove):
         """
-        Public method that calls _remove_event()
+        Public method that calls _remove_event() and drops the event callback if it is already triggered
         :param event_to_remove: the event to remove
         """
+        if self._triggered_callbacks:
+            triggered_callbacks = collections.deque()
+            for triggered_callback in self._triggered_callbacks:
+                if triggered_callback[0] is not event_to_remove:
+                    triggered_callbacks.append(triggered_callback)
+            self._triggered_callbacks = triggered_callbacks
         return self._remove_event(event_to_remove)
 
     def _remove_and_set_event(self, event_to_set):
@@ -132,33 +215,112 @@ class PriceEventsManager:
         :return: the event index removed from event list
         """
         event_to_set.set()
+        callback = self._event_callbacks.pop(event_to_set, None)
+        if callback is not None:
+            self._triggered_callbacks.append((event_to_set, callback))
         return self._remove_event(event_to_set)
 
+    def _add_event(self, price_event_tuple):
+        """
+        Add the event to events and to its price index
+        :param price_event_tuple: the price event to add
+        """
+        self.events[price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]] = price_event_tuple
+        self._get_price_events_index(price_event_tuple[-1]).add(price_event_tuple)
+
     def _remove_event(self, event_to_remove):
         """
-        Remove the event from events list
+        Remove the event from events and from its price index
         :param event_to_remove: the event to remove
         """
-        for price_event_data in self.events:
-            if event_to_remove in price_event_data:
-                return self.events.remove(price_event_data)
+        self._event_callbacks.pop(event_to_remove, None)
+        self._trailing_events.pop(event_to_remove, None)
+        price_event_tuple = self.events.pop(event_to_remove, None)
+        if price_event_tuple is not None:
+            self._get_price_events_index(price_event_tuple[-1]).remove(price_event_tuple)
+
+    def _get_price_events_index(self, trigger_above):
+        return self._trigger_above_events if trigger_above else self._trigger_below_events
+
+    def _check_recent_prices_events(self):
+        """
+        Check every event against every recent price in a single pass: an event is triggered when the
+        highest (or lowest) recent price at or after its timestamp reaches its price.
+        :return: the event list that match
+        """
+        if len(self._last_recent_prices) < 2:
+            if self._last_recent_prices:
+                return self._check_events(self._last_recent_prices[0], self._last_recent_price_times[0])
+            return []
+        if not self.events and not self._trailing_events:
+            return []
+        # sort recent prices by time and compute the highest and lowest prices from each time onwards
+        sorted_indexes = sorted(
+            range(len(self._last_recent_price_times)), key=self._last_recent_price_times.__getitem__
+        )
+        sorted_times = [self._last_recent_price_times[index] for index in sorted_indexes]
+        sorted_prices = [self._last_recent_prices[index] for index in sorted_indexes]
+        max_prices_from_time = list(sorted_prices)
+        min_prices_from_time = list(sorted_prices)
+        for index in range(len(sorted_indexes) - 2, -1, -1):
+            max_prices_from_time[index] = max(max_prices_from_time[index], max_prices_from_time[index + 1])
+            min_prices_from_time[index] = min(min_prices_from_time[index], min_prices_from_time[index + 1])
+        events = []
+        for event_price, event_timestamp, event, _ in \
+                self._trigger_above_events.irange_key(max_key=max_prices_from_time[0]):
+            time_index = bisect.bisect_left(sorted_times, event_timestamp)
+            if time_index < len(sorted_times) and event_price <= max_prices_from_time[time_index]:
+                events.append(event)
+        for event_price, event_timestamp, event, _ in \
+                self._trigger_below_events.irange_key(min_key=min_prices_from_time[0]):
+            time_index = bisect.bisect_left(sorted_times, event_timestamp)
+            if time_index < len(sorted_times) and event_price >= min_prices_from_time[time_index]:
+                events.append(event)
+        if self._trailing_events:
+            events += self._check_trailing_events(
+                sorted_times, sorted_prices, max_prices_from_time, min_prices_from_time
+            )
+        return events
+
+    def _check_trailing_events(self, sorted_times, sorted_prices, max_prices_from_time, min_prices_from_time):
+        """
+        Update trailing events stop prices with the given prices and check if they should be triggered
+        :param sorted_times: the prices timestamps, sorted
+        :param sorted_prices: the prices, sorted by timestamp
+        :param max_prices_from_time: the highest price from each time onwards
+        :param min_prices_from_time: the lowest price from each time onwards
+        :return: the event list that match
+        """
+        events = []
+        for event, trailing_tracker in self._trailing_events.items():
+            time_index = bisect.bisect_left(sorted_times, trailing_tracker[2])
+            if time_index < len(sorted_times) and _update_trailing_tracker(
+                trailing_tracker, sorted_prices, time_index,
+                max_prices_from_time[time_index], min_prices_from_time[time_index]
+            ):
+                events.append(event)
+        return events
 
     def _check_events(self, price, timestamp):
         """
-        Check for each price, timestamp pair event if it should be triggered
+        Check for each price, timestamp pair event if it should be triggered.
+        Only events which price is reached by the given price are iterated over.
         :param price: the price used to check
         :param timestamp: the timestamp used to check
         :return: the event list that match
         """
-        return [
+        events = [
             event
-            for event_price, event_timestamp, event, trigger_above in self.events
-            if event_timestamp <= timestamp and
-            (
-                (trigger_above and event_price <= price) or
-                (not trigger_above and event_price >= price)
-            )
+            for _, event_timestamp, event, _ in self._trigger_above_events.irange_key(max_key=price)
+            if event_timestamp <= timestamp
+        ] + [
+            event
+            for _, event_timestamp, event, _ in self._trigger_below_events.irange_key(min_key=price)
+            if event_timestamp <= timestamp
         ]
+        if self._trailing_events:
+            events += self._check_trailing_events([timestamp], [price], [price], [price])
+        return events
 
 
 def _new_price_event(price, timestamp, trigger_above):
@@ -170,3 +332,48 @@ def _new_price_event(price, timestamp, trigger_above):
     :return: a tuple to be added into events list
     """
     return price, timestamp, asyncio.Event(), trigger_above
+
+
+def _get_trailing_stop_price(reference_price, trailing_rate, trigger_above):
+    """
+    :return: the stop price of a trailing event following reference_price
+    """
+    return reference_price * (1 + trailing_rate) if trigger_above else reference_price * (1 - trailing_rate)
+
+
+def _update_trailing_tracker(trailing_tracker, sorted_prices, from_index, max_price, min_price):
+    """
+    Update the trailing tracker reference and stop prices with prices from from_index, in time order
+    :param trailing_tracker: the trailing tracker to update
+    :param sorted_prices: the prices, sorted by timestamp
+    :param from_index: the index of the first price to consider in sorted_prices
+    :param max_price: the highest price from from_index
+    :param min_price: the lowest price from from_index
+    :return: True when the stop price is reached
+    """
+    reference_price, _, _, trigger_above, trailing_rate = trailing_tracker
+    # the stop price can only be reached when the most favorable possible stop price is reached
+    best_reference_price = min(reference_price, min_price) if trigger_above else max(reference_price, max_price)
+    best_stop_price = _get_trailing_stop_price(best_reference_price, trailing_rate, trigger_above)
+    if (trigger_above and max_price < best_stop_price) or (not trigger_above and min_price > best_stop_price):
+        trailing_tracker[0] = best_reference_price
+        trailing_tracker[1] = best_stop_price
+        return False
+    for price in sorted_prices[from_index:]:
+        if (trigger_above and price < trailing_tracker[0]) or (not trigger_above and price > trailing_tracker[0]):
+            trailing_tracker[0] = price
+            trailing_tracker[1] = _get_trailing_stop_price(price, trailing_rate, trigger_above)
+        elif (trigger_above and price >= trailing_tracker[1]) or (not trigger_above and price <= trailing_tracker[1]):
+            return True
+    return False
+
+
+def _get_price_event_price(price_event_tuple):
+    return price_event_tuple[PriceEventsManager.PRICE_EVENT_PRICE_INDEX]
+
+
+def _new_price_events_index():
+    """
+    :return: a price events container sorted by price
+    """
+    return sortedcontainers.SortedKeyList(key=_get_price_event_price)
@@ -29,13 +29,23 @@ cdef class PricesManager(util.Initializable):
 
     cdef dict mark_price_from_sources
 
+    cdef public str mark_price_estimator
+    cdef public double mark_price_estimator_half_life
+    cdef double _estimated_mark_price
+    cdef double _estimated_mark_price_weight
+    cdef double _estimated_mark_price_time
+
     cdef void _set_mark_price_value(self, object mark_price)
     cdef void _reset_prices(self)
     cdef void _ensure_price_validity(self)
     cdef bint _are_other_sources_valid(self, str mark_price_source)
     cdef int _compute_mark_price_validity_timeout(self)
+    cdef void _reset_estimated_mark_price(self)
+    cdef void _add_trade_to_estimated_mark_price(self, double price, double weight, double timestamp)
 
     cpdef bint set_mark_price(self, object mark_price, str mark_price_source)
     cpdef bint initialized(self)
+    cpdef void set_mark_price_estimator(self, str mark_price_estimator, object half_life=*)
+    cpdef object update_estimated_mark_price(self, list recent_trades)
 
 cpdef object calculate_mark_price_from_recent_trade_prices(list recent_trade_prices)
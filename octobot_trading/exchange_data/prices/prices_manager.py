@@ -36,6 +36,13 @@ class PricesManager(util.Initializable):
         self.logger = logging.get_logger(f"{self.__class__.__name__}[{self.exchange_manager.exchange_name}]")
         self.price_validity = self._compute_mark_price_validity_timeout()
 
+        # recent trades mark price estimation, see MarkPriceEstimators
+        self.mark_price_estimator = constants.RECENT_TRADES_MARK_PRICE_ESTIMATOR
+        self.mark_price_estimator_half_life = constants.RECENT_TRADES_MARK_PRICE_HALF_LIFE
+        self._estimated_mark_price = 0
+        self._estimated_mark_price_weight = 0
+        self._estimated_mark_price_time = 0
+
         # warning: should only be created in the async loop thread
         self.valid_price_received_event = asyncio.Event()
 
@@ -84,6 +91,67 @@ class PricesManager(util.Initializable):
                 (mark_price, self.exchange_manager.exchange.get_exchange_current_time())
         return is_mark_price_updated
 
+    def set_mark_price_estimator(self, mark_price_estimator, half_life=None):
+        """
+        Select the recent trades mark price estimator and reset the current estimation
+        :param mark_price_estimator: the MarkPriceEstimators value to use
+        :param half_life: seconds after which a trade weights half as much in time decayed estimators
+        """
+        self.mark_price_estimator = enums.MarkPriceEstimators(mark_price_estimator).value
+        if half_life is not None:
+            self.mark_price_estimator_half_life = half_life
+        self._reset_estimated_mark_price()
+
+    def update_estimated_mark_price(self, recent_trades):
+        """
+        Update the recent trades mark price estimation using self.mark_price_estimator
+        :param recent_trades: the new recent trades
+        :return: the estimated mark price as a decimal.Decimal, None when there is no recent trade
+        """
+        if not recent_trades:
+            return None
+        if self.mark_price_estimator == enums.MarkPriceEstimators.LAST.value:
+            mark_price = decimal.Decimal(str(recent_trades[-1][enums.ExchangeConstantsOrderColumns.PRICE.value]))
+            self._estimated_mark_price = float(mark_price)
+            return mark_price
+        if self.mark_price_estimator == enums.MarkPriceEstimators.MEAN.value:
+            recent_trade_prices = []
+            for recent_trade in recent_trades:
+                recent_trade_prices.append(
+                    decimal.Decimal(str(recent_trade[enums.ExchangeConstantsOrderColumns.PRICE.value]))
+                )
+            mark_price = calculate_mark_price_from_recent_trade_prices(recent_trade_prices)
+            self._estimated_mark_price = float(mark_price)
+            return mark_price
+        is_volume_weighted = self.mark_price_estimator == enums.MarkPriceEstimators.VWAP.value
+        for recent_trade in recent_trades:
+            self._add_trade_to_estimated_mark_price(
+                float(recent_trade[enums.ExchangeConstantsOrderColumns.PRICE.value]),
+                float(recent_trade.get(enums.ExchangeConstantsOrderColumns.AMOUNT.value) or 0)
+                if is_volume_weighted else 1,
+                recent_trade.get(enums.ExchangeConstantsOrderColumns.TIMESTAMP.value) or 0
+            )
+        return decimal.Decimal(str(self._estimated_mark_price))
+
+    def _add_trade_to_estimated_mark_price(self, price, weight, timestamp):
+        """
+        Add a trade to the time decayed weighted mean price
+        :param price: the trade price
+        :param weight: the trade weight
+        :param timestamp: the trade timestamp
+        """
+        if self._estimated_mark_price_weight and self.mark_price_estimator_half_life > 0 \
+           and timestamp > self._estimated_mark_price_time:
+            self._estimated_mark_price_weight *= \
+                0.5 ** ((timestamp - self._estimated_mark_price_time) / self.mark_price_estimator_half_life)
+        self._estimated_mark_price_time = max(self._estimated_mark_price_time, timestamp)
+        total_weight = self._estimated_mark_price_weight + weight
+        if total_weight > 0:
+            self._estimated_mark_price += (price - self._estimated_mark_price) * weight / total_weight
+        elif not self._estimated_mark_price:
+            self._estimated_mark_price = price
+        self._estimated_mark_price_weight = total_weight
+
     async def get_mark_price(self, timeout=MARK_PRICE_FETCH_TIMEOUT):
         """
         Return mark price if valid
@@ -159,6 +227,12 @@ class PricesManager(util.Initializable):
         self.mark_price_set_time = 0
         self.valid_price_received_event.clear()
         self.mark_price_from_sources = {}
+        self._reset_estimated_mark_price()
+
+    def _reset_estimated_mark_price(self):
+        self._estimated_mark_price = 0
+        self._estimated_mark_price_weight = 0
+        self._estimated_mark_price_time = 0
 
 
 def calculate_mark_price_from_recent_trade_prices(recent_trade_prices):
@@ -48,6 +48,10 @@ class RecentTradeUpdater(recent_trade_channel.RecentTradeProducer):
             self.refresh_time = 9
         elif refresh_threshold is enums.RestExchangePairsRefreshMaxThresholds.SLOW:
             self.refresh_time = 15
+        self.channel.exchange_manager.rest_requests_scheduler.register_feed(
+            self.CHANNEL_NAME, self.refresh_time, enums.RestRequestsPriorities.LOW,
+            requests_count=len(self.channel.exchange_manager.exchange_config.traded_symbol_pairs)
+        )
         await self.init_recent_trades()
         # check if channel is not None to avoid attribute error if channel has been concurrently closed
         if self.channel is not None:
@@ -57,9 +61,11 @@ class RecentTradeUpdater(recent_trade_channel.RecentTradeProducer):
                 await self.start_update_loop()
 
     async def start_update_loop(self):
+        rest_requests_scheduler = self.channel.exchange_manager.rest_requests_scheduler
         while not self.should_stop and not self.channel.is_paused:
             try:
                 for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
+                    await rest_requests_scheduler.reserve_requests()
                     recent_trades = await self.channel.exchange_manager.exchange.\
                         get_recent_trades(pair, limit=self.RECENT_TRADE_LIMIT)
                     if recent_trades:
@@ -67,7 +73,7 @@ class RecentTradeUpdater(recent_trade_channel.RecentTradeProducer):
                             await self.push(pair, recent_trades)
                         except TypeError:
                             pass
-                await asyncio.sleep(self.refresh_time)
+                await asyncio.sleep(rest_requests_scheduler.get_refresh_time(self.CHANNEL_NAME))
             except errors.FailedRequest as e:
                 self.logger.warning(str(e))
                 # avoid spamming on disconnected situation
@@ -19,12 +19,19 @@ cimport octobot_trading.util as util
 cdef class RecentTradesManager(util.Initializable):
     cdef object logger
 
+    cdef public int max_recent_trades_count
+    cdef public int max_liquidations_count
     cdef public object recent_trades
     cdef public object liquidations
+    cdef object _recent_trade_keys
+    cdef object _liquidation_keys
 
     cdef void _reset_recent_trades(self)
+    cdef list _add_new_elements(self, list elements, object elements_deque, object elements_keys)
 
     cpdef list set_all_recent_trades(self, list recent_trades)
     cpdef list add_new_trades(self, list recent_trades)
 
     cpdef list add_new_liquidations(self, list liquidations)
+
+cdef object _get_trade_key(dict trade)
@@ -17,18 +17,25 @@ import collections
 
 import octobot_commons.logging as logging
 
+import octobot_trading.constants as constants
 import octobot_trading.util as util
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
 
 
 class RecentTradesManager(util.Initializable):
-    MAX_RECENT_TRADES_COUNT = 100
+    MAX_RECENT_TRADES_COUNT = constants.MAX_RECENT_TRADES_COUNT
     MAX_LIQUIDATIONS_COUNT = 20
 
-    def __init__(self):
+    def __init__(self, max_recent_trades_count=None, max_liquidations_count=None):
         super().__init__()
         self.logger = logging.get_logger(self.__class__.__name__)
-        self.recent_trades = collections.deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
-        self.liquidations = collections.deque(maxlen=self.MAX_LIQUIDATIONS_COUNT)
+        self.max_recent_trades_count = max_recent_trades_count or self.MAX_RECENT_TRADES_COUNT
+        self.max_liquidations_count = max_liquidations_count or self.MAX_LIQUIDATIONS_COUNT
+        self.recent_trades = collections.deque(maxlen=self.max_recent_trades_count)
+        self.liquidations = collections.deque(maxlen=self.max_liquidations_count)
+        # keys of the trades and liquidations in recent_trades and liquidations, in the same order
+        self._recent_trade_keys = collections.OrderedDict()
+        self._liquidation_keys = collections.OrderedDict()
         self._reset_recent_trades()
 
     async def initialize_impl(self):
@@ -36,27 +43,55 @@ class RecentTradesManager(util.Initializable):
 
     def set_all_recent_trades(self, recent_trades):
         if recent_trades:
-            self.recent_trades = recent_trades
-            return self.recent_trades
+            self.recent_trades = collections.deque(maxlen=self.max_recent_trades_count)
+            self._recent_trade_keys = collections.OrderedDict()
+            # fill both at once to keep keys in sync with recent_trades when duplicated trades are given
+            self._add_new_elements(recent_trades, self.recent_trades, self._recent_trade_keys)
+            return recent_trades
 
     def add_new_trades(self, recent_trades):
         if recent_trades:
-            new_recent_trades: list = [
-                trade
-                for trade in recent_trades
-                if trade not in self.recent_trades]
-            self.recent_trades.extend(new_recent_trades)
-            return new_recent_trades
+            return self._add_new_elements(recent_trades, self.recent_trades, self._recent_trade_keys)
 
     def add_new_liquidations(self, liquidations):
         if liquidations:
-            new_liquidations: list = [
-                liquidation
-                for liquidation in liquidations
-                if liquidation not in self.liquidations]
-            self.liquidations.extend(new_liquidations)
-            return new_liquidations
+            return self._add_new_elements(liquidations, self.liquidations, self._liquidation_keys)
+
+    def _add_new_elements(self, elements, elements_deque, elements_keys):
+        """
+        Add the elements that are not already in elements_deque to it
+        :param elements: the trades or liquidations to add
+        :param elements_deque: the bounded deque to add elements to
+        :param elements_keys: the keys of elements_deque elements
+        :return: the added elements
+        """
+        new_elements = []
+        for element in elements:
+            key = _get_trade_key(element)
+            if key not in elements_keys:
+                elements_keys[key] = None
+                new_elements.append(element)
+        # forget keys of the elements removed from elements_deque
+        while len(elements_keys) > elements_deque.maxlen:
+            elements_keys.popitem(last=False)
+        elements_deque.extend(new_elements)
+        return new_elements
 
     def _reset_recent_trades(self):
-        self.recent_trades = collections.deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
-        self.liquidations = collections.deque(maxlen=self.MAX_LIQUIDATIONS_COUNT)
+        self.recent_trades = collections.deque(maxlen=self.max_recent_trades_count)
+        self.liquidations = collections.deque(maxlen=self.max_liquidations_count)
+        self._recent_trade_keys.clear()
+        self._liquidation_keys.clear()
+
+
+def _get_trade_key(trade):
+    """
+    :return: the trade id when available, its timestamp, price, amount and side otherwise
+    """
+    trade_id = trade.get(ECOC.ID.value)
+    if trade_id is not None:
+        return trade_id
+    return (
+        trade.get(ECOC.TIMESTAMP.value), trade.get(ECOC.PRICE.value),
+        trade.get(ECOC.AMOUNT.value), trade.get(ECOC.SIDE.value)
+    )
@@ -135,6 +135,7 @@ class TickerProducer(exchanges_channel.ExchangeChannelProducer):
 class TickerChannel(exchanges_channel.ExchangeChannel):
     PRODUCER_CLASS = TickerProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    CONFLATION_INTERVAL = constants.TICKER_CONFLATION_INTERVAL
 
 
 class MiniTickerProducer(exchanges_channel.ExchangeChannelProducer):
@@ -15,12 +15,21 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 cimport octobot_trading.exchange_data.ticker.channel.ticker as ticker_channel
+cimport octobot_trading.exchange_data.pairs_polling_scheduler as pairs_polling_scheduler
 
 cdef class TickerUpdater(ticker_channel.TickerProducer):
     cdef list _added_pairs
     cdef bint is_fetching_future_data
     cdef int refresh_time
+    cdef public bint is_bulk_fetching
+    cdef public int bulk_fetch_chunk_size
+    cdef public pairs_polling_scheduler.PairsPollingScheduler pairs_polling_scheduler
 
     cdef list _get_pairs_to_update(self)
     cdef bint _should_use_future(self)
     cdef void _update_refresh_time(self)
+    cdef void _register_rest_feed(self)
+    cdef list _get_bulk_fetch_chunks(self, list pairs)
+    cdef list _get_pairs_to_refresh(self)
+    cdef void _on_pair_refreshed(self, str pair, object price)
+    cdef double _get_sleep_time(self)
@@ -18,7 +18,9 @@ import asyncio
 
 import octobot_trading.errors as errors
 import octobot_trading.constants as constants
+import octobot_trading.exchange_channel as exchanges_channel
 import octobot_trading.exchange_data.ticker.channel.ticker as ticker_channel
+import octobot_trading.exchange_data.pairs_polling_scheduler as pairs_polling_scheduler
 import octobot_trading.enums as enums
 
 
@@ -33,27 +35,44 @@ class TickerUpdater(ticker_channel.TickerProducer):
         self._added_pairs = []
         self.is_fetching_future_data = False
         self.refresh_time = self.TICKER_REFRESH_TIME
+        # when True, tickers are fetched using get_all_currencies_price_ticker
+        self.is_bulk_fetching = constants.ENABLE_BULK_TICKERS_FETCH
+        # max symbols per bulk request, 0 for every pair in one request. Reduced when bulk requests fail
+        self.bulk_fetch_chunk_size = constants.BULK_TICKERS_FETCH_CHUNK_SIZE
+        # when set, only consumed pairs are fetched, each at its own adaptive refresh time
+        self.pairs_polling_scheduler = pairs_polling_scheduler.PairsPollingScheduler(
+            channel.exchange_manager, self.refresh_time
+        ) if constants.ENABLE_ADAPTIVE_PAIRS_POLLING else None
 
     async def start(self):
         if self._should_use_future():
             self.is_fetching_future_data = True
             self.refresh_time = self.TICKER_FUTURE_REFRESH_TIME
+        self._register_rest_feed()
         if self.channel.is_paused:
             await self.pause()
         else:
             # initialize ticker
-            await asyncio.gather(*[self._fetch_ticker(pair)
-                                   for pair in self._get_pairs_to_update()])
-            await asyncio.sleep(self.refresh_time)
+            if self.is_bulk_fetching:
+                self._update_refresh_time()
+                await self._fetch_all_tickers(self._get_pairs_to_update())
+            else:
+                await asyncio.gather(*[self._fetch_ticker(pair)
+                                       for pair in self._get_pairs_to_update()])
+            await asyncio.sleep(self._get_sleep_time())
             await self.start_update_loop()
 
     async def start_update_loop(self):
         while not self.should_stop and not self.channel.is_paused:
             try:
-                for pair in self._get_pairs_to_update():
-                    await self._fetch_ticker(pair)
-
-                await asyncio.sleep(self.refresh_time)
+                pairs = self._get_pairs_to_refresh()
+                if self.is_bulk_fetching:
+                    await self._fetch_all_tickers(pairs)
+                else:
+                    for pair in pairs:
+                        await self._fetch_ticker(pair)
+
+                await asyncio.sleep(self._get_sleep_time())
             except errors.NotSupported:
                 self.logger.warning(f"{self.channel.exchange_manager.exchange_name} is not supporting updates")
                 await self.pause()
@@ -62,16 +81,98 @@ class TickerUpdater(ticker_channel.TickerProducer):
 
     async def _fetch_ticker(self, pair):
         try:
+            await self.channel.exchange_manager.rest_requests_scheduler.reserve_requests()
             ticker: dict = await self.channel.exchange_manager.exchange.get_price_ticker(pair)
             if self._is_valid(ticker):
                 await self.push(pair, ticker)
+                self._on_pair_refreshed(pair, ticker[enums.ExchangeConstantsTickersColumns.CLOSE.value])
             else:
                 self.logger.debug(f"Ignored incomplete ticker: {ticker}")
+                self._on_pair_refreshed(pair, None)
         except errors.FailedRequest as e:
+            self._on_pair_refreshed(pair, None)
             self.logger.warning(str(e))
             # avoid spamming on disconnected situation
             await asyncio.sleep(constants.DEFAULT_FAILED_REQUEST_RETRY_TIME)
 
+    async def _fetch_all_tickers(self, pairs):
+        """
+        Fetch and push the tickers of the given pairs using as few requests as possible
+        """
+        chunks = self._get_bulk_fetch_chunks(pairs)
+        for index, chunk_pairs in enumerate(chunks):
+            try:
+                await self._fetch_tickers(chunk_pairs)
+            except (errors.NotSupported, NotImplementedError):
+                self.logger.warning(f"{self.channel.exchange_manager.exchange_name} is not supporting bulk tickers "
+                                    f"fetching, fetching tickers pair by pair")
+                self.is_bulk_fetching = False
+                self._update_refresh_time()
+                # fetch the remaining tickers of this update
+                for remaining_chunk_pairs in chunks[index:]:
+                    for pair in remaining_chunk_pairs:
+                        await self._fetch_ticker(pair)
+                return
+
+    async def _fetch_tickers(self, pairs):
+        try:
+            await self.channel.exchange_manager.rest_requests_scheduler.reserve_requests()
+            tickers: dict = await self.channel.exchange_manager.exchange.get_all_currencies_price_ticker(
+                symbols=pairs
+            ) or {}
+        except errors.FailedRequest as e:
+            for pair in pairs:
+                self._on_pair_refreshed(pair, None)
+            self.logger.warning(str(e))
+            if len(pairs) > 1:
+                # the exchange might be limiting symbols per request: use smaller requests from now on
+                self.bulk_fetch_chunk_size = (len(pairs) + 1) // 2
+                self._update_refresh_time()
+                self.logger.info(f"Fetching at most {self.bulk_fetch_chunk_size} tickers per request")
+            # avoid spamming on disconnected situation
+            await asyncio.sleep(constants.DEFAULT_FAILED_REQUEST_RETRY_TIME)
+            return
+        for pair in pairs:
+            ticker = tickers.get(pair)
+            if self._is_valid(ticker):
+                await self.push(pair, ticker)
+                self._on_pair_refreshed(pair, ticker[enums.ExchangeConstantsTickersColumns.CLOSE.value])
+            else:
+                self.logger.debug(f"Ignored incomplete or missing {pair} ticker: {ticker}")
+                self._on_pair_refreshed(pair, None)
+
+    def _get_pairs_to_refresh(self):
+        if self.pairs_polling_scheduler is None:
+            return self._get_pairs_to_update()
+        channels = [
+            self.channel,
+            exchanges_channel.get_chan(constants.MINI_TICKER_CHANNEL, self.channel.exchange_manager.id)
+        ]
+        if self.is_fetching_future_data:
+            channels += [
+                exchanges_channel.get_chan(constants.MARK_PRICE_CHANNEL, self.channel.exchange_manager.id),
+                exchanges_channel.get_chan(constants.FUNDING_CHANNEL, self.channel.exchange_manager.id),
+            ]
+        return self.pairs_polling_scheduler.get_pairs_to_refresh(self._get_pairs_to_update(), channels)
+
+    def _on_pair_refreshed(self, pair, price):
+        if self.pairs_polling_scheduler is not None:
+            self.pairs_polling_scheduler.update_pair(pair, price)
+
+    def _get_sleep_time(self):
+        refresh_time = self.channel.exchange_manager.rest_requests_scheduler.get_refresh_time(self.CHANNEL_NAME)
+        if self.pairs_polling_scheduler is None:
+            return refresh_time
+        self.pairs_polling_scheduler.refresh_time = refresh_time
+        return self.pairs_polling_scheduler.get_tick_time()
+
+    def _get_bulk_fetch_chunks(self, pairs):
+        chunk_size = self.bulk_fetch_chunk_size or len(pairs) or 1
+        return [
+            pairs[index:index + chunk_size]
+            for index in range(0, len(pairs), chunk_size)
+        ]
+
     @staticmethod
     def _is_valid(ticker):
         try:
@@ -120,11 +221,25 @@ class TickerUpdater(ticker_channel.TickerProducer):
         if self.is_fetching_future_data:
             # do not change ticker update rate on futures
             return
-        pairs_to_update_count = len(self._get_pairs_to_update())
-        delay_multiplier = pairs_to_update_count // self.TICKER_REFRESH_DELAY_THRESHOLD + 1
+        if self.is_bulk_fetching:
+            # refresh time only depends on the number of requests
+            requests_count = len(self._get_bulk_fetch_chunks(self._get_pairs_to_update()))
+            delay_multiplier = requests_count // self.TICKER_REFRESH_DELAY_THRESHOLD + 1
+        else:
+            pairs_to_update_count = len(self._get_pairs_to_update())
+            delay_multiplier = pairs_to_update_count // self.TICKER_REFRESH_DELAY_THRESHOLD + 1
         # there can be many ticker requests when a large number of currency is in a
         # portfolio, in this case, limit those requests
         self.refresh_time = self.TICKER_REFRESH_TIME * delay_multiplier
+        self._register_rest_feed()
+
+    def _register_rest_feed(self):
+        pairs_to_update = self._get_pairs_to_update()
+        self.channel.exchange_manager.rest_requests_scheduler.register_feed(
+            self.CHANNEL_NAME, self.refresh_time, enums.RestRequestsPriorities.MEDIUM,
+            requests_count=len(self._get_bulk_fetch_chunks(pairs_to_update))
+            if self.is_bulk_fetching else len(pairs_to_update)
+        )
 
     async def resume(self) -> None:
         await super().resume()
@@ -47,6 +47,7 @@ from octobot_trading.exchanges.exchange_manager cimport (
     ExchangeManager,
 )
 from octobot_trading.exchanges.util cimport (
+    RestRequestsScheduler,
     ExchangeMarketStatusFixer,
     is_ms_valid,
     force_disable_web_socket,
@@ -58,6 +59,7 @@ from octobot_trading.exchanges.types cimport (
     RestExchange,
 )
 from octobot_trading.exchanges.util cimport (
+    RestRequestsScheduler,
     ExchangeMarketStatusFixer,
     is_ms_valid,
     get_rest_exchange_class,
@@ -114,6 +116,7 @@ __all__ = [
     "BasicExchangeWrapper",
     "RestExchange",
     "WebSocketExchange",
+    "RestRequestsScheduler",
     "ExchangeMarketStatusFixer",
     "is_ms_valid",
     "AbstractWebsocketExchange",
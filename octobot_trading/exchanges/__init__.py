@@ -60,6 +60,7 @@ from octobot_trading.exchanges.exchange_factory import (
     init_simulated_exchange,
 )
 from octobot_trading.exchanges.util import (
+    RestRequestsScheduler,
     ExchangeMarketStatusFixer,
     is_ms_valid,
     get_rest_exchange_class,
@@ -68,6 +69,7 @@ from octobot_trading.exchanges.util import (
     get_partners_explanation_message,
     is_compatible_account,
     get_historical_ohlcv,
+    get_concurrent_historical_ohlcv,
     get_exchange_type,
     get_default_exchange_type,
     get_supported_exchange_types,
@@ -138,6 +140,7 @@ __all__ = [
     "get_partners_explanation_message",
     "is_compatible_account",
     "get_historical_ohlcv",
+    "get_concurrent_historical_ohlcv",
     "get_exchange_type",
     "get_default_exchange_type",
     "get_supported_exchange_types",
@@ -158,6 +161,7 @@ __all__ = [
     "CCXTWebsocketConnector",
     "WebSocketExchange",
     "RestExchange",
+    "RestRequestsScheduler",
     "ExchangeMarketStatusFixer",
     "is_ms_valid",
     "AbstractWebsocketExchange",
@@ -221,6 +221,22 @@ class AbstractExchange(util.Initializable):
         """
         raise NotImplementedError("get_all_currencies_price_ticker is not implemented")
 
+    async def get_mark_prices(self, symbols: list, **kwargs: dict) -> dict:
+        """
+        Get the mark price of each symbol using a single request
+        :param symbols: the symbols
+        :return: the mark price dict of each symbol by symbol
+        """
+        raise NotImplementedError("get_mark_prices is not implemented")
+
+    async def get_funding_rates(self, symbols: list, **kwargs: dict) -> dict:
+        """
+        Get the funding rate of each symbol using a single request
+        :param symbols: the symbols
+        :return: the funding rate dict of each symbol by symbol
+        """
+        raise NotImplementedError("get_funding_rates is not implemented")
+
     async def get_order(self, order_id: str, symbol: str = None, **kwargs: dict) -> dict:
         """
         Get the order data from the exchange
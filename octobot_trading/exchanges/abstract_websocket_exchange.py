@@ -80,8 +80,11 @@ class AbstractWebsocketExchange:
 
     async def push_to_channel(self, channel_name, *args, **kwargs):
         try:
+            channel = exchange_channel.get_chan(channel_name, self.exchange_id)
+            producer = channel.get_internal_producer()
             asyncio.run_coroutine_threadsafe(
-                exchange_channel.get_chan(channel_name, self.exchange_id).get_internal_producer().push(*args, **kwargs),
+                producer.conflated_push(*args, **kwargs) if channel.conflation_interval
+                else producer.push(*args, **kwargs),
                 self.bot_mainloop)
         except Exception as e:
             self.logger.error(f"Push to {channel_name} failed : {e}")
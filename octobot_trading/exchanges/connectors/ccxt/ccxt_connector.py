@@ -444,6 +444,14 @@ class CCXTConnector(abstract_exchange.AbstractExchange):
             await self.client.fetch_funding_rate(symbol=symbol, params=kwargs)
         )
 
+    async def get_funding_rates(self, symbols: list, **kwargs: dict) -> dict:
+        if not self.client.has.get("fetchFundingRates"):
+            raise octobot_trading.errors.NotSupported("fetch_funding_rates is not supported")
+        return {
+            symbol: self.adapter.adapt_funding_rate(funding_rate)
+            for symbol, funding_rate in (await self.client.fetch_funding_rates(symbols=symbols, params=kwargs)).items()
+        }
+
     async def get_funding_rate_history(self, symbol: str, limit: int = 1, **kwargs: dict) -> list:
         return self.adapter.adapt_funding_rate(
             await self.client.fetch_funding_rate_history(symbol=symbol, limit=limit, params=kwargs)
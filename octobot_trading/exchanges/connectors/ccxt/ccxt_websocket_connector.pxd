@@ -23,6 +23,7 @@ cdef class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketE
     cdef dict _previous_open_candles
     cdef dict _subsequent_unordered_candles_count
     cdef object _start_time_millis
+    cdef dict _book_nonces
     cdef str websocket_name
 
     cdef public object local_loop
@@ -71,6 +72,7 @@ cdef class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketE
     cdef bint _is_supported_time_frame(self, object time_frame)
     cdef bint _is_pair_independent_feed(self, object feed)
     cdef list _convert_book_prices_to_orders(self, object book_prices_and_volumes, str book_side)
+    cdef bint _update_book(self, object book_instance, dict order_book, str symbol)
     cdef void _register_previous_open_candle(self, str time_frame, str symbol, list candle)
     cdef list _get_previous_open_candle(self, str time_frame, str symbol)
     cdef void _register_subsequent_unordered_candle(self, str time_frame, str symbol, object parsed_timeframe, double current_candle_time)
@@ -108,6 +108,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         self._previous_open_candles = {}
         self._subsequent_unordered_candles_count = {}   # dict values: tuple(candle_count, candle_time)
         self._start_time_millis = None  # used for the "since" param in CURRENT/CANDLE_TIME_FILTERED_CHANNELS
+        self._book_nonces = {}
         self.websocket_name = websocket_name or self.get_name()
 
         self.local_loop = None
@@ -774,15 +775,8 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         :param kwargs: the feed kwargs
         """
         book_instance = self.get_book_instance(symbol)
-
-        book_instance.handle_book_adds(
-            self._convert_book_prices_to_orders(
-                order_book[ECOBIC.ASKS.value],
-                trading_enums.TradeOrderSide.SELL.value) +
-            self._convert_book_prices_to_orders(
-                order_book[ECOBIC.BIDS.value],
-                trading_enums.TradeOrderSide.BUY.value)
-        )
+        if not self._update_book(book_instance, order_book, symbol):
+            return
 
         await self.push_to_channel(trading_constants.ORDER_BOOK_CHANNEL,
                                    symbol,
@@ -790,6 +784,28 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                                    book_instance.bids,
                                    update_order_book=False)
 
+    def _update_book(self, book_instance, order_book, symbol):
+        """
+        Replaces the book content by the given ccxt order book: non-L2 books are rebuilt from it
+        :return: True if the book changed
+        """
+        nonce = order_book.get(ECOBIC.NONCE.value)
+        previous_nonce = self._book_nonces.get(symbol)
+        if nonce is not None and previous_nonce is not None:
+            if nonce == previous_nonce:
+                # book already up-to-date
+                return False
+            if nonce < previous_nonce:
+                # sequence restarted: ccxt reloaded the book from a new snapshot, rebuild it entirely
+                self.logger.debug(f"{symbol} order book sequence reset ({previous_nonce} -> {nonce}): "
+                                  f"reloading order book")
+                book_instance.reset_order_book()
+        self._book_nonces[symbol] = nonce
+        # ccxt is providing the whole book: only apply changed levels on L2 books
+        return book_instance.handle_book_snapshot(order_book[ECOBIC.ASKS.value],
+                                                  order_book[ECOBIC.BIDS.value],
+                                                  order_book.get(ECOBIC.TIMESTAMP.value))
+
     async def candle(self, candles: list, symbol=None, timeframe=None, **kwargs):
         """
         :param candles: the ccxt ohlcv list
@@ -65,6 +65,7 @@ cdef class ExchangeManager(util.Initializable):
     cdef public object init_error
     cdef public object exchange_symbols_data
     cdef public object exchange_personal_data
+    cdef public object rest_requests_scheduler
 
     cdef public dict debug_info
 
@@ -81,6 +81,7 @@ class ExchangeManager(util.Initializable):
         self.exchange_config = exchanges.ExchangeConfig(self)
         self.exchange_personal_data = personal_data.ExchangePersonalData(self)
         self.exchange_symbols_data = exchange_data.ExchangeSymbolsData(self)
+        self.rest_requests_scheduler = exchanges.RestRequestsScheduler(self)
 
         self.debug_info = {}
 
@@ -294,6 +295,7 @@ class ExchangeManager(util.Initializable):
             "traded_time_frames": str(self.exchange_config.traded_time_frames),
             "watched_pairs": str(self.exchange_config.watched_pairs),
             "all_config_symbol_pairs": str(self.exchange_config.all_config_symbol_pairs),
+            "rest_requests": str(self.rest_requests_scheduler.get_metrics()),
         }
 
     def __str__(self):
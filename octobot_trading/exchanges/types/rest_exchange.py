@@ -574,6 +574,20 @@ class RestExchange(abstract_exchange.AbstractExchange):
         """
         return await self.connector.get_funding_rate(symbol=symbol, **kwargs)
 
+    async def get_funding_rates(self, symbols: list, **kwargs: dict) -> dict:
+        """
+        :param symbols: the symbols
+        :return: the current funding rate of each symbol by symbol
+        """
+        return await self.connector.get_funding_rates(symbols=symbols, **kwargs)
+
+    async def get_mark_prices(self, symbols: list, **kwargs: dict) -> dict:
+        """
+        :param symbols: the symbols
+        :return: the current mark price of each symbol by symbol
+        """
+        return await self.connector.get_mark_prices(symbols=symbols, **kwargs)
+
     async def get_funding_rate_history(self, symbol: str, limit: int = 1, **kwargs: dict) -> list:
         """
         :param symbol: the symbol
@@ -28,6 +28,10 @@ from octobot_trading.exchanges.util.exchange_util cimport (
     get_supported_exchange_types,
     get_exchange_class_from_name,
 )
+from octobot_trading.exchanges.util cimport rest_requests_scheduler
+from octobot_trading.exchanges.util.rest_requests_scheduler cimport (
+    RestRequestsScheduler,
+)
 from octobot_trading.exchanges.util cimport websockets_util
 from octobot_trading.exchanges.util.websockets_util cimport (
     force_disable_web_socket,
@@ -36,6 +40,7 @@ from octobot_trading.exchanges.util.websockets_util cimport (
 )
 
 __all__ = [
+    "RestRequestsScheduler",
     "ExchangeMarketStatusFixer",
     "is_ms_valid",
     "get_rest_exchange_class",
@@ -27,11 +27,16 @@ from octobot_trading.exchanges.util.exchange_util import (
     get_partners_explanation_message,
     is_compatible_account,
     get_historical_ohlcv,
+    get_concurrent_historical_ohlcv,
     get_exchange_type,
     get_default_exchange_type,
     get_supported_exchange_types,
     get_exchange_class_from_name,
 )
+from octobot_trading.exchanges.util import rest_requests_scheduler
+from octobot_trading.exchanges.util.rest_requests_scheduler import (
+    RestRequestsScheduler,
+)
 from octobot_trading.exchanges.util import websockets_util
 from octobot_trading.exchanges.util.websockets_util import (
     force_disable_web_socket,
@@ -41,6 +46,7 @@ from octobot_trading.exchanges.util.websockets_util import (
 )
 
 __all__ = [
+    "RestRequestsScheduler",
     "ExchangeMarketStatusFixer",
     "is_ms_valid",
     "get_rest_exchange_class",
@@ -49,6 +55,7 @@ __all__ = [
     "get_partners_explanation_message",
     "is_compatible_account",
     "get_historical_ohlcv",
+    "get_concurrent_historical_ohlcv",
     "get_exchange_type",
     "get_default_exchange_type",
     "get_supported_exchange_types",
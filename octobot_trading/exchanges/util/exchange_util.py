@@ -13,6 +13,10 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
+import collections
+import time
+
 import trading_backend
 
 import octobot_commons.logging as logging
@@ -201,6 +205,88 @@ async def get_historical_ohlcv(local_exchange_manager, symbol, time_frame, start
             reached_max = True
 
 
+async def get_concurrent_historical_ohlcv(local_exchange_manager, symbol, time_frame, start_time, end_time,
+                                          page_size=constants.HISTORICAL_OHLCV_PAGE_SIZE,
+                                          max_concurrent_requests=constants.HISTORICAL_OHLCV_MAX_CONCURRENT_REQUESTS,
+                                          min_request_interval=constants.HISTORICAL_OHLCV_MIN_REQUEST_INTERVAL):
+    """
+    Async generator, same as get_historical_ohlcv but fetches up to max_concurrent_requests pages of page_size
+    candles at the same time. Pages are computed from time_frame and yielded in order, without duplicate candles.
+    Use min_request_interval to set a minimum number of seconds between two requests.
+    WARNING: start_time and end_time should be milliseconds timestamps
+    """
+    page_duration = page_size * common_enums.TimeFramesMinutes[time_frame] * common_constants.MINUTE_TO_SECONDS * \
+        common_constants.MSECONDS_TO_SECONDS
+    page_start_times = iter(range(int(start_time), int(end_time) + 1, page_duration))
+    requests_budget = {"lock": asyncio.Lock(), "last_request_time": 0, "min_request_interval": min_request_interval}
+
+    def _create_fetch_page_task(page_start_time):
+        return asyncio.create_task(_fetch_historical_ohlcv_page(
+            local_exchange_manager, symbol, time_frame, page_start_time,
+            min(page_start_time + page_duration - 1, end_time), page_size, requests_budget
+        ))
+
+    pending_pages = collections.deque(
+        _create_fetch_page_task(page_start_time)
+        for _, page_start_time in zip(range(max_concurrent_requests), page_start_times)
+    )
+    last_candle_time = None
+    try:
+        while pending_pages:
+            candles = await pending_pages.popleft()
+            next_page_start_time = next(page_start_times, None)
+            if next_page_start_time is not None:
+                pending_pages.append(_create_fetch_page_task(next_page_start_time))
+            if last_candle_time is not None:
+                candles = [
+                    candle
+                    for candle in candles
+                    if candle[common_enums.PriceIndexes.IND_PRICE_TIME.value] > last_candle_time
+                ]
+            if candles:
+                last_candle_time = candles[-1][common_enums.PriceIndexes.IND_PRICE_TIME.value]
+                yield candles
+    finally:
+        for pending_page in pending_pages:
+            pending_page.cancel()
+        # also retrieve the errors of pages that failed in the meantime
+        await asyncio.gather(*pending_pages, return_exceptions=True)
+
+
+async def _fetch_historical_ohlcv_page(local_exchange_manager, symbol, time_frame, page_start_time, page_end_time,
+                                       page_size, requests_budget):
+    time_frame_duration = common_enums.TimeFramesMinutes[time_frame] * common_constants.MINUTE_TO_SECONDS * \
+        common_constants.MSECONDS_TO_SECONDS
+    candles = []
+    since = page_start_time
+    # exchanges might return less than page_size candles: fetch until the page is complete
+    while since + time_frame_duration <= page_end_time + 1:
+        await _wait_for_request_budget(requests_budget)
+        fetched_candles = await local_exchange_manager.exchange.get_symbol_prices(symbol, time_frame,
+                                                                                  limit=page_size, since=int(since))
+        fetched_candles = [
+            candle
+            for candle in fetched_candles or []
+            if since <= candle[common_enums.PriceIndexes.IND_PRICE_TIME.value] * 1000 <= page_end_time
+        ]
+        if not fetched_candles:
+            break
+        candles += fetched_candles
+        # avoid fetching the last element twice
+        since = fetched_candles[-1][common_enums.PriceIndexes.IND_PRICE_TIME.value] * 1000 + 1
+    return candles
+
+
+async def _wait_for_request_budget(requests_budget):
+    if requests_budget["min_request_interval"] <= 0:
+        return
+    async with requests_budget["lock"]:
+        delay = requests_budget["last_request_time"] + requests_budget["min_request_interval"] - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        requests_budget["last_request_time"] = time.time()
+
+
 def get_exchange_type(exchange_manager_instance):
     if exchange_manager_instance.is_spot_only:
         return enums.ExchangeTypes.SPOT
@@ -0,0 +1,38 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class RestRequestsScheduler:
+    cdef object logger
+
+    cdef public object exchange_manager
+    cdef public bint enabled
+    cdef public double budget_ratio
+    cdef public double max_degradation
+    cdef public dict feeds
+
+    cdef object _budget
+    cdef double _next_request_time
+    cdef object _requests
+
+    cpdef double get_budget(self)
+    cpdef void set_budget(self, double requests_per_second)
+    cpdef void register_feed(self, str name, double refresh_time, object priority=*, int requests_count=*)
+    cpdef void unregister_feed(self, str name)
+    cpdef double get_refresh_time(self, str name) except? -1
+    cpdef dict get_metrics(self)
+
+    cdef void _prune_requests(self, double now)
+    cdef void _allocate(self)
@@ -0,0 +1,184 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import collections
+import time
+
+import octobot_commons.logging as logging
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+
+
+class RestRequestsScheduler:
+    """
+    Exchange REST requests budget shared by polling updaters.
+    Updaters register their feeds with a desired refresh time and a priority: the exchange requests budget is
+    allocated by decreasing priority and, when every feed can't be refreshed at its desired rate, lowest priority
+    feeds are refreshed less often first. reserve_requests spreads requests over time according to the budget.
+    """
+    # used requests metrics window in seconds
+    METRICS_WINDOW = 60
+    # feed data indexes
+    REFRESH_TIME = 0
+    PRIORITY = 1
+    REQUESTS_COUNT = 2
+    ALLOCATED_REFRESH_TIME = 3
+
+    def __init__(self, exchange_manager, enabled=constants.ENABLE_REST_REQUESTS_SCHEDULER,
+                 budget_ratio=constants.REST_REQUESTS_BUDGET_RATIO,
+                 max_degradation=constants.REST_REQUESTS_MAX_DEGRADATION):
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.exchange_manager = exchange_manager
+        self.enabled = enabled
+        self.budget_ratio = budget_ratio
+        self.max_degradation = max_degradation
+        # feed name: [refresh time, priority, requests count, allocated refresh time]
+        self.feeds = {}
+        # requests per second, computed from the exchange rate limit when first required
+        self._budget = None
+        self._next_request_time = 0
+        # (request time, requests count) of the last METRICS_WINDOW seconds
+        self._requests = collections.deque()
+
+    def get_budget(self):
+        """
+        :return: the requests per second budget allocated to registered feeds
+        """
+        if self._budget is None:
+            if self.exchange_manager.exchange is None:
+                # exchange is not created yet
+                return float("inf")
+            try:
+                rate_limit = self.exchange_manager.exchange.get_rate_limit()
+            except NotImplementedError:
+                rate_limit = None
+            # rate_limit is the min time between requests: no rate limit means no budget limit
+            self._budget = self.budget_ratio / rate_limit if rate_limit else float("inf")
+        return self._budget
+
+    def set_budget(self, requests_per_second):
+        self._budget = requests_per_second
+        self._allocate()
+
+    def register_feed(self, name, refresh_time, priority=enums.RestRequestsPriorities.MEDIUM, requests_count=1):
+        """
+        Register or update a polling feed
+        :param name: the feed name
+        :param refresh_time: the desired time between two feed refreshes in seconds
+        :param priority: the feed RestRequestsPriorities
+        :param requests_count: the requests count of each feed refresh
+        """
+        self.feeds[name] = [refresh_time, priority, max(requests_count, 1), refresh_time]
+        self._allocate()
+
+    def unregister_feed(self, name):
+        if self.feeds.pop(name, None) is not None:
+            self._allocate()
+
+    def get_refresh_time(self, name):
+        """
+        :return: the time to wait between two refreshes of the given feed, the desired refresh time when the
+        scheduler is disabled
+        """
+        feed = self.feeds[name]
+        return feed[self.ALLOCATED_REFRESH_TIME] if self.enabled else feed[self.REFRESH_TIME]
+
+    async def reserve_requests(self, requests_count=1):
+        """
+        Wait until requests_count requests can be sent without exceeding the budget
+        """
+        now = time.time()
+        self._prune_requests(now)
+        self._requests.append((now, requests_count))
+        budget = self.get_budget()
+        if not self.enabled or budget == float("inf"):
+            return
+        request_time = max(now, self._next_request_time)
+        self._next_request_time = request_time + requests_count / budget
+        if request_time > now:
+            await asyncio.sleep(request_time - now)
+
+    async def gather_requests(self, fetch, keys, concurrency=constants.PAIRS_FETCH_CONCURRENCY):
+        """
+        Call fetch(key) for each key with at most concurrency simultaneous calls, each call reserving one request
+        :return: the fetch results in keys order
+        """
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def _fetch(key):
+            async with semaphore:
+                await self.reserve_requests()
+                return await fetch(key)
+
+        return await asyncio.gather(*(_fetch(key) for key in keys))
+
+    def get_metrics(self):
+        """
+        :return: a dict of the requests per second budget, the requests per second allocated to registered feeds,
+        the requests per second used over the last METRICS_WINDOW seconds, the available requests per second and the
+        names of the feeds that are refreshed less often than desired
+        """
+        self._prune_requests(time.time())
+        budget = self.get_budget()
+        used_requests = 0
+        for _, requests_count in self._requests:
+            used_requests += requests_count
+        used = used_requests / self.METRICS_WINDOW
+        allocated = 0
+        for feed in self.feeds.values():
+            if feed[self.ALLOCATED_REFRESH_TIME]:
+                allocated += feed[self.REQUESTS_COUNT] / feed[self.ALLOCATED_REFRESH_TIME]
+        return {
+            "budget": budget,
+            "allocated": allocated,
+            "used": used,
+            "available": max(budget - used, 0),
+            "degraded_feeds": [
+                name
+                for name, feed in self.feeds.items()
+                if feed[self.ALLOCATED_REFRESH_TIME] > feed[self.REFRESH_TIME]
+            ],
+        }
+
+    def _prune_requests(self, now):
+        """
+        Forget requests older than METRICS_WINDOW
+        """
+        min_time = now - self.METRICS_WINDOW
+        while self._requests and self._requests[0][0] < min_time:
+            self._requests.popleft()
+
+    def _allocate(self):
+        remaining_budget = self.get_budget()
+        feeds_by_priority = collections.defaultdict(list)
+        for feed in self.feeds.values():
+            feeds_by_priority[feed[self.PRIORITY].value].append(feed)
+        for priority in sorted(feeds_by_priority, reverse=True):
+            feeds = feeds_by_priority[priority]
+            desired_rate = 0
+            for feed in feeds:
+                if feed[self.REFRESH_TIME]:
+                    desired_rate += feed[self.REQUESTS_COUNT] / feed[self.REFRESH_TIME]
+            # same priority feeds are degraded together
+            rate_ratio = 1 if desired_rate <= remaining_budget \
+                else max(remaining_budget / desired_rate, 1 / self.max_degradation)
+            for feed in feeds:
+                feed[self.ALLOCATED_REFRESH_TIME] = feed[self.REFRESH_TIME] / rate_ratio
+            remaining_budget = max(remaining_budget - desired_rate * rate_ratio, 0)
+        if self.enabled and remaining_budget == 0:
+            self.logger.debug(f"Exchange requests budget exceeded, degraded feeds: "
+                              f"{self.get_metrics()['degraded_feeds']}")
@@ -24,6 +24,7 @@ import octobot_commons.constants as commons_constants
 import octobot_trading.errors as errors
 import octobot_trading.personal_data.orders.channel.orders as orders_channel
 import octobot_trading.constants as constants
+import octobot_trading.enums as enums
 
 
 class OrdersUpdater(orders_channel.OrdersProducer):
@@ -91,6 +92,10 @@ class OrdersUpdater(orders_channel.OrdersProducer):
         Start updater jobs
         """
         await self.initialize()
+        # open orders job delays are not managed by the requests scheduler: only reserve its requests budget
+        self.channel.exchange_manager.rest_requests_scheduler.register_feed(
+            self.CHANNEL_NAME, self.OPEN_ORDER_REFRESH_TIME, enums.RestRequestsPriorities.HIGH
+        )
         await asyncio.sleep(self.ORDERS_STARTING_REFRESH_TIME)
         await self.open_orders_job.run()
         # await self.closed_orders_job.run()
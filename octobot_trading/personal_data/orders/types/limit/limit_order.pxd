@@ -19,6 +19,7 @@ cimport octobot_trading.personal_data.orders.order as order_class
 cdef class LimitOrder(order_class.Order):
     cdef object limit_price_hit_event # object is asyncio.Event
     cdef object wait_for_hit_event_task # object is asyncio.Task
+    cdef bint hit_callback_registered
 
     cdef bint trigger_above
     cdef public bint allow_instant_fill
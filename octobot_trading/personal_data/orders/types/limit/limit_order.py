@@ -25,6 +25,8 @@ class LimitOrder(order_class.Order):
         super().__init__(trader, side)
         self.limit_price_hit_event = None
         self.wait_for_hit_event_task = None
+        # True when on_fill is called by the price events manager instead of wait_for_hit_event_task
+        self.hit_callback_registered = False
         self.trigger_above = self.side is enums.TradeOrderSide.SELL
         self.allow_instant_fill = True
 
@@ -40,7 +42,8 @@ class LimitOrder(order_class.Order):
         if self.limit_price_hit_event is None:
             self._create_hit_event(self.creation_time)
 
-        if self.wait_for_hit_event_task is None and self.limit_price_hit_event is not None:
+        if self.wait_for_hit_event_task is None and not self.hit_callback_registered \
+                and self.limit_price_hit_event is not None:
             if self.limit_price_hit_event.is_set():
                 # order should be filled instantly
                 await self.on_fill()
@@ -59,7 +62,13 @@ class LimitOrder(order_class.Order):
             new_event(self.origin_price, price_time, self.trigger_above, self.allow_instant_fill)
 
     def _create_hit_task(self):
-        self.wait_for_hit_event_task = asyncio.create_task(self.wait_for_price_hit())
+        if constants.ENABLE_PRICE_EVENTS_CALLBACKS:
+            # on_fill is called by the price events manager: no waiting task
+            self.exchange_manager.exchange_symbols_data.get_exchange_symbol_data(self.symbol).price_events_manager.\
+                add_event_callback(self.limit_price_hit_event, self.on_fill)
+            self.hit_callback_registered = True
+        else:
+            self.wait_for_hit_event_task = asyncio.create_task(self.wait_for_price_hit())
 
     def _reset_events(self, price_time):
         """
@@ -74,6 +83,8 @@ class LimitOrder(order_class.Order):
             if not self.limit_price_hit_event.is_set():
                 self.wait_for_hit_event_task.cancel()
             self.wait_for_hit_event_task = None
+        # also drops the already triggered on_fill callback
+        self.hit_callback_registered = False
         if self.limit_price_hit_event is not None:
             self.exchange_manager.exchange_symbols_data. \
                 get_exchange_symbol_data(self.symbol).price_events_manager.remove_event(self.limit_price_hit_event)
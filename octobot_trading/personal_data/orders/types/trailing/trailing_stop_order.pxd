@@ -18,16 +18,16 @@ cimport octobot_trading.personal_data.orders.order as order_class
 
 cdef class TrailingStopOrder(order_class.Order):
     cdef object trailing_stop_price_hit_event # object is asyncio.Event
-    cdef object trailing_price_hit_event # object is asyncio.Event
     cdef object wait_for_stop_price_hit_event_task # object is asyncio.Event
-    cdef object wait_for_price_hit_event_task # object is asyncio.Event
+    cdef bint stop_price_hit_callback_registered
     cdef public object trailing_percent
     cdef public bint allow_instant_fill
 
     cdef void _create_hit_events(self, object price_events_manager,
                                  object new_price,
                                  double new_price_time)
-    cdef object _calculate_stop_price(self, object new_price)
+    cdef object _get_trailing_percent(self)
+    cdef object _create_hit_task(self, object event_to_wait, object callback)
     cdef void _remove_events(self, object price_events_manager)
     cdef void _clear_event_and_tasks(self)
     cdef void _cancel_hit_tasks(self)
@@ -16,8 +16,6 @@
 import asyncio
 import decimal
 
-import octobot_commons.logging as logging
-
 import octobot_trading.enums as enums
 import octobot_trading.constants as constants
 import octobot_trading.personal_data.orders.order as order_class
@@ -31,9 +29,9 @@ class TrailingStopOrder(order_class.Order):
         super().__init__(trader, side=side)
         self.order_type = enums.TraderOrderType.TRAILING_STOP
         self.trailing_stop_price_hit_event = None
-        self.trailing_price_hit_event = None
         self.wait_for_stop_price_hit_event_task = None
-        self.wait_for_price_hit_event_task = None
+        # True when on_fill is called by the price events manager instead of wait_for_stop_price_hit_event_task
+        self.stop_price_hit_callback_registered = False
         self.trailing_percent = trailing_percent
         self.allow_instant_fill = True
 
@@ -55,6 +53,9 @@ class TrailingStopOrder(order_class.Order):
         Reset events and tasks
         :param new_price: the new trailing price
         """
+        if self.stop_price_hit_callback_registered and self.trailing_stop_price_hit_event.is_set():
+            # already hit: on_fill is about to be called by the price events manager
+            return
         self._clear_event_and_tasks()
         price_events_manager = self.exchange_manager.exchange_symbols_data. \
             get_exchange_symbol_data(self.symbol).price_events_manager
@@ -63,49 +64,48 @@ class TrailingStopOrder(order_class.Order):
 
     def _create_hit_events(self, price_events_manager, new_price, new_price_time):
         """
-        Create prices hit events
+        Create the trailing stop price hit event. Its stop price then follows prices from the
+        price events manager without being re-created.
         :param price_events_manager: the price events manager to use
         :param new_price: the new trailing price
         """
         if self.trailing_stop_price_hit_event is None:
-            self.trailing_stop_price_hit_event = price_events_manager.new_event(
-                self._calculate_stop_price(new_price), new_price_time,
-                self.side is enums.TradeOrderSide.BUY, self.allow_instant_fill)
-        if self.trailing_price_hit_event is None:
-            # don't allow instant fill since this event should only be triggered by next recent trades and prices
-            self.trailing_price_hit_event = price_events_manager.new_event(new_price, new_price_time,
-                                                                           self.side is enums.TradeOrderSide.SELL,
-                                                                           allow_instant_fill=False)
-
-    def _calculate_stop_price(self, new_price):
-        """
-        Calculate the trailing stop price from price and trailing percent
-        :param new_price: the price
-        :return: the stop price related to the specified price
-        """
-        trailing_price_factor = (self.trailing_percent
-                                 if self.trailing_percent != self.UNINITIALIZED_TRAILING_PERCENT
-                                 else self.DEFAULT_TRAILING_PERCENT) / decimal.Decimal("100")
-        trailing_price_factor *= constants.ONE if self.side is enums.TradeOrderSide.BUY else -constants.ONE
-        return new_price * (constants.ONE + trailing_price_factor)
+            self.trailing_stop_price_hit_event = price_events_manager.new_trailing_event(
+                new_price, new_price_time, self.side is enums.TradeOrderSide.BUY,
+                self._get_trailing_percent(), self.allow_instant_fill)
+
+    def _get_trailing_percent(self):
+        """
+        :return: the trailing percent to use
+        """
+        return self.trailing_percent if self.trailing_percent != self.UNINITIALIZED_TRAILING_PERCENT \
+            else self.DEFAULT_TRAILING_PERCENT
 
     async def _handle_events_and_hit_tasks(self):
         """
         Create event hit waiting tasks
         """
-        if self.wait_for_price_hit_event_task is None and self.trailing_price_hit_event is not None:
-            if self.trailing_price_hit_event.is_set():
-                await self._on_price_hit()
-            else:
-                self.wait_for_price_hit_event_task = asyncio.create_task(
-                    _wait_for_price_hit(self.trailing_price_hit_event, self._on_price_hit))
-
-        if self.wait_for_stop_price_hit_event_task is None and self.trailing_stop_price_hit_event is not None:
+        if self.wait_for_stop_price_hit_event_task is None and not self.stop_price_hit_callback_registered \
+                and self.trailing_stop_price_hit_event is not None:
             if self.trailing_stop_price_hit_event.is_set():
                 await self.on_fill()
             else:
-                self.wait_for_stop_price_hit_event_task = asyncio.create_task(
-                    _wait_for_price_hit(self.trailing_stop_price_hit_event, self.on_fill))
+                self.wait_for_stop_price_hit_event_task = self._create_hit_task(self.trailing_stop_price_hit_event,
+                                                                                self.on_fill)
+                self.stop_price_hit_callback_registered = self.wait_for_stop_price_hit_event_task is None
+
+    def _create_hit_task(self, event_to_wait, callback):
+        """
+        Call callback when event_to_wait is set
+        :param event_to_wait: the event to wait
+        :param callback: the callback to call
+        :return: the waiting task, None when callback is called by the price events manager
+        """
+        if constants.ENABLE_PRICE_EVENTS_CALLBACKS:
+            self.exchange_manager.exchange_symbols_data.get_exchange_symbol_data(self.symbol).price_events_manager.\
+                add_event_callback(event_to_wait, callback)
+            return None
+        return asyncio.create_task(_wait_for_price_hit(event_to_wait, callback))
 
     def _remove_events(self, price_events_manager):
         """
@@ -115,33 +115,17 @@ class TrailingStopOrder(order_class.Order):
         if self.trailing_stop_price_hit_event is not None:
             price_events_manager.remove_event(self.trailing_stop_price_hit_event)
             self.trailing_stop_price_hit_event = None
-        if self.trailing_price_hit_event is not None:
-            price_events_manager.remove_event(self.trailing_price_hit_event)
-            self.trailing_price_hit_event = None
 
     def _cancel_hit_tasks(self):
         """
         Cancel and destroy event hit waiting tasks
         """
-        if self.wait_for_price_hit_event_task is not None:
-            if not self.trailing_price_hit_event.is_set():
-                self.wait_for_price_hit_event_task.cancel()
-            self.wait_for_price_hit_event_task = None
-
         if self.wait_for_stop_price_hit_event_task is not None:
             if not self.trailing_stop_price_hit_event.is_set():
                 self.wait_for_stop_price_hit_event_task.cancel()
             self.wait_for_stop_price_hit_event_task = None
-
-    async def _on_price_hit(self):
-        """
-        Is called when the trailing price is hit
-        """
-        prices_manager = self.exchange_manager.exchange_symbols_data. \
-            get_exchange_symbol_data(self.symbol).prices_manager
-        logging.get_logger(self.get_logger_name()).debug(f"New price hit {prices_manager.mark_price}, "
-                                                         f"replacing stop...")
-        await self._reset_events(decimal.Decimal(str(prices_manager.mark_price)), prices_manager.mark_price_set_time)
+        # the already triggered on_fill callback is dropped when removing the event
+        self.stop_price_hit_callback_registered = False
 
     async def on_filled(self):
         """
@@ -21,6 +21,7 @@ import octobot_commons.logging as logging
 
 import octobot_trading.errors as errors
 import octobot_trading.constants as constants
+import octobot_trading.enums as enums
 import octobot_trading.personal_data.portfolios.channel.balance as portfolios_channel
 import octobot_trading.exchange_channel as exchange_channel
 
@@ -44,10 +45,15 @@ class BalanceUpdater(portfolios_channel.BalanceProducer):
         """
         Starts the balance updating process
         """
+        rest_requests_scheduler = self.channel.exchange_manager.rest_requests_scheduler
+        rest_requests_scheduler.register_feed(
+            self.CHANNEL_NAME, self.BALANCE_REFRESH_TIME, enums.RestRequestsPriorities.HIGH
+        )
         while not self.should_stop:
             try:
+                await rest_requests_scheduler.reserve_requests()
                 await self.fetch_and_push()
-                await asyncio.sleep(self.BALANCE_REFRESH_TIME)
+                await asyncio.sleep(rest_requests_scheduler.get_refresh_time(self.CHANNEL_NAME))
             except errors.FailedRequest as e:
                 self.logger.warning(str(e))
                 # avoid spamming on disconnected situation
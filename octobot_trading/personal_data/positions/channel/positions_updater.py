@@ -108,6 +108,12 @@ class PositionsUpdater(positions_channel.PositionsProducer):
             return
 
         await self.initialize()
+        # positions job delays are not managed by the requests scheduler: only reserve its requests budget
+        self.channel.exchange_manager.rest_requests_scheduler.register_feed(
+            self.CHANNEL_NAME, self.POSITION_REFRESH_TIME, enums.RestRequestsPriorities.HIGH,
+            requests_count=len(self.channel.exchange_manager.exchange_config.traded_symbol_pairs)
+            if self.should_use_position_per_symbol else 1
+        )
         await asyncio.sleep(self.POSITIONS_STARTING_REFRESH_TIME)
         await self.position_update_job.run()
 
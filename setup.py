@@ -49,6 +49,7 @@ packages_list = [
     "octobot_trading.util.config_util",
     "octobot_trading.exchange_data.exchange_symbols_data",
     "octobot_trading.exchange_data.exchange_symbol_data",
+    "octobot_trading.exchange_data.pairs_polling_scheduler",
     "octobot_trading.exchange_data.ticker.ticker_manager",
     "octobot_trading.exchange_data.ticker.channel.ticker",
     "octobot_trading.exchange_data.ticker.channel.ticker_updater",
@@ -67,6 +68,9 @@ packages_list = [
     "octobot_trading.exchange_data.kline.channel.kline",
     "octobot_trading.exchange_data.kline.channel.kline_updater",
     "octobot_trading.exchange_data.kline.channel.kline_updater_simulator",
+    "octobot_trading.exchange_data.bars.bars_aggregator",
+    "octobot_trading.exchange_data.bars.channel.bars",
+    "octobot_trading.exchange_data.bars.channel.bars_updater",
     "octobot_trading.exchange_data.recent_trades.recent_trades_manager",
     "octobot_trading.exchange_data.recent_trades.channel.recent_trade",
     "octobot_trading.exchange_data.recent_trades.channel.recent_trade_updater_simulator",
@@ -187,6 +191,7 @@ packages_list = [
     "octobot_trading.exchanges.util.exchange_market_status_fixer",
     "octobot_trading.exchanges.util.websockets_util",
     "octobot_trading.exchanges.util.exchange_util",
+    "octobot_trading.exchanges.util.rest_requests_scheduler",
     "octobot_trading.exchanges.types.rest_exchange",
     "octobot_trading.exchanges.types.websocket_exchange",
     "octobot_trading.exchanges.implementations.default_websocket_exchange",
@@ -0,0 +1,97 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import pytest
+
+import octobot_trading.enums as enums
+from octobot_trading.exchange_data.bars.bars_aggregator import BarsAggregator
+from octobot_trading.exchange_data.bars.channel.bars_updater import _parse_bars
+
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_time_bars():
+    bars_aggregator = await _create_bars_aggregator(enums.BarTypes.TIME, 60)
+    assert bars_aggregator.add_trades(_gen_trades([(10, 65, 1), (11, 70, 2), (12, 60, 1)])) == []
+    assert bars_aggregator.get_current_bar() == [60, 10, 12, 10, 12, 4]
+    # no bar for periods without trades
+    assert bars_aggregator.add_trades(_gen_trades([(13, 250, 1)])) == [[60, 10, 12, 10, 12, 4]]
+    assert bars_aggregator.get_current_bar() == [240, 13, 13, 13, 13, 1]
+    assert bars_aggregator.get_bars() == [[60, 10, 12, 10, 12, 4]]
+
+
+async def test_tick_bars():
+    bars_aggregator = await _create_bars_aggregator(enums.BarTypes.TICK, 2)
+    # bars can open on the same timestamp
+    completed_bars = bars_aggregator.add_trades(_gen_trades([(10, 1, 1), (9, 1, 1), (11, 1, 1), (12, 2, 1),
+                                                             (13, 3, 1)]))
+    assert completed_bars == [[1, 10, 10, 9, 9, 2], [1, 11, 12, 11, 12, 2]]
+    assert bars_aggregator.get_current_bar() == [3, 13, 13, 13, 13, 1]
+    assert bars_aggregator.get_bars() == completed_bars
+    assert bars_aggregator.get_bars(1) == completed_bars[-1:]
+
+
+async def test_volume_and_notional_bars():
+    trades = _gen_trades([(10, 1, 2), (11, 2, 2), (12, 3, 0.5), (10, 4, 5)])
+    bars_aggregator = await _create_bars_aggregator(enums.BarTypes.VOLUME, 4)
+    # trades are not split between bars
+    assert bars_aggregator.add_trades(trades) == [[1, 10, 11, 10, 11, 4], [3, 12, 12, 10, 10, 5.5]]
+    assert bars_aggregator.get_current_bar() == []
+
+    bars_aggregator = await _create_bars_aggregator(enums.BarTypes.NOTIONAL, 40)
+    assert bars_aggregator.add_trades(trades) == [[1, 10, 11, 10, 11, 4], [3, 12, 12, 10, 10, 5.5]]
+    bars_aggregator = await _create_bars_aggregator(enums.BarTypes.NOTIONAL, 50)
+    assert bars_aggregator.add_trades(trades) == [[1, 10, 12, 10, 10, 9.5]]
+
+
+async def test_max_bars_count():
+    bars_aggregator = await _create_bars_aggregator(enums.BarTypes.TICK, 1, max_bars_count=1001)
+    bars_aggregator.add_trades(_gen_trades([(index, index, 1) for index in range(1500)]))
+    assert bars_aggregator.bars_manager.get_symbol_candles_count() == 1000
+    assert bars_aggregator.get_bars(1) == [[1499, 1499, 1499, 1499, 1499, 1]]
+
+
+async def test_invalid_threshold():
+    with pytest.raises(ValueError):
+        BarsAggregator(enums.BarTypes.TICK, 0)
+
+
+async def test_parse_bars():
+    assert _parse_bars("") == []
+    assert _parse_bars("tick:1000, volume:50.5,time:60") == [
+        (enums.BarTypes.TICK, 1000), (enums.BarTypes.VOLUME, 50.5), (enums.BarTypes.TIME, 60)
+    ]
+    with pytest.raises(ValueError):
+        _parse_bars("range:10")
+
+
+async def _create_bars_aggregator(bar_type, threshold, **kwargs):
+    bars_aggregator = BarsAggregator(bar_type, threshold, **kwargs)
+    await bars_aggregator.initialize()
+    return bars_aggregator
+
+
+def _gen_trades(trades):
+    return [
+        {
+            enums.ExchangeConstantsOrderColumns.PRICE.value: price,
+            enums.ExchangeConstantsOrderColumns.TIMESTAMP.value: timestamp,
+            enums.ExchangeConstantsOrderColumns.AMOUNT.value: amount,
+        }
+        for price, timestamp, amount in trades
+    ]
@@ -0,0 +1,91 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import mock
+import pytest
+
+import octobot_trading.enums as enums
+import octobot_trading.exchange_data.bars.channel.bars_updater as bars_updater
+from octobot_commons.enums import TimeFrames
+from octobot_trading.exchange_data.exchange_symbol_data import ExchangeSymbolData
+
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+SYMBOL = "BTC/USDT"
+TIME_BAR = (enums.BarTypes.TIME, 60)
+TICK_BAR = (enums.BarTypes.TICK, 2)
+
+
+async def test_handle_recent_trades_update():
+    updater, kline_push_mock = _create_updater()
+    with mock.patch.object(bars_updater.exchanges_channel, "get_chan", mock.Mock()) as get_chan_mock:
+        get_chan_mock.return_value.get_internal_producer.return_value.push = kline_push_mock
+        await _handle_trades(updater, [(10, 65, 1), (11, 70, 2), (12, 130, 1)])
+        # completed bars
+        updater.push.assert_called_once_with(SYMBOL, *TICK_BAR, [[65, 10, 11, 10, 11, 3]])
+        # completed kline final state first, then current kline
+        assert [call.args for call in kline_push_mock.call_args_list] == [
+            (TimeFrames.ONE_MINUTE, SYMBOL, [60, 10, 11, 10, 11, 3]),
+            (TimeFrames.ONE_MINUTE, SYMBOL, [120, 12, 12, 12, 12, 1]),
+        ]
+
+        updater.push.reset_mock()
+        kline_push_mock.reset_mock()
+        await _handle_trades(updater, [(13, 140, 1)])
+        updater.push.assert_called_once_with(SYMBOL, *TICK_BAR, [[130, 12, 13, 12, 13, 2]])
+        assert [call.args for call in kline_push_mock.call_args_list] == [
+            (TimeFrames.ONE_MINUTE, SYMBOL, [120, 12, 13, 12, 13, 2]),
+        ]
+
+        # several klines completed at once, without trades in between
+        kline_push_mock.reset_mock()
+        await _handle_trades(updater, [(14, 190, 1), (15, 250, 1), (16, 370, 1)])
+        assert [call.args for call in kline_push_mock.call_args_list] == [
+            (TimeFrames.ONE_MINUTE, SYMBOL, [120, 12, 13, 12, 13, 2]),
+            (TimeFrames.ONE_MINUTE, SYMBOL, [180, 14, 14, 14, 14, 1]),
+            (TimeFrames.ONE_MINUTE, SYMBOL, [240, 15, 15, 15, 15, 1]),
+            (TimeFrames.ONE_MINUTE, SYMBOL, [360, 16, 16, 16, 16, 1]),
+        ]
+
+
+def _create_updater():
+    channel = mock.Mock()
+    exchange_manager = channel.exchange_manager
+    exchange_manager.exchange_config.required_historical_candles_count = 0
+    symbol_data = ExchangeSymbolData(exchange_manager, SYMBOL)
+    exchange_manager.get_symbol_data = mock.Mock(return_value=symbol_data)
+    updater = bars_updater.BarsUpdater(channel)
+    updater.pushed_bars = [TICK_BAR]
+    updater.klines_bars = {TIME_BAR: TimeFrames.ONE_MINUTE}
+    updater.push = mock.AsyncMock()
+    return updater, mock.AsyncMock()
+
+
+async def _handle_trades(updater, trades):
+    await updater.handle_recent_trades_update("binanceus", "1", "Bitcoin", SYMBOL, _gen_trades(trades))
+
+
+def _gen_trades(trades):
+    return [
+        {
+            enums.ExchangeConstantsOrderColumns.PRICE.value: price,
+            enums.ExchangeConstantsOrderColumns.TIMESTAMP.value: timestamp,
+            enums.ExchangeConstantsOrderColumns.AMOUNT.value: amount,
+        }
+        for price, timestamp, amount in trades
+    ]
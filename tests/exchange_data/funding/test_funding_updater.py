@@ -0,0 +1,123 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import asyncio
+import decimal
+
+import mock
+import pytest
+
+import octobot_trading.errors as errors
+from octobot_trading.enums import ExchangeConstantsFundingColumns as FC
+from octobot_trading.exchange_data.funding.channel.funding_updater import FundingUpdater
+from octobot_trading.exchanges.util.rest_requests_scheduler import RestRequestsScheduler
+
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+PAIRS = ["BTC/USDT:USDT", "ETH/USDT:USDT", "SOL/USDT:USDT"]
+
+
+async def test_funding_fetch_and_push_in_bulk():
+    updater = _create_updater()
+    exchange = updater.channel.exchange_manager.exchange
+    exchange.get_funding_rates = mock.AsyncMock(return_value={
+        PAIRS[2]: _funding(PAIRS[2]),
+        PAIRS[0]: _funding(PAIRS[0]),
+    })
+    assert await updater._funding_fetch_and_push() == [_next_funding_time(PAIRS[0]), _next_funding_time(PAIRS[2])]
+    exchange.get_funding_rates.assert_called_once_with(PAIRS)
+    exchange.get_funding_rate.assert_not_called()
+    assert updater.is_bulk_fetching
+    assert [call.args[:2] for call in updater.push.call_args_list] == [
+        (PAIRS[0], decimal.Decimal("0.0001")),
+        (PAIRS[2], decimal.Decimal("0.0001")),
+    ]
+
+
+async def test_funding_fetch_and_push_bulk_failure():
+    updater = _create_updater()
+    exchange = updater.channel.exchange_manager.exchange
+    exchange.get_funding_rates = mock.AsyncMock(side_effect=errors.FailedRequest)
+    assert await updater._funding_fetch_and_push() == []
+    exchange.get_funding_rate.assert_not_called()
+    updater.push.assert_not_called()
+    # still bulk fetching on next update
+    assert updater.is_bulk_fetching
+
+
+async def test_funding_fetch_and_push_bulk_not_supported():
+    for error in (errors.NotSupported, NotImplementedError):
+        updater = _create_updater()
+        exchange = updater.channel.exchange_manager.exchange
+        exchange.get_funding_rates = mock.AsyncMock(side_effect=error)
+        assert await updater._funding_fetch_and_push() == [_next_funding_time(pair) for pair in PAIRS]
+        assert updater.is_bulk_fetching is False
+        assert [call.args[0] for call in exchange.get_funding_rate.call_args_list] == PAIRS
+        assert [call.args[0] for call in updater.push.call_args_list] == PAIRS
+
+        # bulk fetching is not tried again
+        exchange.get_funding_rates.reset_mock()
+        await updater._funding_fetch_and_push()
+        exchange.get_funding_rates.assert_not_called()
+
+
+async def test_funding_fetch_and_push_concurrently_keeps_pairs_order():
+    updater = _create_updater()
+    updater.is_bulk_fetching = False
+    updater.fetch_concurrency = len(PAIRS)
+    exchange = updater.channel.exchange_manager.exchange
+    fetching = []
+
+    async def _get_funding_rate(symbol):
+        fetching.append(symbol)
+        # first pairs are the last ones to be fetched
+        await asyncio.sleep(0.01 * (len(PAIRS) - PAIRS.index(symbol)))
+        return _funding(symbol)
+
+    exchange.get_funding_rate = mock.AsyncMock(side_effect=_get_funding_rate)
+    assert await updater._funding_fetch_and_push() == [_next_funding_time(pair) for pair in PAIRS]
+    assert fetching == PAIRS
+    assert [call.args[0] for call in updater.push.call_args_list] == PAIRS
+
+
+def _create_updater():
+    channel = mock.Mock()
+    exchange_manager = channel.exchange_manager
+    exchange_manager.exchange_config.traded_symbol_pairs = PAIRS
+    exchange_manager.rest_requests_scheduler = RestRequestsScheduler(exchange_manager, enabled=False)
+    exchange_manager.rest_requests_scheduler.set_budget(10)
+    exchange_manager.exchange.get_funding_rates = mock.AsyncMock(
+        side_effect=lambda symbols: {symbol: _funding(symbol) for symbol in symbols}
+    )
+    exchange_manager.exchange.get_funding_rate = mock.AsyncMock(side_effect=_funding)
+    updater = FundingUpdater(channel)
+    updater.is_bulk_fetching = True
+    updater.push = mock.AsyncMock()
+    return updater
+
+
+def _next_funding_time(symbol):
+    return 1000 + PAIRS.index(symbol)
+
+
+def _funding(symbol):
+    return {
+        FC.FUNDING_RATE.value: "0.0001",
+        FC.NEXT_FUNDING_TIME.value: _next_funding_time(symbol),
+        FC.LAST_FUNDING_TIME.value: 1,
+    }
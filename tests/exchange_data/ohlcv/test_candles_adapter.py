@@ -59,6 +59,12 @@ async def test_get_symbol_close_candles(symbol_data, time_frame):
     assert np.array_equal(get_symbol_close_candles(symbol_data, time_frame, 10, False),
                           np.array(_get_candles_extract(PriceIndexes.IND_PRICE_CLOSE.value), dtype=float))
 
+    # read-only view selector
+    close_view = get_symbol_close_candles(symbol_data, time_frame, 10, False, copy=False)
+    assert close_view.flags.writeable is False
+    assert np.array_equal(close_view,
+                          np.array(_get_candles_extract(PriceIndexes.IND_PRICE_CLOSE.value), dtype=float))
+
     # selector with in construction candle
     assert np.array_equal(get_symbol_close_candles(symbol_data, time_frame, 10, True),
                           np.array(_get_candles_extract_with_extra_candle(PriceIndexes.IND_PRICE_CLOSE.value),
@@ -0,0 +1,103 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import concurrent.futures
+import os
+import numpy as np
+
+from octobot_commons.enums import PriceIndexes, TimeFrames
+from octobot_trading.exchange_data.ohlcv.candles_cache import CandlesCache
+
+EXCHANGE = "binanceus"
+SYMBOL = "BTC/USDT"
+
+
+def test_get_candles_without_cache(tmp_path):
+    candles_cache = CandlesCache(cache_path=str(tmp_path))
+    candles = candles_cache.get_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR)
+    assert candles.shape == (0, len(PriceIndexes))
+
+
+def test_set_and_get_candles(tmp_path):
+    candles_cache = CandlesCache(cache_path=str(tmp_path), max_candles_count=5)
+    candles = _gen_candles(8)
+    candles_cache.set_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR, candles)
+    cached_candles = candles_cache.get_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR)
+    # only the 5 last candles are kept
+    assert cached_candles.tolist() == candles[-5:]
+    assert candles_cache.get_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_MINUTE).shape == (0, len(PriceIndexes))
+    assert candles_cache.get_candles(EXCHANGE, "ETH/USDT", TimeFrames.ONE_HOUR).shape == (0, len(PriceIndexes))
+
+    candles_cache.clear(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR)
+    assert candles_cache.get_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR).shape == (0, len(PriceIndexes))
+
+
+def test_get_candles_with_invalid_cache(tmp_path):
+    candles_cache = CandlesCache(cache_path=str(tmp_path))
+    candles = _gen_candles(5)
+    candles_cache.set_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR, list(reversed(candles)))
+    # unsorted candles
+    assert candles_cache.get_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR).shape == (0, len(PriceIndexes))
+
+    file_path = candles_cache._get_file_path(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR)
+    with open(file_path, "w") as cache_file:
+        cache_file.write("invalid")
+    assert candles_cache.get_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR).shape == (0, len(PriceIndexes))
+
+
+def test_max_size(tmp_path):
+    candles_cache = CandlesCache(cache_path=str(tmp_path))
+    candles = _gen_candles(10)
+    candles_cache.set_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR, candles)
+    file_size = os.path.getsize(candles_cache._get_file_path(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR))
+    candles_cache.max_size = 2 * file_size
+    candles_cache.set_candles(EXCHANGE, SYMBOL, TimeFrames.FOUR_HOURS, candles)
+    candles_cache.set_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_DAY, candles)
+    # the least recently updated file is removed
+    assert candles_cache.get_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR).shape == (0, len(PriceIndexes))
+    assert candles_cache.get_candles(EXCHANGE, SYMBOL, TimeFrames.FOUR_HOURS).tolist() == candles
+    assert candles_cache.get_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_DAY).tolist() == candles
+
+
+def test_concurrent_set_candles(tmp_path):
+    candles_cache = CandlesCache(cache_path=str(tmp_path))
+    candles = _gen_candles(10)
+    candles_cache.set_candles(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR, candles)
+    file_size = os.path.getsize(candles_cache._get_file_path(EXCHANGE, SYMBOL, TimeFrames.ONE_HOUR))
+    candles_cache.max_size = 3 * file_size
+    symbols = [f"COIN{index}/USDT" for index in range(20)]
+    time_frames = [TimeFrames.ONE_MINUTE, TimeFrames.ONE_HOUR, TimeFrames.ONE_DAY]
+    # set_candles is called from executor threads
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [
+            executor.submit(candles_cache.set_candles, EXCHANGE, symbol, time_frame, candles)
+            for symbol in symbols
+            for time_frame in time_frames
+        ]:
+            future.result()
+    cached_files_count = sum(
+        candles_cache.get_candles(EXCHANGE, symbol, time_frame).shape[0] > 0
+        for symbol in symbols
+        for time_frame in time_frames
+    )
+    assert 1 <= cached_files_count <= 3
+    assert sum(file_size for _, file_size in candles_cache._files_info.values()) <= candles_cache.max_size
+
+
+def _gen_candles(count):
+    return [
+        [float(i * 3600), i + 1.0, i + 2.0, i + 0.5, i + 1.5, 10.0 * i]
+        for i in range(count)
+    ]
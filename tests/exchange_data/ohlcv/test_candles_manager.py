@@ -14,9 +14,10 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import numpy as np
+import pytest
 
 from octobot_commons.enums import PriceIndexes
-from octobot_trading.exchange_data.ohlcv.candles_manager import CandlesManager
+from octobot_trading.exchange_data.ohlcv.candles_manager import CandlesManager, CandlesView
 
 
 def test_constructor():
@@ -155,6 +156,132 @@ def test_reach_max_candles_count_with_custom_candles_count():
                other_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
 
 
+def test_reach_max_candles_count_keeps_candles_ordered():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.MAX_CANDLES_COUNT * 2 + 7)
+    candles_buffer = candles_manager._candles_buffer
+    candles_manager.add_old_and_new_candles(all_candles)
+    assert candles_manager.reached_max is True
+    # no array re-allocation when rotating candles
+    assert candles_manager._candles_buffer is candles_buffer
+    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
+    expected_candles = all_candles[-candles_manager.MAX_CANDLES_COUNT:]
+    assert list(candles_manager.get_symbol_close_candles()) == \
+        [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in expected_candles]
+    assert list(candles_manager.get_symbol_time_candles(3)) == \
+        [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in expected_candles[-3:]]
+
+    # update a candle stored after the ring buffer start
+    updated_candle = list(expected_candles[-2])
+    updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 1
+    candles_manager.upsert_candle(updated_candle)
+    assert list(candles_manager.get_symbol_close_candles(3)) == \
+        [expected_candles[-3][PriceIndexes.IND_PRICE_CLOSE.value], 1,
+         expected_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value]]
+    # still up to date after rotating the ring buffer
+    candles_manager.add_new_candle(_get_candle(len(all_candles) + 1))
+    assert list(candles_manager.get_symbol_close_candles(3)) == \
+        [1, expected_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value], (len(all_candles) + 1) * 10000]
+
+
+def test_upsert_candle():
+    candles_manager = CandlesManager()
+    candles = _gen_candles(5)
+    candles_manager.add_old_and_new_candles(candles)
+    updated_candle = list(candles[2])
+    updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 1
+    candles_manager.upsert_candle(updated_candle)
+    assert candles_manager.close_candles_index == 5
+    assert candles_manager.close_candles[2] == 1
+
+    # new candle
+    candles_manager.upsert_candle(_get_candle(6))
+    assert candles_manager.close_candles_index == 6
+    assert candles_manager.close_candles[5] == _get_candle(6)[PriceIndexes.IND_PRICE_CLOSE.value]
+
+    # already added candles are not duplicated
+    candles_manager.add_old_and_new_candles(_gen_candles(6))
+    assert candles_manager.close_candles_index == 6
+
+
+def test_candles_time_index():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.MAX_CANDLES_COUNT + 10)
+    candles_manager.add_old_and_new_candles(all_candles)
+    assert len(candles_manager._slot_by_time) == candles_manager.MAX_CANDLES_COUNT
+    # rotated out candles are forgotten
+    assert candles_manager._get_time_index(all_candles[9][PriceIndexes.IND_PRICE_TIME.value]) == -1
+    assert candles_manager._should_add_new_candle(all_candles[9][PriceIndexes.IND_PRICE_TIME.value]) is True
+    assert candles_manager._should_add_new_candle(all_candles[10][PriceIndexes.IND_PRICE_TIME.value]) is False
+    for index in (0, 1, candles_manager.MAX_CANDLES_COUNT - 1):
+        candle_time = all_candles[10 + index][PriceIndexes.IND_PRICE_TIME.value]
+        assert candles_manager._get_time_index(candle_time) == index
+        assert candles_manager.time_candles[index] == candle_time
+
+    candles_manager.replace_all_candles(_gen_candles(3))
+    assert len(candles_manager._slot_by_time) == 3
+    assert candles_manager._get_time_index(all_candles[-1][PriceIndexes.IND_PRICE_TIME.value]) == -1
+    assert candles_manager._get_time_index(all_candles[2][PriceIndexes.IND_PRICE_TIME.value]) == 2
+
+
+def test_get_symbol_candles_data_without_copy():
+    candles_manager = CandlesManager()
+    candles_manager.add_old_and_new_candles(_gen_candles(10))
+    version = candles_manager.get_candles_version()
+    close_view = candles_manager.get_symbol_close_candles(3, copy=False)
+    assert isinstance(close_view, CandlesView)
+    assert close_view.version == version
+    assert close_view.flags.writeable is False
+    assert np.shares_memory(close_view, candles_manager.close_candles)
+    assert list(close_view) == [80000, 90000, 100000]
+    with pytest.raises(ValueError):
+        close_view[0] = 1
+    copied_close = candles_manager.get_symbol_close_candles(3)
+    assert not isinstance(copied_close, CandlesView)
+    assert copied_close.flags.writeable is True
+    assert not np.shares_memory(copied_close, candles_manager.close_candles)
+    prices = candles_manager.get_symbol_prices(2, copy=False)
+    assert all(isinstance(values, CandlesView) and values.version == version for values in prices.values())
+
+    # version changes on each candles update
+    candles_manager.add_new_candle(_get_candle(11))
+    assert candles_manager.get_candles_version() == version + 1
+    candles_manager.upsert_candle(_get_candle(11))
+    assert candles_manager.get_candles_version() == version + 2
+    # already added candle: no update
+    candles_manager.add_new_candle(_get_candle(11))
+    assert candles_manager.get_candles_version() == version + 2
+    candles_manager.replace_all_candles(_gen_candles(10))
+    assert candles_manager.get_candles_version() > version + 2
+    assert candles_manager.get_symbol_close_candles(3, copy=False).version == candles_manager.get_candles_version()
+
+
+def test_get_candles_array():
+    candles_manager = CandlesManager()
+    assert candles_manager.get_candles_array().shape == (0, len(PriceIndexes))
+    assert candles_manager.get_candles() == []
+    candles = _gen_candles(5)
+    candles_manager.add_old_and_new_candles(candles)
+    candles_array = candles_manager.get_candles_array()
+    assert candles_array.shape == (5, len(PriceIndexes))
+    assert candles_array.dtype == np.float64
+    assert candles_array.tolist() == candles
+    assert candles_manager.get_candles_array(2).tolist() == candles[-2:]
+    assert candles_manager.get_candles() == candles
+    assert candles_manager.get_candles(2) == candles[-2:]
+    assert candles_manager.get_candles(10) == candles
+    # values getters are views on the candles array
+    assert np.shares_memory(candles_manager.get_candles_array(copy=False), candles_manager.close_candles)
+    assert list(candles_manager.get_candles_array(3)[:, PriceIndexes.IND_PRICE_CLOSE.value]) == \
+        list(candles_manager.get_symbol_close_candles(3))
+
+    # reached max candles count
+    all_candles = _gen_candles(candles_manager.MAX_CANDLES_COUNT + 5)
+    candles_manager.add_old_and_new_candles(all_candles)
+    assert candles_manager.get_candles() == all_candles[-candles_manager.MAX_CANDLES_COUNT:]
+    assert candles_manager.get_candles(3) == all_candles[-3:]
+
+
 def _test_data(candles_data, expected_len, expected_last_val):
     assert len(candles_data) == expected_len
     if expected_len > 0:
@@ -0,0 +1,202 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import asyncio
+
+import mock
+import pytest
+
+from octobot_commons.enums import PriceIndexes, TimeFrames
+from octobot_trading.exchange_data.exchange_symbol_data import ExchangeSymbolData
+from octobot_trading.exchange_data.ohlcv.candles_cache import CandlesCache
+from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater import OHLCVUpdater
+
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+SYMBOL = "BTC/USDT"
+
+
+async def test_get_aggregated_time_frames():
+    updater, _ = await _create_updater([TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES, TimeFrames.ONE_WEEK])
+    assert updater._get_aggregated_time_frames() == [TimeFrames.FIVE_MINUTES]
+    updater.aggregate_time_frames = False
+    assert updater._get_aggregated_time_frames() == []
+
+
+async def test_push_aggregated_candles():
+    updater, symbol_data = await _create_updater()
+    push_mock = mock.AsyncMock(wraps=updater.push)
+    with mock.patch.object(updater, "push", push_mock):
+        # 1m candles until 4m: the [0, 5m[ candle is not completed
+        await _refresh_shortest_time_frame_candles(updater, 0, 5)
+        assert _get_pushed_candles(push_mock, TimeFrames.FIVE_MINUTES) == []
+
+        # 5m candle completed by the 4m candle
+        await _refresh_shortest_time_frame_candles(updater, 1, 6)
+        assert _get_pushed_candles(push_mock, TimeFrames.FIVE_MINUTES) == [[0, 0, 6, -1, 5, 5]]
+        updater.channel.exchange_manager.exchange.get_symbol_prices.assert_not_called()
+
+        # already aggregated candle
+        push_mock.reset_mock()
+        await _refresh_shortest_time_frame_candles(updater, 2, 7)
+        assert _get_pushed_candles(push_mock, TimeFrames.FIVE_MINUTES) == []
+
+        # several candles completed at once
+        await _refresh_shortest_time_frame_candles(updater, 6, 16)
+        assert _get_pushed_candles(push_mock, TimeFrames.FIVE_MINUTES) == [[300, 5, 11, 4, 10, 5],
+                                                                           [600, 10, 16, 9, 15, 5]]
+    assert symbol_data.symbol_candles[TimeFrames.FIVE_MINUTES].get_symbol_time_candles(3).tolist() == [0, 300, 600]
+
+
+async def test_push_aggregated_candles_with_missing_candles():
+    updater, symbol_data = await _create_updater()
+    exchange_candles = _gen_candles(0, 2, time_frame_minutes=5)
+    updater.channel.exchange_manager.exchange.get_symbol_prices = mock.AsyncMock(return_value=exchange_candles)
+    push_mock = mock.AsyncMock(wraps=updater.push)
+    with mock.patch.object(updater, "push", push_mock):
+        # 1m candles of [1m, 4m] only: the 5m candle can't be aggregated, use exchange candles
+        await _refresh_shortest_time_frame_candles(updater, 1, 6)
+    updater.channel.exchange_manager.exchange.get_symbol_prices.assert_called_once_with(
+        SYMBOL, TimeFrames.FIVE_MINUTES, limit=updater.OHLCV_LIMIT
+    )
+    assert _get_pushed_candles(push_mock, TimeFrames.FIVE_MINUTES) == [exchange_candles[0]]
+
+
+async def test_push_aggregated_candles_reconciliation():
+    updater, _ = await _create_updater()
+    updater.OHLCV_AGGREGATION_RECONCILIATION_INTERVAL = 3
+    get_symbol_prices_mock = updater.channel.exchange_manager.exchange.get_symbol_prices
+    get_symbol_prices_mock.return_value = _gen_candles(2, 4, time_frame_minutes=5)
+    push_mock = mock.AsyncMock(wraps=updater.push)
+    with mock.patch.object(updater, "push", push_mock):
+        for end_index in (6, 11):
+            await _refresh_shortest_time_frame_candles(updater, end_index - 6, end_index)
+        # first aggregated candles are built locally
+        get_symbol_prices_mock.assert_not_called()
+        assert _get_pushed_candles(push_mock, TimeFrames.FIVE_MINUTES) == [[0, 0, 6, -1, 5, 5],
+                                                                           [300, 5, 11, 4, 10, 5]]
+        # every OHLCV_AGGREGATION_RECONCILIATION_INTERVAL candles, exchange candles are used
+        push_mock.reset_mock()
+        await _refresh_shortest_time_frame_candles(updater, 10, 16)
+        get_symbol_prices_mock.assert_called_once()
+        assert _get_pushed_candles(push_mock, TimeFrames.FIVE_MINUTES) == [get_symbol_prices_mock.return_value[0]]
+        # counter is reset
+        push_mock.reset_mock()
+        await _refresh_shortest_time_frame_candles(updater, 15, 21)
+        get_symbol_prices_mock.assert_called_once()
+        assert _get_pushed_candles(push_mock, TimeFrames.FIVE_MINUTES) == [[900, 15, 21, 14, 20, 5]]
+
+
+async def test_push_aggregated_candles_stores_shortest_candles_once():
+    for is_consumed in (True, False):
+        updater, symbol_data = await _create_updater(is_consumed=is_consumed)
+        with mock.patch.object(symbol_data, "handle_candles_update",
+                               mock.AsyncMock(wraps=symbol_data.handle_candles_update)) as handle_candles_update_mock:
+            await _refresh_shortest_time_frame_candles(updater, 1, 6)
+            shortest_time_frame_calls = [
+                call
+                for call in handle_candles_update_mock.call_args_list
+                if call.args[0] is TimeFrames.ONE_MINUTE
+            ]
+            assert len(shortest_time_frame_calls) == 1
+        assert symbol_data.symbol_candles[TimeFrames.ONE_MINUTE].get_symbol_time_candles(1).tolist() == [240]
+
+
+async def test_get_cached_init_candles(tmp_path):
+    updater, _ = await _create_updater()
+    updater.OHLCV_OLD_LIMIT = 5
+    updater.candles_cache = CandlesCache(cache_path=str(tmp_path))
+    exchange_name = updater.channel.exchange_manager.exchange_name
+    updater.candles_cache.set_candles(exchange_name, SYMBOL, TimeFrames.ONE_MINUTE, _gen_candles(0, 9))
+    get_symbol_prices_mock = updater.channel.exchange_manager.exchange.get_symbol_prices
+    get_symbol_prices_mock.return_value = _gen_candles(8, 11)
+    loop = asyncio.get_event_loop()
+    with mock.patch.object(loop, "run_in_executor", mock.Mock(wraps=loop.run_in_executor)) as run_in_executor_mock, \
+            mock.patch("time.time", mock.Mock(return_value=10 * 60 + 30)):
+        candles = await updater._get_cached_init_candles(TimeFrames.ONE_MINUTE, SYMBOL)
+        # cache files are read and written in executor
+        assert run_in_executor_mock.call_count == 2
+    # last cached candles completed by fetched ones, including the current candle
+    get_symbol_prices_mock.assert_called_once_with(SYMBOL, TimeFrames.ONE_MINUTE, limit=3)
+    assert candles == _gen_candles(6, 11)
+    # only completed candles are cached
+    assert updater.candles_cache.get_candles(exchange_name, SYMBOL, TimeFrames.ONE_MINUTE).tolist()[-4:] == \
+        _gen_candles(6, 10)
+
+
+async def test_get_cached_init_candles_with_cache_errors(tmp_path):
+    updater, _ = await _create_updater()
+    updater.candles_cache = CandlesCache(cache_path=str(tmp_path))
+    fetched_candles = _gen_candles(0, 11)
+    updater.channel.exchange_manager.exchange.get_symbol_prices.return_value = fetched_candles
+    with mock.patch.object(updater.candles_cache, "get_candles", mock.Mock(side_effect=PermissionError)), \
+            mock.patch.object(updater.candles_cache, "set_candles", mock.Mock(side_effect=OSError)) \
+            as set_candles_mock:
+        # cache errors are ignored
+        assert await updater._get_cached_init_candles(TimeFrames.ONE_MINUTE, SYMBOL) == fetched_candles
+        set_candles_mock.assert_called_once()
+
+
+async def _create_updater(time_frames=None, is_consumed=True):
+    time_frames = time_frames or [TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES]
+    channel = mock.Mock()
+    exchange_manager = channel.exchange_manager
+    exchange_manager.exchange_name = "binanceus"
+    exchange_manager.is_backtesting = False
+    exchange_manager.is_margin = False
+    exchange_manager.is_future = False
+    exchange_manager.exchange_config.required_historical_candles_count = 0
+    exchange_manager.exchange_config.traded_time_frames = time_frames
+    exchange_manager.exchange_config.get_shortest_time_frame = mock.Mock(return_value=time_frames[0])
+    exchange_manager.exchange.get_symbol_prices = mock.AsyncMock(return_value=None)
+    symbol_data = ExchangeSymbolData(exchange_manager, SYMBOL)
+    exchange_manager.get_symbol_data = mock.Mock(return_value=symbol_data)
+    channel.get_filtered_consumers = mock.Mock(return_value=[mock.Mock()] if is_consumed else [])
+    updater = OHLCVUpdater(channel)
+    updater.send = mock.AsyncMock()
+    updater.aggregate_time_frames = True
+    updater.aggregated_time_frames = updater._get_aggregated_time_frames()
+    # initialized candles: 5m candles until [-5m, 0[ and 1m candles until [-1m, 0[
+    await symbol_data.handle_candles_update(TimeFrames.ONE_MINUTE, _gen_candles(-10, 0), replace_all=True)
+    await symbol_data.handle_candles_update(TimeFrames.FIVE_MINUTES, _gen_candles(-2, 0, time_frame_minutes=5),
+                                            replace_all=True)
+    for time_frame in time_frames:
+        updater._set_initialized(SYMBOL, time_frame, True)
+    return updater, symbol_data
+
+
+async def _refresh_shortest_time_frame_candles(updater, start_index, end_index):
+    # the last candle is the current one
+    candles = _gen_candles(start_index, end_index)
+    await updater._refresh_current_candle(TimeFrames.ONE_MINUTE, SYMBOL, candles, candles[-1], 0, 60)
+
+
+def _get_pushed_candles(push_mock, time_frame):
+    return [
+        candle
+        for call in push_mock.call_args_list
+        if call.args[0] is time_frame
+        for candle in call.args[2]
+    ]
+
+
+def _gen_candles(start_index, end_index, time_frame_minutes=1):
+    return [
+        [index * time_frame_minutes * 60, index, index + 2, index - 1, index + 1, 1]
+        for index in range(start_index, end_index)
+    ]
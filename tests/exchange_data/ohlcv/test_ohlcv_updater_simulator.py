@@ -0,0 +1,98 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import mock
+import pytest
+
+from octobot_commons.enums import TimeFrames
+import octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater_simulator as ohlcv_updater_simulator
+
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+SYMBOL = "BTC/USDT"
+TIME_FRAME = TimeFrames.ONE_MINUTE
+
+
+async def test_get_ohlcv_from_timestamps_sequential_timestamps():
+    updater, importer = _create_updater(prefetch_candles_count=5)
+    assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, 0, 60) == _get_rows(0, 60)
+    # data are read from the prefetched window
+    for timestamp in range(120, 360, 60):
+        assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, timestamp - 59, timestamp) == \
+            _get_rows(timestamp, timestamp)
+    assert importer.get_ohlcv_from_timestamps.call_count == 1
+    # across the prefetched window end: a new window is fetched
+    assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, 301, 420) == _get_rows(360, 420)
+    assert importer.get_ohlcv_from_timestamps.call_count == 2
+    assert importer.get_ohlcv_from_timestamps.call_args.kwargs["inferior_timestamp"] == 301
+    assert importer.get_ohlcv_from_timestamps.call_args.kwargs["superior_timestamp"] == 420 + 5 * 60
+
+
+async def test_get_ohlcv_from_timestamps_with_gaps():
+    updater, importer = _create_updater(prefetch_candles_count=5, missing_timestamps=(120, 180))
+    assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, 0, 60) == _get_rows(0, 60)
+    # missing candles
+    assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, 61, 120) == []
+    assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, 121, 180) == []
+    # skipped timestamps
+    assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, 241, 300) == _get_rows(300, 300)
+    assert importer.get_ohlcv_from_timestamps.call_count == 1
+    # gap over the prefetched window end
+    assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, 601, 900) == _get_rows(660, 900)
+    assert importer.get_ohlcv_from_timestamps.call_count == 2
+
+
+async def test_get_ohlcv_from_timestamps_with_rewinds():
+    updater, importer = _create_updater(prefetch_candles_count=5)
+    assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, 120, 180) == _get_rows(120, 180)
+    assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, 181, 300) == _get_rows(240, 300)
+    # rewind within the prefetched window
+    assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, 121, 240) == _get_rows(180, 240)
+    assert importer.get_ohlcv_from_timestamps.call_count == 1
+    # rewind before the prefetched window start
+    assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, 0, 120) == _get_rows(0, 120)
+    assert importer.get_ohlcv_from_timestamps.call_count == 2
+    # forward again across the prefetched window end
+    assert await updater._get_ohlcv_from_timestamps(SYMBOL, TIME_FRAME, 121, 600) == _get_rows(180, 600)
+    assert importer.get_ohlcv_from_timestamps.call_count == 3
+
+
+def _create_updater(prefetch_candles_count, missing_timestamps=()):
+    rows = [row for row in _get_rows(0, 3000) if row[0] not in missing_timestamps]
+
+    async def _get_ohlcv_from_timestamps(exchange_name=None, symbol=None, time_frame=None, limit=None,
+                                         inferior_timestamp=-1, superior_timestamp=-1):
+        return [row for row in rows if inferior_timestamp <= row[0] <= superior_timestamp]
+
+    importer = mock.Mock(get_ohlcv_from_timestamps=mock.AsyncMock(side_effect=_get_ohlcv_from_timestamps))
+    channel = mock.Mock()
+    channel.exchange_manager.exchange_config.get_shortest_time_frame = mock.Mock(return_value=TIME_FRAME)
+    channel.exchange.get_time_frames = mock.Mock(return_value=[TIME_FRAME])
+    with mock.patch.object(ohlcv_updater_simulator.api, "get_backtesting_current_time", mock.Mock(return_value=0)), \
+         mock.patch.object(ohlcv_updater_simulator.api, "get_available_symbols", mock.Mock(return_value=[SYMBOL])):
+        updater = ohlcv_updater_simulator.OHLCVUpdaterSimulator(channel, importer)
+    updater.ohlcv_prefetch_candles_count = prefetch_candles_count
+    return updater, importer
+
+
+def _get_rows(start_timestamp, end_timestamp):
+    # importer rows: (timestamp, candle)
+    return [
+        (timestamp, [timestamp, 1, 2, 0.5, 1.5, 10])
+        for timestamp in range(start_timestamp, end_timestamp + 1, 60)
+    ]
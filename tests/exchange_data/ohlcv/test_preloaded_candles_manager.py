@@ -0,0 +1,121 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import pytest
+
+import octobot_commons.constants as commons_constants
+from octobot_commons.enums import PriceIndexes
+from octobot_trading.exchange_data.ohlcv.preloaded_candles_manager import PreloadedCandlesManager
+
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_add_old_and_new_candles():
+    candles = _gen_candles(range(10))
+    candles_manager = await _create_preloaded_candles_manager(candles)
+    assert candles_manager.get_preloaded_symbol_candles_count() == 10
+
+    candles_manager.add_old_and_new_candles([candles[3]])
+    assert candles_manager.time_candles_index == 3
+    # following candles: index + 1 is used as a select length
+    candles_manager.add_old_and_new_candles([candles[4]])
+    assert candles_manager.time_candles_index == 5
+    assert candles_manager.get_symbol_time_candles(copy=False)[-1] == candles[4][0]
+    candles_manager.add_old_and_new_candles(candles[:10])
+    assert candles_manager.time_candles_index == 10
+    assert candles_manager.get_symbol_time_candles(copy=False)[-1] == candles[9][0]
+
+    # past candle
+    candles_manager.add_old_and_new_candles([candles[1]])
+    assert candles_manager.time_candles_index == 1
+
+    # unknown candle: index is not updated
+    candles_manager.add_old_and_new_candles(_gen_candles([20]))
+    assert candles_manager.time_candles_index == 1
+
+
+async def test_get_candle_index_with_missing_candles():
+    candles = _gen_candles([0, 1, 2, 5, 6, 9])
+    candles_manager = await _create_preloaded_candles_manager(candles)
+    assert candles_manager._get_candle_index(candles[0]) == 0
+    assert candles_manager._get_candle_index(candles[3]) == 3
+    candles_manager.add_old_and_new_candles([candles[2]])
+    assert candles_manager._get_candle_index(candles[3]) == 4
+    assert candles_manager._get_candle_index(candles[5]) == 6
+    assert candles_manager._get_candle_index(candles[0]) == 0
+    assert candles_manager._get_candle_index(_gen_candles([3])[0]) == commons_constants.DEFAULT_IGNORED_VALUE
+
+
+async def test_replace_all_candles_array():
+    candles = _gen_candles(range(10))
+    candles_manager = PreloadedCandlesManager()
+    await candles_manager.initialize()
+    # extra columns are ignored
+    candles_manager.replace_all_candles_array(np.array([candle + [42.0] for candle in candles]))
+    assert candles_manager.candles_initialized is True
+    assert candles_manager.get_preloaded_symbol_candles_count() == 10
+    candles_manager.add_old_and_new_candles([candles[8]])
+    candles_manager.add_old_and_new_candles([candles[9]])
+    assert candles_manager.get_candles() == candles
+    assert candles_manager.get_symbol_close_candles().dtype == np.float64
+
+
+async def test_compact_candles(tmp_path):
+    # large timestamps are kept as float64 values
+    candles = [[1700000000.0 + candle[0]] + candle[1:] for candle in _gen_candles(range(10))]
+    for mmap_path in (None, str(tmp_path / "candles.npy")):
+        candles_manager = await _create_preloaded_candles_manager(candles, compact=True, mmap_path=mmap_path)
+        assert candles_manager.get_preloaded_symbol_close_candles().dtype == np.float32
+        assert candles_manager.get_preloaded_symbol_time_candles().dtype == np.float64
+        # times are not duplicated in the float32 values block
+        assert candles_manager._candles.shape == (len(candles), len(PriceIndexes) - 1)
+        assert candles_manager.get_preloaded_symbol_time_candles().tolist() == [candle[0] for candle in candles]
+        assert candles_manager.get_preloaded_symbol_volume_candles().tolist() == \
+            [candle[PriceIndexes.IND_PRICE_VOL.value] for candle in candles]
+        copied_close_candles = candles_manager._extract_limited_data(candles_manager.close_candles)
+        assert copied_close_candles.dtype == np.float64
+        assert copied_close_candles.tolist() == [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles]
+        candles_manager.add_old_and_new_candles([candles[5]])
+        assert candles_manager.time_candles_index == 5
+        candles_manager.add_old_and_new_candles([candles[6]])
+        assert candles_manager.get_symbol_time_candles().tolist() == [candle[0] for candle in candles[:7]]
+        close_candles = candles_manager.get_symbol_close_candles(limit=3)
+        assert close_candles.dtype == np.float64
+        assert close_candles.tolist() == [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles[4:7]]
+        assert candles_manager.get_candles_array(copy=False).dtype == np.float64
+        assert candles_manager.get_candles_array(limit=2).tolist() == candles[5:7]
+        assert candles_manager.get_candles() == candles[:7]
+
+        updated_candle = list(candles[6])
+        updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 42.0
+        candles_manager.upsert_candle(updated_candle)
+        assert candles_manager.get_candles(1) == [updated_candle]
+
+
+async def _create_preloaded_candles_manager(candles, **kwargs):
+    candles_manager = PreloadedCandlesManager(**kwargs)
+    await candles_manager.initialize()
+    candles_manager.replace_all_candles(candles)
+    return candles_manager
+
+
+def _gen_candles(indexes):
+    return [
+        [float(index * 60), 1.0, 2.0, 0.5, 1.5, 10.0]
+        for index in indexes
+    ]
@@ -15,6 +15,7 @@
 #  License along with this library.
 from copy import deepcopy
 
+import mock
 import pytest
 import pytest_asyncio
 
@@ -30,7 +31,14 @@ pytestmark = pytest.mark.asyncio
 
 @pytest_asyncio.fixture()
 async def order_book_manager():
-    ob_manager = OrderBookManager()
+    ob_manager = OrderBookManager(is_l2=False)
+    await ob_manager.initialize()
+    return ob_manager
+
+
+@pytest_asyncio.fixture()
+async def l2_order_book_manager():
+    ob_manager = OrderBookManager(is_l2=True)
     await ob_manager.initialize()
     return ob_manager
 
@@ -197,6 +205,134 @@ async def test_handle_book_updates(order_book_manager):
     assert get_order_at_id_in_order_list("6", order_book_manager.asks)[ECOBIC.SIZE.value] == order_6_2[ECOBIC.SIZE.value]
 
 
+async def test_get_levels(order_book_manager):
+    order_book_manager.handle_new_books([[10, 1], [12, 2], [11, 3]], [[9, 1], [7, 2]])
+    order_book_manager.handle_book_adds([get_test_order(TradeOrderSide.SELL.value, "1", 12, 1.5)])
+    prices, sizes = order_book_manager.get_ask_levels()
+    assert prices.tolist() == [10, 11, 12]
+    assert sizes.tolist() == [1, 3, 3.5]
+    prices, sizes = order_book_manager.get_bid_levels()
+    assert prices.tolist() == [9, 7]
+    assert sizes.tolist() == [1, 2]
+
+
+async def test_l2_handle_new_books(l2_order_book_manager):
+    l2_order_book_manager.handle_new_books([[10, 1], [12, 2], [11, 3], [13, 0]], [[7, 2], [9, 1]], timestamp=1)
+    assert l2_order_book_manager.order_book_initialized
+    assert l2_order_book_manager.timestamp == 1
+    assert list(l2_order_book_manager.asks.items()) == [(10, 1), (11, 3), (12, 2)]
+    assert list(l2_order_book_manager.bids.items()) == [(7, 2), (9, 1)]
+    ask_price, ask_orders = l2_order_book_manager.get_ask()
+    assert ask_price == 10
+    assert ask_orders[0][ECOBIC.SIZE.value] == 1
+    assert ask_orders[0][ECOBIC.SIDE.value] == TradeOrderSide.SELL.value
+    bid_price, bid_orders = l2_order_book_manager.get_bid()
+    assert bid_price == 9
+    assert bid_orders[0][ECOBIC.SIZE.value] == 1
+    assert l2_order_book_manager.get_asks(11)[0][ECOBIC.SIZE.value] == 3
+    assert l2_order_book_manager.get_bids(11) is None
+
+
+async def test_l2_handle_level_updates(l2_order_book_manager):
+    l2_order_book_manager.handle_new_books([[10, 1], [12, 2]], [[7, 2], [9, 1]])
+    prices, sizes = l2_order_book_manager.get_ask_levels()
+    assert prices.tolist() == [10, 12]
+    # levels are cached until the next update
+    assert l2_order_book_manager.get_ask_levels()[0] is prices
+    l2_order_book_manager.handle_level_updates([[10, 0], [11, 4], [12, 1]], [[9.5, 3], [7, 0]], timestamp=2)
+    assert l2_order_book_manager.timestamp == 2
+    prices, sizes = l2_order_book_manager.get_ask_levels()
+    assert prices.tolist() == [11, 12]
+    assert sizes.tolist() == [4, 1]
+    prices, sizes = l2_order_book_manager.get_bid_levels()
+    assert prices.tolist() == [9.5, 9]
+    assert sizes.tolist() == [3, 1]
+    assert l2_order_book_manager.get_ask()[0] == 11
+    assert l2_order_book_manager.get_bid()[0] == 9.5
+
+
+async def test_handle_level_updates_requires_l2(order_book_manager):
+    with pytest.raises(ValueError):
+        order_book_manager.handle_level_updates([[10, 1]], [])
+
+
+async def test_l2_handle_book_snapshot(l2_order_book_manager):
+    assert l2_order_book_manager.handle_book_snapshot([[10, 1], [12, 2]], [[7, 2], [9, 1]], timestamp=1)
+    assert l2_order_book_manager.order_book_initialized
+    assert l2_order_book_manager.timestamp == 1
+    assert dict(l2_order_book_manager.asks) == {10: 1, 12: 2}
+    book_version = l2_order_book_manager.book_version
+    # same snapshot: nothing to update
+    assert not l2_order_book_manager.handle_book_snapshot([[10, 1], [12, 2]], [[7, 2], [9, 1]])
+    assert l2_order_book_manager.book_version == book_version
+    with mock.patch.object(l2_order_book_manager, "handle_level_updates",
+                           mock.Mock(wraps=l2_order_book_manager.handle_level_updates)) as handle_level_updates_mock:
+        assert l2_order_book_manager.handle_book_snapshot([[10, 1], [11, 3]], [[7, 2], [9, 1.5], [8, 0]])
+        # only changed levels are applied
+        handle_level_updates_mock.assert_called_once_with([[11, 3], [12, 0]], [[9, 1.5]])
+    assert dict(l2_order_book_manager.asks) == {10: 1, 11: 3}
+    assert dict(l2_order_book_manager.bids) == {7: 2, 9: 1.5}
+
+
+
+async def test_handle_book_snapshot(order_book_manager):
+    # non L2 books are rebuilt from the snapshot
+    assert order_book_manager.handle_book_snapshot([[10, 1], [12, 2]], [[7, 2], [9, 1]], timestamp=1)
+    assert order_book_manager.order_book_initialized
+    assert order_book_manager.timestamp == 1
+    assert order_book_manager.handle_book_snapshot([[10, 1], [11, 3]], [[9, 1.5]])
+    assert list(order_book_manager.asks) == [10, 11]
+    assert order_book_manager.get_asks(11)[0][ECOBIC.SIZE.value] == 3
+    prices, sizes = order_book_manager.get_bid_levels()
+    assert prices.tolist() == [9]
+    assert sizes.tolist() == [1.5]
+
+async def test_depth_analytics(l2_order_book_manager):
+    l2_order_book_manager.handle_new_books([[10, 1], [11, 2], [12, 3]], [[9, 1], [8, 2], [7, 3]])
+    # buy orders are filled by asks
+    assert l2_order_book_manager.cost_to_fill(0, TradeOrderSide.BUY.value) == 0
+    assert l2_order_book_manager.cost_to_fill(0.5, TradeOrderSide.BUY.value) == 5
+    assert l2_order_book_manager.cost_to_fill(2, TradeOrderSide.BUY.value) == 10 + 11
+    assert l2_order_book_manager.cost_to_fill(6, TradeOrderSide.BUY.value) == 10 + 22 + 36
+    assert l2_order_book_manager.cost_to_fill(7, TradeOrderSide.BUY.value) is None
+    assert l2_order_book_manager.vwap_for_quantity(2, TradeOrderSide.BUY.value) == 10.5
+    assert l2_order_book_manager.vwap_for_quantity(7, TradeOrderSide.BUY.value) is None
+    assert l2_order_book_manager.depth_within(0, TradeOrderSide.BUY.value) == 1
+    assert l2_order_book_manager.depth_within(10, TradeOrderSide.BUY.value) == 3
+    assert l2_order_book_manager.depth_within(50, TradeOrderSide.BUY.value) == 6
+    assert l2_order_book_manager.price_for_notional(10, TradeOrderSide.BUY.value) == 10
+    assert l2_order_book_manager.price_for_notional(11, TradeOrderSide.BUY.value) == 11
+    assert l2_order_book_manager.price_for_notional(100, TradeOrderSide.BUY.value) is None
+
+    # sell orders are filled by bids
+    assert l2_order_book_manager.cost_to_fill(2, TradeOrderSide.SELL.value) == 9 + 8
+    assert l2_order_book_manager.depth_within(12, TradeOrderSide.SELL.value) == 3
+    assert l2_order_book_manager.price_for_notional(30, TradeOrderSide.SELL.value) == 7
+
+    # results are updated with the book
+    l2_order_book_manager.handle_level_updates([[10, 0]], [])
+    assert l2_order_book_manager.cost_to_fill(2, TradeOrderSide.BUY.value) == 22
+    assert l2_order_book_manager.depth_within(0, TradeOrderSide.BUY.value) == 2
+
+    l2_order_book_manager.reset_order_book()
+    assert l2_order_book_manager.cost_to_fill(1, TradeOrderSide.BUY.value) is None
+    assert l2_order_book_manager.depth_within(1, TradeOrderSide.SELL.value) == 0
+
+
+async def test_l2_handle_book_orders(l2_order_book_manager):
+    l2_order_book_manager.handle_book_adds([
+        get_test_order(TradeOrderSide.BUY.value, "1", 10, 1),
+        get_test_order(TradeOrderSide.BUY.value, "2", 10, 2),
+        get_test_order(TradeOrderSide.SELL.value, "3", 11, 1),
+    ])
+    assert dict(l2_order_book_manager.bids) == {10: 3}
+    assert dict(l2_order_book_manager.asks) == {11: 1}
+    l2_order_book_manager.handle_book_updates([get_test_order(TradeOrderSide.BUY.value, "1", 10, 5)])
+    assert dict(l2_order_book_manager.bids) == {10: 5}
+    l2_order_book_manager.handle_book_deletes([get_test_order(TradeOrderSide.SELL.value, "3", 11)])
+    assert dict(l2_order_book_manager.asks) == {}
+
+
 def get_test_order(order_side, order_id, order_price=None, order_size=None):
     return {
         ECOBIC.SIDE.value: order_side,
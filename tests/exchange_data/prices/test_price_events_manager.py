@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
 import decimal
 import os
 import pytest
@@ -31,10 +32,11 @@ pytestmark = pytest.mark.asyncio
 
 async def test_reset(price_events_manager):
     if not os.getenv('CYTHON_IGNORE'):
-        price_events_manager.events.append(None)
+        price_events_manager.new_event(decimal_random_price(), random_timestamp(), True)
         assert price_events_manager.events
         price_events_manager.reset()
         assert not price_events_manager.events
+        assert not price_events_manager._check_events(decimal.Decimal("inf"), random_timestamp())
 
 
 async def test_new_event(price_events_manager):
@@ -171,3 +173,150 @@ async def test_remove_event(price_events_manager):
         price_events_manager.remove_event(event_2)
         assert event_2 not in price_events_manager.events
         assert len(price_events_manager.events) == 0
+
+
+async def test_check_events_with_many_events(price_events_manager):
+    above_events = [
+        price_events_manager.new_event(decimal.Decimal(str(price)), 10, True)
+        for price in range(1, 101)
+    ]
+    below_events = [
+        price_events_manager.new_event(decimal.Decimal(str(price)), 10, False)
+        for price in range(1, 101)
+    ]
+    # same price events
+    late_event = price_events_manager.new_event(decimal.Decimal("50"), 20, True)
+    same_price_event = price_events_manager.new_event(decimal.Decimal("50"), 10, True)
+    price_events_manager.remove_event(above_events[10])
+    assert above_events[10] not in price_events_manager.events
+
+    # timestamp is too early
+    price_events_manager.handle_price(decimal.Decimal("50"), 9)
+    assert not any(event.is_set() for event in above_events + below_events)
+
+    price_events_manager.handle_price(decimal.Decimal("50"), 10)
+    assert all(event.is_set() for event in above_events[:10] + above_events[11:50])
+    assert not any(event.is_set() for event in above_events[10:11] + above_events[50:])
+    assert all(event.is_set() for event in below_events[49:])
+    assert not any(event.is_set() for event in below_events[:49])
+    assert same_price_event.is_set()
+    assert not late_event.is_set()
+    assert len(price_events_manager.events) == 50 + 49 + 1
+
+    price_events_manager.handle_price(decimal.Decimal("50"), 20)
+    assert late_event.is_set()
+    assert len(price_events_manager.events) == 50 + 49
+
+
+async def test_handle_recent_trades_batch(price_events_manager):
+    above_event = price_events_manager.new_event(decimal.Decimal("110"), 10, True)
+    late_above_event = price_events_manager.new_event(decimal.Decimal("105"), 30, True)
+    below_event = price_events_manager.new_event(decimal.Decimal("90"), 10, False)
+    late_below_event = price_events_manager.new_event(decimal.Decimal("95"), 30, False)
+    price_events_manager.handle_recent_trades([
+        decimal_random_recent_trade(price=decimal.Decimal("120"), timestamp=20),
+        decimal_random_recent_trade(price=decimal.Decimal("80"), timestamp=5),
+        decimal_random_recent_trade(price=decimal.Decimal("100"), timestamp=30),
+    ])
+    assert above_event.is_set()
+    # 120 is before late_above_event timestamp
+    assert not late_above_event.is_set()
+    # 80 is before below_event timestamp
+    assert not below_event.is_set()
+    assert not late_below_event.is_set()
+    assert len(price_events_manager.events) == 3
+
+    # triggered by recent prices
+    assert price_events_manager.new_event(decimal.Decimal("100"), 30, True).is_set()
+    assert not price_events_manager.new_event(decimal.Decimal("101"), 30, True).is_set()
+    assert price_events_manager.new_event(decimal.Decimal("80"), 5, False).is_set()
+    assert not price_events_manager.new_event(decimal.Decimal("80"), 6, False).is_set()
+
+
+async def test_add_event_callback(price_events_manager):
+    calls = []
+
+    def _callback(name):
+        async def _call():
+            calls.append(name)
+        return _call
+
+    event_1 = price_events_manager.new_event(decimal.Decimal("10"), 1, True)
+    event_2 = price_events_manager.new_event(decimal.Decimal("5"), 1, True)
+    event_3 = price_events_manager.new_event(decimal.Decimal("7"), 1, True)
+    removed_event = price_events_manager.new_event(decimal.Decimal("1"), 1, True)
+    price_events_manager.add_event_callback(event_1, _callback("event_1"))
+    price_events_manager.add_event_callback(event_2, _callback("event_2"))
+    price_events_manager.add_event_callback(event_3, _callback("event_3"))
+    price_events_manager.add_event_callback(removed_event, _callback("removed_event"))
+    price_events_manager.remove_event(removed_event)
+
+    price_events_manager.handle_price(decimal.Decimal("8"), 2)
+    assert calls == []
+    await asyncio.sleep(0)
+    # called in trigger order
+    assert calls == ["event_2", "event_3"]
+
+    # already set event
+    instant_event = price_events_manager.new_event(decimal.Decimal("8"), 1, True)
+    assert instant_event.is_set()
+    price_events_manager.add_event_callback(instant_event, _callback("instant_event"))
+    price_events_manager.handle_price(decimal.Decimal("10"), 2)
+    await asyncio.sleep(0)
+    assert calls == ["event_2", "event_3", "instant_event", "event_1"]
+
+    # callbacks triggered before their event is removed are not called
+    removed_triggered_event = price_events_manager.new_event(decimal.Decimal("15"), 1, True)
+    price_events_manager.add_event_callback(removed_triggered_event, _callback("removed_triggered_event"))
+    kept_event = price_events_manager.new_event(decimal.Decimal("16"), 1, True)
+    price_events_manager.add_event_callback(kept_event, _callback("kept_event"))
+    price_events_manager.handle_price(decimal.Decimal("16"), 2)
+    price_events_manager.remove_event(removed_triggered_event)
+    await asyncio.sleep(0)
+    assert calls == ["event_2", "event_3", "instant_event", "event_1", "kept_event"]
+
+    # callbacks triggered before a reset are not called
+    reset_event = price_events_manager.new_event(decimal.Decimal("20"), 1, True)
+    price_events_manager.add_event_callback(reset_event, _callback("reset_event"))
+    price_events_manager.handle_price(decimal.Decimal("20"), 2)
+    price_events_manager.reset()
+    await asyncio.sleep(0)
+    assert calls == ["event_2", "event_3", "instant_event", "event_1", "kept_event"]
+
+
+async def test_new_trailing_event(price_events_manager):
+    sell_event = price_events_manager.new_trailing_event(decimal.Decimal("100"), 10, False, decimal.Decimal("10"))
+    assert price_events_manager.get_trailing_stop_price(sell_event) == decimal.Decimal("90")
+    # prices before timestamp are ignored
+    price_events_manager.handle_price(decimal.Decimal("200"), 9)
+    assert price_events_manager.get_trailing_stop_price(sell_event) == decimal.Decimal("90")
+    # stop price follows the highest price
+    price_events_manager.handle_recent_trades([
+        decimal_random_recent_trade(price=decimal.Decimal("120"), timestamp=11),
+        decimal_random_recent_trade(price=decimal.Decimal("110"), timestamp=12),
+    ])
+    assert not sell_event.is_set()
+    assert price_events_manager.get_trailing_stop_price(sell_event) == decimal.Decimal("108")
+    # new highest price then stop price in the same update
+    price_events_manager.handle_recent_trades([
+        decimal_random_recent_trade(price=decimal.Decimal("116"), timestamp=14),
+        decimal_random_recent_trade(price=decimal.Decimal("130"), timestamp=13),
+    ])
+    assert sell_event.is_set()
+    assert price_events_manager.get_trailing_stop_price(sell_event) is None
+
+    # instantly triggered by recent prices
+    assert price_events_manager.new_trailing_event(decimal.Decimal("125"), 10, False, decimal.Decimal("5")).is_set()
+    assert not price_events_manager.new_trailing_event(decimal.Decimal("125"), 10, False, decimal.Decimal("5"),
+                                                       allow_instant_fill=False).is_set()
+
+    price_events_manager.reset()
+    buy_event = price_events_manager.new_trailing_event(decimal.Decimal("100"), 10, True, decimal.Decimal("10"))
+    assert price_events_manager.get_trailing_stop_price(buy_event) == decimal.Decimal("110")
+    # stop price follows the lowest price
+    price_events_manager.handle_price(decimal.Decimal("95"), 11)
+    price_events_manager.handle_price(decimal.Decimal("100"), 12)
+    assert not buy_event.is_set()
+    assert price_events_manager.get_trailing_stop_price(buy_event) == decimal.Decimal("104.5")
+    price_events_manager.handle_price(decimal.Decimal("104.5"), 13)
+    assert buy_event.is_set()
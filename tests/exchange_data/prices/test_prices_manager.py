@@ -20,7 +20,7 @@ import pytest
 import asyncio
 
 import octobot_commons.constants as constants
-from octobot_trading.enums import MarkPriceSources
+from octobot_trading.enums import MarkPriceSources, MarkPriceEstimators, ExchangeConstantsOrderColumns as ECOC
 import octobot_trading.constants
 from octobot_trading.exchange_data.prices.prices_manager import calculate_mark_price_from_recent_trade_prices
 
@@ -171,6 +171,32 @@ async def test_calculate_mark_price_from_recent_trade_prices():
     assert calculate_mark_price_from_recent_trade_prices([]) == decimal.Decimal(0)
 
 
+async def test_update_estimated_mark_price(prices_manager):
+    def _trade(price, amount, timestamp):
+        return {ECOC.PRICE.value: price, ECOC.AMOUNT.value: amount, ECOC.TIMESTAMP.value: timestamp}
+
+    assert prices_manager.update_estimated_mark_price([]) is None
+    trades = [_trade(10, 1, 0), _trade(20, 3, 0)]
+    prices_manager.set_mark_price_estimator(MarkPriceEstimators.LAST.value)
+    assert prices_manager.update_estimated_mark_price(trades) == decimal.Decimal(20)
+    prices_manager.set_mark_price_estimator(MarkPriceEstimators.MEAN.value)
+    assert prices_manager.update_estimated_mark_price(trades) == decimal.Decimal(15)
+    # mean of decimal prices
+    assert prices_manager.update_estimated_mark_price(
+        [_trade(0.1, 1, 0), _trade(0.2, 1, 0), _trade(0.3, 1, 0)]
+    ) == decimal.Decimal("0.2")
+
+    prices_manager.set_mark_price_estimator(MarkPriceEstimators.VWAP.value, half_life=60)
+    assert prices_manager.update_estimated_mark_price(trades) == decimal.Decimal("17.5")
+    # previous trades weight is divided by 2 after 60 seconds: (17.5 * 2 + 10 * 2) / 4
+    assert prices_manager.update_estimated_mark_price([_trade(10, 2, 60)]) == decimal.Decimal("13.75")
+
+    prices_manager.set_mark_price_estimator(MarkPriceEstimators.EMA.value)
+    assert prices_manager.update_estimated_mark_price(trades) == decimal.Decimal(15)
+    # (15 * 1 + 30 * 1) / 2
+    assert prices_manager.update_estimated_mark_price([_trade(30, 1000, 60)]) == decimal.Decimal("22.5")
+
+
 def check_event_is_set(prices_manager):
     if not os.getenv('CYTHON_IGNORE'):
         assert prices_manager.mark_price_set_time == prices_manager.exchange_manager.exchange.get_exchange_current_time()
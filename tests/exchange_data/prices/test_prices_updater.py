@@ -0,0 +1,118 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import asyncio
+import decimal
+
+import mock
+import pytest
+
+import octobot_trading.errors as errors
+from octobot_trading.enums import ExchangeConstantsMarkPriceColumns as MPC
+from octobot_trading.exchange_data.prices.channel.prices_updater import MarkPriceUpdater
+from octobot_trading.exchanges.util.rest_requests_scheduler import RestRequestsScheduler
+
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+PAIRS = ["BTC/USDT:USDT", "ETH/USDT:USDT", "SOL/USDT:USDT"]
+
+
+async def test_fetch_mark_prices_in_bulk():
+    updater = _create_updater()
+    exchange = updater.channel.exchange_manager.exchange
+    exchange.get_mark_prices = mock.AsyncMock(return_value={
+        PAIRS[2]: _mark_price(PAIRS[2]),
+        PAIRS[0]: _mark_price(PAIRS[0]),
+    })
+    assert await updater._fetch_mark_prices(PAIRS) == [
+        (_mark_price(PAIRS[0]), None),
+        (None, None),
+        (_mark_price(PAIRS[2]), None),
+    ]
+    exchange.get_mark_prices.assert_called_once_with(PAIRS)
+    exchange.get_mark_price.assert_not_called()
+    assert updater.is_bulk_fetching
+    # nothing to fetch
+    assert await updater._fetch_mark_prices([]) == []
+    exchange.get_mark_prices.assert_called_once()
+
+
+async def test_fetch_mark_prices_bulk_failure():
+    updater = _create_updater()
+    exchange = updater.channel.exchange_manager.exchange
+    exchange.get_mark_prices = mock.AsyncMock(side_effect=errors.FailedRequest)
+    assert await updater._fetch_mark_prices(PAIRS) == [(None, None)] * len(PAIRS)
+    exchange.get_mark_price.assert_not_called()
+    # still bulk fetching on next update
+    assert updater.is_bulk_fetching
+
+
+async def test_fetch_mark_prices_bulk_not_supported():
+    for error in (errors.NotSupported, NotImplementedError):
+        updater = _create_updater()
+        exchange = updater.channel.exchange_manager.exchange
+        exchange.get_mark_prices = mock.AsyncMock(side_effect=error)
+        assert await updater._fetch_mark_prices(PAIRS) == [(_mark_price(pair), None) for pair in PAIRS]
+        assert updater.is_bulk_fetching is False
+        assert [call.args[0] for call in exchange.get_mark_price.call_args_list] == PAIRS
+
+        # bulk fetching is not tried again
+        exchange.get_mark_prices.reset_mock()
+        await updater._fetch_mark_prices(PAIRS)
+        exchange.get_mark_prices.assert_not_called()
+
+
+async def test_fetch_mark_prices_concurrently_keeps_pairs_order():
+    updater = _create_updater()
+    updater.is_bulk_fetching = False
+    updater.fetch_concurrency = len(PAIRS)
+    exchange = updater.channel.exchange_manager.exchange
+    fetching = []
+
+    async def _get_mark_price(symbol):
+        fetching.append(symbol)
+        # first pairs are the last ones to be fetched
+        await asyncio.sleep(0.01 * (len(PAIRS) - PAIRS.index(symbol)))
+        return _mark_price(symbol)
+
+    exchange.get_mark_price = mock.AsyncMock(side_effect=_get_mark_price)
+    fetched_mark_prices = await updater._fetch_mark_prices(PAIRS)
+    assert fetching == PAIRS
+    assert fetched_mark_prices == [(_mark_price(pair), None) for pair in PAIRS]
+    for pair, (mark_price, funding_rate) in zip(PAIRS, fetched_mark_prices):
+        assert await updater._push_mark_price(pair, mark_price, funding_rate) == _mark_price(pair)[MPC.MARK_PRICE.value]
+    assert [call.args for call in updater.push.call_args_list] == \
+        [(pair, _mark_price(pair)[MPC.MARK_PRICE.value]) for pair in PAIRS]
+
+
+def _create_updater():
+    channel = mock.Mock()
+    exchange_manager = channel.exchange_manager
+    exchange_manager.exchange_config.traded_symbol_pairs = PAIRS
+    exchange_manager.exchange.FUNDING_WITH_MARK_PRICE = False
+    exchange_manager.rest_requests_scheduler = RestRequestsScheduler(exchange_manager, enabled=False)
+    exchange_manager.rest_requests_scheduler.set_budget(10)
+    exchange_manager.exchange.get_mark_price = mock.AsyncMock(side_effect=_mark_price)
+    updater = MarkPriceUpdater(channel)
+    updater.is_bulk_fetching = True
+    updater.push = mock.AsyncMock()
+    return updater
+
+
+def _mark_price(symbol):
+    return {MPC.MARK_PRICE.value: decimal.Decimal(str(100 + PAIRS.index(symbol)))}
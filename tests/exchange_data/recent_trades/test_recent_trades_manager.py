@@ -17,6 +17,7 @@ import os
 
 import pytest
 
+from octobot_trading.exchange_data.recent_trades.recent_trades_manager import RecentTradesManager
 from tests.exchange_data import recent_trades_manager, price_events_manager
 
 # All test coroutines will be treated as marked.
@@ -125,3 +126,33 @@ async def test_reset_recent_trades(recent_trades_manager):
             recent_trades_manager.recent_trades[0]
         with pytest.raises(IndexError):
             recent_trades_manager.liquidations[0]
+
+
+async def test_add_new_trades_window():
+    recent_trades_manager = RecentTradesManager(max_recent_trades_count=3)
+    trades = [dict(random_recent_trade(), id=str(i)) for i in range(5)]
+    assert recent_trades_manager.add_new_trades(trades[:3]) == trades[:3]
+    # same id: already known trade
+    assert recent_trades_manager.add_new_trades([dict(trades[1], price=1)]) == []
+    assert recent_trades_manager.add_new_trades(trades[2:5]) == trades[3:5]
+    assert list(recent_trades_manager.recent_trades) == trades[2:5]
+    # removed trades are not known anymore
+    assert recent_trades_manager.add_new_trades([trades[0], trades[4]]) == [trades[0]]
+    assert list(recent_trades_manager.recent_trades) == trades[3:5] + [trades[0]]
+
+    # without id
+    trade = random_recent_trade()
+    assert recent_trades_manager.add_new_trades([trade, dict(trade)]) == [trade]
+    assert recent_trades_manager.add_new_trades([dict(trade)]) == []
+
+
+async def test_set_all_recent_trades_with_duplicates():
+    recent_trades_manager = RecentTradesManager(max_recent_trades_count=3)
+    trades = [dict(random_recent_trade(), id=str(i)) for i in range(4)]
+    recent_trades_manager.set_all_recent_trades([trades[0], trades[1], trades[1], trades[2]])
+    assert list(recent_trades_manager.recent_trades) == trades[:3]
+    assert list(recent_trades_manager._recent_trade_keys) == ["0", "1", "2"]
+    assert recent_trades_manager.add_new_trades([trades[2], trades[3]]) == [trades[3]]
+    assert list(recent_trades_manager.recent_trades) == trades[1:4]
+    # trades still in recent_trades are still known
+    assert recent_trades_manager.add_new_trades([trades[1]]) == []
@@ -0,0 +1,106 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import mock
+import pytest
+
+import async_channel.constants as channel_constants
+
+from octobot_trading.exchange_data.pairs_polling_scheduler import PairsPollingScheduler, is_pair_consumed
+
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+BTC_USDT = "BTC/USDT"
+ETH_USDT = "ETH/USDT"
+
+
+async def test_is_pair_consumed():
+    assert is_pair_consumed([_create_channel([BTC_USDT])], BTC_USDT)
+    assert not is_pair_consumed([_create_channel([BTC_USDT])], ETH_USDT)
+    assert is_pair_consumed([_create_channel([BTC_USDT]), _create_channel([ETH_USDT])], ETH_USDT)
+    assert is_pair_consumed([_create_channel([channel_constants.CHANNEL_WILDCARD])], ETH_USDT)
+    assert not is_pair_consumed([], ETH_USDT)
+
+
+async def test_get_pairs_to_refresh():
+    scheduler = _create_scheduler()
+    channels = [_create_channel([BTC_USDT, ETH_USDT])]
+    # unknown pairs are refreshed, not consumed pairs are never refreshed
+    assert scheduler.get_pairs_to_refresh([BTC_USDT, ETH_USDT, "XRP/USDT"], channels, current_time=0) == \
+        [BTC_USDT, ETH_USDT]
+    scheduler.update_pair(BTC_USDT, 100, current_time=0)
+    scheduler.update_pair(ETH_USDT, 10, current_time=0)
+    assert scheduler.get_pairs_to_refresh([BTC_USDT, ETH_USDT], channels, current_time=5) == []
+    assert scheduler.get_pairs_to_refresh([BTC_USDT, ETH_USDT], channels, current_time=10) == [BTC_USDT, ETH_USDT]
+
+
+async def test_update_pair_refresh_times():
+    scheduler = _create_scheduler()
+    scheduler.update_pair(BTC_USDT, 100, current_time=0)
+    assert scheduler.pairs[BTC_USDT][scheduler.NEXT_REFRESH_TIME] == 10
+    # volatile pair: refreshed more often
+    scheduler.update_pair(BTC_USDT, 105, current_time=10)
+    assert scheduler.pairs[BTC_USDT][scheduler.NEXT_REFRESH_TIME] == 15
+    # idle pair: backs off
+    for refresh_time in range(15, 200, 5):
+        scheduler.update_pair(BTC_USDT, 105, current_time=refresh_time)
+    assert scheduler.pairs[BTC_USDT][scheduler.NEXT_REFRESH_TIME] == 195 + 40
+
+    # unavailable price: volatility and reference price are kept
+    volatility = scheduler.pairs[BTC_USDT][scheduler.VOLATILITY]
+    scheduler.update_pair(BTC_USDT, None, current_time=300)
+    assert scheduler.pairs[BTC_USDT][:3] == [105, 195, volatility]
+    assert scheduler.pairs[BTC_USDT][scheduler.NEXT_REFRESH_TIME] == 340
+
+    # active pairs do not back off
+    scheduler.exchange_manager.exchange_personal_data.orders_manager.get_open_orders = \
+        mock.Mock(return_value=[mock.Mock(symbol=BTC_USDT)])
+    scheduler.get_pairs_to_refresh([BTC_USDT], [], current_time=400)
+    assert scheduler.active_pairs == {BTC_USDT}
+    scheduler.update_pair(BTC_USDT, 105, current_time=400)
+    assert scheduler.pairs[BTC_USDT][scheduler.NEXT_REFRESH_TIME] == 410
+
+    scheduler.remove_pair(BTC_USDT)
+    assert scheduler.pairs == {}
+
+
+async def test_get_active_pairs():
+    scheduler = _create_scheduler()
+    scheduler.exchange_manager.is_future = True
+    exchange_personal_data = scheduler.exchange_manager.exchange_personal_data
+    exchange_personal_data.orders_manager.get_open_orders = mock.Mock(return_value=[mock.Mock(symbol=BTC_USDT)])
+    exchange_personal_data.positions_manager.get_symbol_positions = mock.Mock(return_value=[
+        mock.Mock(symbol=ETH_USDT, is_idle=mock.Mock(return_value=False)),
+        mock.Mock(symbol="XRP/USDT", is_idle=mock.Mock(return_value=True)),
+    ])
+    assert scheduler._get_active_pairs() == {BTC_USDT, ETH_USDT}
+
+
+def _create_scheduler():
+    exchange_manager = mock.Mock(is_future=False)
+    exchange_manager.exchange_personal_data.orders_manager.get_open_orders = mock.Mock(return_value=[])
+    return PairsPollingScheduler(exchange_manager, 10, min_refresh_time_ratio=0.5, max_refresh_time_ratio=4,
+                                 volatility_threshold=0.01)
+
+
+def _create_channel(consumed_symbols):
+    channel = mock.Mock()
+    channel.get_filtered_consumers = mock.Mock(
+        side_effect=lambda symbol: [mock.Mock()] if symbol in consumed_symbols else []
+    )
+    return channel
@@ -0,0 +1,127 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import mock
+import pytest
+
+import octobot_trading.errors as errors
+from octobot_trading.enums import ExchangeConstantsTickersColumns as ETC
+from octobot_trading.exchange_data.ticker.channel.ticker_updater import TickerUpdater
+from octobot_trading.exchanges.util.rest_requests_scheduler import RestRequestsScheduler
+
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+PAIRS = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "ADA/USDT", "DOT/USDT"]
+
+
+async def test_get_bulk_fetch_chunks():
+    updater = _create_updater()
+    assert updater._get_bulk_fetch_chunks(PAIRS) == [PAIRS]
+    assert updater._get_bulk_fetch_chunks([]) == []
+    updater.bulk_fetch_chunk_size = 2
+    assert updater._get_bulk_fetch_chunks(PAIRS) == [PAIRS[:2], PAIRS[2:4], PAIRS[4:]]
+    updater.bulk_fetch_chunk_size = 5
+    assert updater._get_bulk_fetch_chunks(PAIRS) == [PAIRS]
+
+
+async def test_fetch_all_tickers_by_chunks():
+    updater = _create_updater()
+    updater.bulk_fetch_chunk_size = 2
+    get_all_currencies_price_ticker = updater.channel.exchange_manager.exchange.get_all_currencies_price_ticker
+    await updater._fetch_all_tickers(PAIRS)
+    assert [call.kwargs["symbols"] for call in get_all_currencies_price_ticker.call_args_list] == \
+        [PAIRS[:2], PAIRS[2:4], PAIRS[4:]]
+    assert [call.args[0] for call in updater.push.call_args_list] == PAIRS
+    assert updater.push.call_args_list[0].args[1] == _ticker(PAIRS[0])
+
+
+async def test_fetch_all_tickers_ignores_invalid_tickers():
+    updater = _create_updater()
+    updater.channel.exchange_manager.exchange.get_all_currencies_price_ticker = mock.AsyncMock(return_value={
+        PAIRS[0]: _ticker(PAIRS[0]),
+        PAIRS[1]: dict(_ticker(PAIRS[1]), **{ETC.CLOSE.value: None}),
+    })
+    await updater._fetch_all_tickers(PAIRS[:3])
+    assert [call.args[0] for call in updater.push.call_args_list] == PAIRS[:1]
+
+
+async def test_fetch_all_tickers_with_failed_request():
+    updater = _create_updater()
+    exchange = updater.channel.exchange_manager.exchange
+    get_all_currencies_price_ticker = exchange.get_all_currencies_price_ticker
+    exchange.get_all_currencies_price_ticker = mock.AsyncMock(side_effect=errors.FailedRequest("too many symbols"))
+    with mock.patch("asyncio.sleep", mock.AsyncMock()):
+        await updater._fetch_all_tickers(PAIRS)
+    updater.push.assert_not_called()
+    # chunk size is halved
+    assert updater.bulk_fetch_chunk_size == 3
+    assert updater.is_bulk_fetching
+
+    exchange.get_all_currencies_price_ticker = get_all_currencies_price_ticker
+    await updater._fetch_all_tickers(PAIRS)
+    assert [call.kwargs["symbols"] for call in get_all_currencies_price_ticker.call_args_list] == \
+        [PAIRS[:3], PAIRS[3:]]
+    assert [call.args[0] for call in updater.push.call_args_list] == PAIRS
+
+    # failing single pair request: chunk size is not changed
+    exchange.get_all_currencies_price_ticker = mock.AsyncMock(side_effect=errors.FailedRequest("error"))
+    updater.bulk_fetch_chunk_size = 1
+    with mock.patch("asyncio.sleep", mock.AsyncMock()):
+        await updater._fetch_all_tickers(PAIRS[:1])
+    assert updater.bulk_fetch_chunk_size == 1
+
+
+async def test_fetch_all_tickers_not_supported():
+    for error in (errors.NotSupported, NotImplementedError):
+        updater = _create_updater()
+        updater.bulk_fetch_chunk_size = 2
+        exchange = updater.channel.exchange_manager.exchange
+        exchange.get_all_currencies_price_ticker = mock.AsyncMock(side_effect=error)
+        await updater._fetch_all_tickers(PAIRS)
+        exchange.get_all_currencies_price_ticker.assert_called_once()
+        assert updater.is_bulk_fetching is False
+        # tickers are fetched pair by pair instead
+        assert [call.args[0] for call in exchange.get_price_ticker.call_args_list] == PAIRS
+        assert [call.args[0] for call in updater.push.call_args_list] == PAIRS
+
+
+def _create_updater():
+    channel = mock.Mock()
+    exchange_manager = channel.exchange_manager
+    exchange_manager.exchange_name = "binanceus"
+    exchange_manager.exchange_config.traded_symbol_pairs = PAIRS
+    exchange_manager.rest_requests_scheduler = RestRequestsScheduler(exchange_manager, enabled=False)
+    exchange_manager.rest_requests_scheduler.set_budget(10)
+    exchange_manager.exchange.get_all_currencies_price_ticker = mock.AsyncMock(
+        side_effect=lambda symbols: {symbol: _ticker(symbol) for symbol in symbols}
+    )
+    exchange_manager.exchange.get_price_ticker = mock.AsyncMock(side_effect=_ticker)
+    updater = TickerUpdater(channel)
+    updater.is_bulk_fetching = True
+    updater.bulk_fetch_chunk_size = 0
+    updater.push = mock.AsyncMock()
+    return updater
+
+
+def _ticker(symbol):
+    return {
+        ETC.SYMBOL.value: symbol,
+        ETC.CLOSE.value: 10.0,
+        ETC.BASE_VOLUME.value: 100.0,
+        ETC.TIMESTAMP.value: 1,
+    }
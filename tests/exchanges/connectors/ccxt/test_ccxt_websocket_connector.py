@@ -0,0 +1,78 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import mock
+import pytest
+
+import octobot_trading.exchanges as exchanges
+import octobot_trading.exchange_data as exchange_data
+from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
+
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+SYMBOL = "BTC/USDT"
+
+
+class MockedCCXTWebsocketConnector(exchanges.CCXTWebsocketConnector):
+    @classmethod
+    def get_name(cls):
+        return "binanceus"
+
+
+@pytest.fixture
+def ccxt_websocket_connector():
+    with mock.patch.object(MockedCCXTWebsocketConnector, "_create_client", mock.Mock()):
+        connector = MockedCCXTWebsocketConnector({}, mock.Mock())
+    connector.push_to_channel = mock.AsyncMock()
+    return connector
+
+
+async def test_book_snapshots(ccxt_websocket_connector):
+    for is_l2 in (False, True):
+        ccxt_websocket_connector.books[SYMBOL] = book_instance = exchange_data.OrderBookManager(is_l2=is_l2)
+        ccxt_websocket_connector.push_to_channel.reset_mock()
+        for index in range(10):
+            await ccxt_websocket_connector.book(_order_book([[10 + index, 1], [11 + index, 2]], [[9 - index, 3]]),
+                                                symbol=SYMBOL)
+            # each snapshot replaces the previous one: the book size is bounded
+            assert list(book_instance.asks) == [10 + index, 11 + index]
+            assert list(book_instance.bids) == [9 - index]
+        assert ccxt_websocket_connector.push_to_channel.call_count == 10
+
+
+async def test_book_l2_snapshot_nonces(ccxt_websocket_connector):
+    ccxt_websocket_connector.books[SYMBOL] = book_instance = exchange_data.OrderBookManager(is_l2=True)
+    await ccxt_websocket_connector.book(_order_book([[10, 1]], [[9, 1]], nonce=2), symbol=SYMBOL)
+    # already up-to-date book: not pushed
+    await ccxt_websocket_connector.book(_order_book([[10, 1]], [[9, 1]], nonce=2), symbol=SYMBOL)
+    assert ccxt_websocket_connector.push_to_channel.call_count == 1
+    # restarted sequence: book is reloaded
+    await ccxt_websocket_connector.book(_order_book([[11, 1]], [[8, 1]], nonce=1), symbol=SYMBOL)
+    assert ccxt_websocket_connector.push_to_channel.call_count == 2
+    assert dict(book_instance.asks) == {11: 1}
+    assert dict(book_instance.bids) == {8: 1}
+
+
+def _order_book(asks, bids, nonce=None):
+    return {
+        ECOBIC.ASKS.value: asks,
+        ECOBIC.BIDS.value: bids,
+        ECOBIC.TIMESTAMP.value: 1,
+        ECOBIC.NONCE.value: nonce,
+    }
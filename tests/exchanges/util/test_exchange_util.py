@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
 import pytest
 import mock
 import trading_backend.exchanges
@@ -20,6 +21,8 @@ import trading_backend.exchanges
 from tests import event_loop
 import octobot_commons.constants as commons_constants
 import octobot_commons.configuration as commons_configuration
+import octobot_commons.enums as commons_enums
+import octobot_trading.errors as errors
 import octobot_trading.exchanges as exchanges
 
 pytestmark = pytest.mark.asyncio
@@ -106,3 +109,62 @@ async def test_is_compatible_account_with_unchecked_exchange(exchange_config, te
         assert auth is False
         assert "authentication" in error and len(error) > len("authentication")
         is_valid_account_mock.assert_called_once()
+
+
+async def test_get_concurrent_historical_ohlcv():
+    time_frame_seconds = 60
+    exchange_candles = [
+        [float(i * time_frame_seconds), 1.0, 2.0, 0.5, 1.5, 10.0]
+        for i in range(100)
+    ]
+
+    async def get_symbol_prices(symbol, time_frame, limit=None, since=None):
+        # this exchange returns at most 7 candles per request
+        return [
+            list(candle)
+            for candle in exchange_candles
+            if candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] * 1000 >= since
+        ][:min(limit or 7, 7)]
+
+    exchange_manager = mock.Mock(exchange=mock.Mock(get_symbol_prices=mock.AsyncMock(side_effect=get_symbol_prices)))
+    start_time = 10 * time_frame_seconds * 1000
+    end_time = 89 * time_frame_seconds * 1000
+
+    sequential_candles = []
+    async for candles in exchanges.get_historical_ohlcv(exchange_manager, "BTC/USDT",
+                                                        commons_enums.TimeFrames.ONE_MINUTE, start_time, end_time):
+        sequential_candles += candles
+    assert sequential_candles == exchange_candles[10:90]
+
+    for page_size in (3, 7, 10, 200):
+        concurrent_candles = []
+        async for candles in exchanges.get_concurrent_historical_ohlcv(
+            exchange_manager, "BTC/USDT", commons_enums.TimeFrames.ONE_MINUTE, start_time, end_time,
+            page_size=page_size, max_concurrent_requests=4, min_request_interval=0
+        ):
+            concurrent_candles += candles
+        assert concurrent_candles == sequential_candles
+
+
+async def test_get_concurrent_historical_ohlcv_with_failed_page():
+    time_frame_seconds = 60
+    start_time = 10 * time_frame_seconds * 1000
+    end_time = 89 * time_frame_seconds * 1000
+    never_set_event = asyncio.Event()
+
+    async def get_symbol_prices(symbol, time_frame, limit=None, since=None):
+        if since == start_time:
+            raise errors.FailedRequest("first page error")
+        # other pages are still pending when the first one fails
+        await never_set_event.wait()
+
+    exchange_manager = mock.Mock(exchange=mock.Mock(get_symbol_prices=mock.AsyncMock(side_effect=get_symbol_prices)))
+    with pytest.raises(errors.FailedRequest):
+        async for _ in exchanges.get_concurrent_historical_ohlcv(
+            exchange_manager, "BTC/USDT", commons_enums.TimeFrames.ONE_MINUTE, start_time, end_time,
+            page_size=10, max_concurrent_requests=4, min_request_interval=0
+        ):
+            pass
+    assert exchange_manager.exchange.get_symbol_prices.call_count == 4
+    # pending pages are cancelled and awaited
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
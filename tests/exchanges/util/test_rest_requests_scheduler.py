@@ -0,0 +1,132 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import numpy as np
+import mock
+import pytest
+
+import octobot_trading.enums as enums
+from octobot_trading.exchanges.util.rest_requests_scheduler import RestRequestsScheduler
+
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_get_budget():
+    exchange_manager = mock.Mock()
+    exchange_manager.exchange.get_rate_limit = mock.Mock(return_value=0.05)
+    assert RestRequestsScheduler(exchange_manager, budget_ratio=0.5).get_budget() == 10
+    exchange_manager.exchange.get_rate_limit = mock.Mock(side_effect=NotImplementedError)
+    assert RestRequestsScheduler(exchange_manager).get_budget() == float("inf")
+    exchange_manager.exchange = None
+    assert RestRequestsScheduler(exchange_manager).get_budget() == float("inf")
+
+
+async def test_allocate_within_budget():
+    scheduler = _create_scheduler(10)
+    scheduler.register_feed("ticker", 10, enums.RestRequestsPriorities.MEDIUM, requests_count=20)
+    scheduler.register_feed("book", 5, enums.RestRequestsPriorities.LOW, requests_count=20)
+    assert scheduler.get_refresh_time("ticker") == 10
+    assert scheduler.get_refresh_time("book") == 5
+    metrics = scheduler.get_metrics()
+    assert metrics["allocated"] == 6
+    assert metrics["degraded_feeds"] == []
+
+
+async def test_allocate_degrades_low_priority_feeds_first():
+    scheduler = _create_scheduler(4)
+    scheduler.register_feed("balance", 1, enums.RestRequestsPriorities.HIGH)
+    scheduler.register_feed("ticker", 10, enums.RestRequestsPriorities.MEDIUM, requests_count=20)
+    scheduler.register_feed("book", 5, enums.RestRequestsPriorities.LOW, requests_count=10)
+    scheduler.register_feed("trades", 5, enums.RestRequestsPriorities.LOW, requests_count=10)
+    assert scheduler.get_refresh_time("balance") == 1
+    assert scheduler.get_refresh_time("ticker") == 10
+    # 1 request per second left for 4 requests per second of low priority feeds
+    assert scheduler.get_refresh_time("book") == 20
+    assert scheduler.get_refresh_time("trades") == 20
+    assert scheduler.get_metrics()["degraded_feeds"] == ["book", "trades"]
+
+    # no budget left: max degradation
+    scheduler.register_feed("ticker", 5, enums.RestRequestsPriorities.MEDIUM, requests_count=20)
+    assert scheduler.get_refresh_time("ticker") == pytest.approx(6.66666, rel=1e-4)
+    assert scheduler.get_refresh_time("book") == 50
+
+    scheduler.unregister_feed("ticker")
+    assert scheduler.get_refresh_time("book") == pytest.approx(6.66666, rel=1e-4)
+
+    # disabled scheduler: desired refresh times are used
+    scheduler.enabled = False
+    assert scheduler.get_refresh_time("book") == 5
+
+
+async def test_reserve_requests():
+    scheduler = _create_scheduler(2)
+    with mock.patch("asyncio.sleep", mock.AsyncMock()) as sleep_mock:
+        await scheduler.reserve_requests()
+        sleep_mock.assert_not_called()
+        await scheduler.reserve_requests(2)
+        assert sleep_mock.call_args[0][0] == pytest.approx(0.5, abs=0.1)
+        await scheduler.reserve_requests()
+        assert sleep_mock.call_args[0][0] == pytest.approx(1.5, abs=0.1)
+
+        scheduler.enabled = False
+        sleep_mock.reset_mock()
+        await scheduler.reserve_requests()
+        sleep_mock.assert_not_called()
+    metrics = scheduler.get_metrics()
+    assert metrics["used"] == 5 / RestRequestsScheduler.METRICS_WINDOW
+    assert metrics["available"] == 2 - metrics["used"]
+
+
+async def test_reserve_requests_forgets_old_requests():
+    scheduler = _create_scheduler(float("inf"))
+    with mock.patch("time.time", mock.Mock(return_value=1000)):
+        for _ in range(10):
+            await scheduler.reserve_requests()
+    with mock.patch("time.time", mock.Mock(return_value=1000 + RestRequestsScheduler.METRICS_WINDOW / 2)):
+        await scheduler.reserve_requests(2)
+    # requests are forgotten without calling get_metrics
+    with mock.patch("time.time", mock.Mock(return_value=1000 + RestRequestsScheduler.METRICS_WINDOW + 1)):
+        await scheduler.reserve_requests()
+        assert len(scheduler._requests) == 2
+        assert scheduler.get_metrics()["used"] == 3 / RestRequestsScheduler.METRICS_WINDOW
+
+
+async def test_gather_requests():
+    scheduler = _create_scheduler(float("inf"))
+    running = []
+    max_running = []
+
+    async def _fetch(key):
+        running.append(key)
+        max_running.append(len(running))
+        await asyncio.sleep(0)
+        running.remove(key)
+        return key * 2
+
+    assert await scheduler.gather_requests(_fetch, [1, 2, 3, 4, 5], concurrency=2) == [2, 4, 6, 8, 10]
+    assert max(max_running) == 2
+    assert scheduler.get_metrics()["used"] == 5 / RestRequestsScheduler.METRICS_WINDOW
+    max_running.clear()
+    assert await scheduler.gather_requests(_fetch, [1, 2, 3], concurrency=1) == [2, 4, 6]
+    assert max(max_running) == 1
+
+
+def _create_scheduler(budget):
+    scheduler = RestRequestsScheduler(mock.Mock(), enabled=True, max_degradation=10)
+    scheduler.set_budget(budget)
+    return scheduler
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import mock
 import pytest
 
 from octobot_trading.enums import TraderOrderType
@@ -60,3 +61,51 @@ async def test_buy_limit_order_trigger(buy_limit_order):
 
     await wait_asyncio_next_cycle()
     assert buy_limit_order.is_filled()
+
+
+async def test_buy_limit_order_trigger_with_callbacks_is_filled_once(buy_limit_order):
+    with mock.patch.object(trading_constants, "ENABLE_PRICE_EVENTS_CALLBACKS", True):
+        order_price, price_events_manager = await _initialize_buy_limit_order(buy_limit_order)
+        with mock.patch.object(buy_limit_order, "on_fill",
+                               mock.AsyncMock(wraps=buy_limit_order.on_fill)) as on_fill_mock:
+            await buy_limit_order.update_order_status()
+            assert buy_limit_order.wait_for_hit_event_task is None
+            price_events_manager.handle_recent_trades(
+                [decimal_random_recent_trade(price=order_price, timestamp=buy_limit_order.timestamp)])
+            # triggered event: on_fill is already queued in the price events manager
+            await buy_limit_order.update_order_status()
+            on_fill_mock.assert_not_called()
+            await wait_asyncio_next_cycle()
+            on_fill_mock.assert_called_once()
+        assert buy_limit_order.is_filled()
+
+
+async def test_buy_limit_order_trigger_with_callbacks_cancelled_before_fill(buy_limit_order):
+    with mock.patch.object(trading_constants, "ENABLE_PRICE_EVENTS_CALLBACKS", True):
+        order_price, price_events_manager = await _initialize_buy_limit_order(buy_limit_order)
+        with mock.patch.object(buy_limit_order, "on_fill",
+                               mock.AsyncMock(wraps=buy_limit_order.on_fill)) as on_fill_mock:
+            await buy_limit_order.update_order_status()
+            price_events_manager.handle_recent_trades(
+                [decimal_random_recent_trade(price=order_price, timestamp=buy_limit_order.timestamp)])
+            # cancelled before the queued on_fill callback is called
+            assert await buy_limit_order.trader.cancel_order(buy_limit_order)
+            await wait_asyncio_next_cycle()
+            on_fill_mock.assert_not_called()
+        assert buy_limit_order.is_cancelled()
+        assert not buy_limit_order.is_filled()
+
+
+async def _initialize_buy_limit_order(order):
+    order_price = decimal_random_price()
+    order.update(
+        price=order_price,
+        quantity=decimal_random_quantity(max_value=DEFAULT_MARKET_QUANTITY / order_price),
+        symbol=DEFAULT_ORDER_SYMBOL,
+        order_type=TraderOrderType.BUY_LIMIT,
+    )
+    await order.initialize()
+    await order.exchange_manager.exchange_personal_data.orders_manager.upsert_order_instance(order)
+    price_events_manager = order.exchange_manager.exchange_symbols_data.get_exchange_symbol_data(
+        DEFAULT_ORDER_SYMBOL).price_events_manager
+    return order_price, price_events_manager
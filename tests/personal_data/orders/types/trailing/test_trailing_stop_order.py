@@ -16,6 +16,7 @@
 import decimal
 from typing import Tuple
 
+import mock
 import pytest
 
 from octobot_commons.asyncio_tools import wait_asyncio_next_cycle
@@ -146,6 +147,43 @@ async def test_trailing_stop_with_new_price_inversed(trailing_stop_order):
     assert trailing_stop_order.is_filled()
 
 
+async def test_trailing_stop_trigger_with_callbacks_is_filled_once(trailing_stop_order):
+    with mock.patch.object(trading_constants, "ENABLE_PRICE_EVENTS_CALLBACKS", True):
+        trailing_stop_order, order_price, price_events_manager = await initialize_trailing_stop(trailing_stop_order)
+        with mock.patch.object(trailing_stop_order, "on_fill",
+                               mock.AsyncMock(wraps=trailing_stop_order.on_fill)) as on_fill_mock:
+            await trailing_stop_order.set_trailing_percent(decimal.Decimal(10))
+            assert trailing_stop_order.wait_for_stop_price_hit_event_task is None
+            set_mark_price(trailing_stop_order, order_price)
+            price_events_manager.handle_recent_trades(
+                [decimal_random_recent_trade(price=get_price_percent(order_price, decimal.Decimal(20)),
+                                             timestamp=trailing_stop_order.timestamp)])
+            # triggered event: on_fill is already queued in the price events manager
+            await trailing_stop_order.update_order_status()
+            on_fill_mock.assert_not_called()
+            await wait_asyncio_next_cycle()
+            on_fill_mock.assert_called_once()
+        assert trailing_stop_order.is_filled()
+
+
+async def test_trailing_stop_trigger_with_callbacks_cancelled_before_fill(trailing_stop_order):
+    with mock.patch.object(trading_constants, "ENABLE_PRICE_EVENTS_CALLBACKS", True):
+        trailing_stop_order, order_price, price_events_manager = await initialize_trailing_stop(trailing_stop_order)
+        with mock.patch.object(trailing_stop_order, "on_fill",
+                               mock.AsyncMock(wraps=trailing_stop_order.on_fill)) as on_fill_mock:
+            await trailing_stop_order.set_trailing_percent(decimal.Decimal(10))
+            set_mark_price(trailing_stop_order, order_price)
+            price_events_manager.handle_recent_trades(
+                [decimal_random_recent_trade(price=get_price_percent(order_price, decimal.Decimal(20)),
+                                             timestamp=trailing_stop_order.timestamp)])
+            # cancelled before the queued on_fill callback is called
+            assert await trailing_stop_order.trader.cancel_order(trailing_stop_order)
+            await wait_asyncio_next_cycle()
+            on_fill_mock.assert_not_called()
+        assert trailing_stop_order.is_cancelled()
+        assert not trailing_stop_order.is_filled()
+
+
 async def initialize_trailing_stop(order, side=TradeOrderSide.SELL) -> Tuple[
     TrailingStopOrder, decimal.Decimal, PriceEventsManager]:
     order_price = decimal_random_price()
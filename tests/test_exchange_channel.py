@@ -0,0 +1,105 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import asyncio
+import mock
+import pytest
+
+from octobot_trading.exchange_channel import ExchangeChannelProducer
+
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+SYMBOL = "BTC/USDT"
+
+
+async def test_conflated_push_without_conflation_interval():
+    producer = _create_producer(0)
+    await producer.conflated_push(SYMBOL, 1)
+    await producer.conflated_push(SYMBOL, 2)
+    assert producer.push.call_args_list == [mock.call(SYMBOL, 1), mock.call(SYMBOL, 2)]
+    assert producer._conflation_tasks == {}
+
+
+async def test_conflated_push_only_pushes_latest_data():
+    producer = _create_producer(0.05, idle_consumers=False)
+    await producer.conflated_push(SYMBOL, 1)
+    # first push is sent right away
+    assert producer.push.call_args_list == [mock.call(SYMBOL, 1)]
+    await producer.conflated_push(SYMBOL, 2)
+    await producer.conflated_push(SYMBOL, 3)
+    await producer.conflated_push("ETH/USDT", 4)
+    assert producer.push.call_args_list == [mock.call(SYMBOL, 1), mock.call("ETH/USDT", 4)]
+    assert list(producer._conflation_tasks) == [SYMBOL]
+    await producer._conflation_tasks[SYMBOL]
+    assert producer.push.call_args_list == [mock.call(SYMBOL, 1), mock.call("ETH/USDT", 4), mock.call(SYMBOL, 3)]
+    assert producer._conflation_tasks == {}
+    assert producer._conflated_pushes == {}
+
+
+async def test_conflated_push_with_idle_consumers():
+    producer = _create_producer(10, idle_consumers=True)
+    await producer.conflated_push(SYMBOL, 1)
+    await producer.conflated_push(SYMBOL, 2)
+    assert producer.push.call_args_list == [mock.call(SYMBOL, 1), mock.call(SYMBOL, 2)]
+    assert producer._conflation_tasks == {}
+
+
+async def test_conflated_push_during_delayed_push():
+    producer = _create_producer(0.05, idle_consumers=False)
+    pushed = []
+
+    async def _push(symbol, value):
+        pushed.append(value)
+        if value == 2:
+            # data received while pushing: a new delayed push is scheduled
+            await producer.conflated_push(SYMBOL, 3)
+        await asyncio.sleep(0)
+
+    producer.push = mock.AsyncMock(side_effect=_push)
+    await producer.conflated_push(SYMBOL, 1)
+    await producer.conflated_push(SYMBOL, 2)
+    first_task = producer._conflation_tasks[SYMBOL]
+    await first_task
+    # the newer task is kept
+    new_task = producer._conflation_tasks[SYMBOL]
+    assert new_task is not first_task
+    await new_task
+    assert pushed == [1, 2, 3]
+    assert producer._conflation_tasks == {}
+
+
+async def test_stop_cancels_delayed_pushes():
+    producer = _create_producer(10, idle_consumers=False)
+    await producer.conflated_push(SYMBOL, 1)
+    await producer.conflated_push(SYMBOL, 2)
+    task = producer._conflation_tasks[SYMBOL]
+    await producer.stop()
+    await asyncio.sleep(0)
+    assert task.cancelled()
+    assert producer._conflation_tasks == {}
+    assert producer.push.call_args_list == [mock.call(SYMBOL, 1)]
+
+
+def _create_producer(conflation_interval, idle_consumers=True):
+    channel = mock.Mock(conflation_interval=conflation_interval)
+    consumer = mock.Mock()
+    consumer.queue.empty = mock.Mock(return_value=idle_consumers)
+    channel.get_consumers = mock.Mock(return_value=[consumer])
+    producer = ExchangeChannelProducer(channel)
+    producer.push = mock.AsyncMock()
+    return producer